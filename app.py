@@ -1,10 +1,21 @@
 import streamlit as st
-from modules import weather, news, collaboration
+from modules.http_client import http_client
+from modules.cache import response_cache
+from modules.refresher import refresher
+from modules.api_config import api_client
+from modules.assets import LottieAssetLoader
+from modules.styles import inject_styles
+from modules.templates import HtmlTemplate, markdown_list
+from modules.metrics import section
+from modules.pipeline import Deadline, fetch_concurrently
+from modules.ops_server import ops_server
+from modules.telemetry import start_listeners
+from modules.startup_profile import lazy_import
 import os
 from streamlit_option_menu import option_menu
-from streamlit_extras.app_logo import add_logo
 from streamlit_lottie import st_lottie
-import requests
+import functools
+import importlib.util
 import json
 import logging
 from datetime import datetime
@@ -21,13 +32,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info("Application starting up")
 
-# Try to import logo component with fallback
-try:
-    from streamlit_extras.app_logo import add_logo
-    HAS_LOGO_COMPONENT = True
-except ImportError:
-    logger.warning("Could not import logo component, will use text header instead")
-    HAS_LOGO_COMPONENT = False
+# Check for the logo component without importing streamlit_extras at startup
+HAS_LOGO_COMPONENT = importlib.util.find_spec("streamlit_extras") is not None
+if not HAS_LOGO_COMPONENT:
+    logger.warning("Could not find logo component, will use text header instead")
+
+# Navigation pages: (module, function), where module None means this file.
+# Feature modules are imported the first time their page is selected.
+PAGES = {
+    "Dashboard": (None, "display_dashboard"),
+    "Weather": ("modules.weather", "show_weather_module"),
+    "News": ("modules.news", "show_news"),
+    "Collaboration": ("modules.collaboration", "show_collaboration_module"),
+}
+PAGE_ICONS = ["house-fill", "cloud-sun-fill", "newspaper", "people-fill"]
+
+ALERT_ITEM = HtmlTemplate("""
+    <div class="notification">
+        <div style='display: flex; align-items: center; margin-bottom: 0.5rem;'>
+            <strong style='color: #ffffff;'>{title}</strong>
+            <div style='margin-left: auto; font-size: 0.9rem; color: #94a3b8;'>Just now</div>
+        </div>
+        <p style='margin: 0; color: #94a3b8;'>{message}</p>
+    </div>
+""")
+
+NOTIFICATION_ITEM = HtmlTemplate("""
+    <div class="notification">
+        <strong>{title}</strong><br>
+        {message}
+    </div>
+""")
 
 # Initialize configuration from Streamlit secrets
 def get_secret(key, default=None):
@@ -61,6 +96,108 @@ except Exception as e:
     logger.error(f"Error loading configuration: {e}")
     # Don't stop the app, continue with reduced functionality
 
+# Dashboard snapshots older than this many soft TTLs are marked as stale
+STALE_AFTER_FACTOR = 4
+# Seconds between re-renders of each live dashboard card
+WEATHER_CARD_INTERVAL = response_cache.ttl_for("weather")
+MARKET_CARD_INTERVAL = response_cache.default_ttl
+NEWS_CARD_INTERVAL = response_cache.ttl_for("news")
+# Seconds the dashboard waits for all of its data sources together
+DASHBOARD_PREFETCH_DEADLINE = 4
+# Background snapshots the dashboard cards render from
+DASHBOARD_SOURCES = ("weather", "market", "news")
+# Seconds between checks of a dashboard source that is still loading
+SOURCE_POLL_INTERVAL = 2
+
+def register_dashboard_sources() -> None:
+    """
+    Register the data sources the dashboard renders from background snapshots.
+
+    Called from the dashboard page only; the weather and news modules are
+    imported by the loaders when a snapshot is first fetched.
+    """
+    weather_ttl = response_cache.ttl_for("weather")
+    news_ttl = response_cache.ttl_for("news")
+    refresher.register("weather", lambda: lazy_import("modules.weather").get_weather_data(14.5995, 120.9842),
+                       weather_ttl, weather_ttl * STALE_AFTER_FACTOR)
+    refresher.register("news", lambda: lazy_import("modules.news").get_news_data(),
+                       news_ttl, news_ttl * STALE_AFTER_FACTOR)
+    if api_client:
+        refresher.register("market", api_client.get_market_prices,
+                           response_cache.default_ttl, response_cache.default_ttl * STALE_AFTER_FACTOR)
+    refresher.start()
+
+def prefetch_dashboard_sources(deadline: float = DASHBOARD_PREFETCH_DEADLINE) -> dict:
+    """
+    Load every dashboard data source in parallel under one deadline.
+
+    A cold dashboard waits for its slowest source rather than the sum of
+    all of them. Sources that miss the deadline keep loading in the
+    background and their cards show a placeholder until they arrive.
+
+    Returns:
+        dict: Snapshots of the sources that were ready in time, by name
+    """
+    names = [name for name in DASHBOARD_SOURCES if refresher.registered(name)]
+    results, _ = fetch_concurrently(
+        {name: functools.partial(refresher.get, name) for name in names},
+        Deadline(deadline),
+    )
+    return {name: snapshot for name, snapshot in results.items() if snapshot is not None}
+
+def show_source_placeholder(name: str, label: str) -> None:
+    """Stand in for a card whose data source has no snapshot yet."""
+    if refresher.loading(name):
+        wait_for_source(name, label)
+    else:
+        st.warning(f"{label} temporarily unavailable")
+
+@st.fragment(run_every=SOURCE_POLL_INTERVAL)
+def wait_for_source(name: str, label: str) -> None:
+    """
+    Poll a loading source every SOURCE_POLL_INTERVAL seconds.
+
+    Re-runs the app once its first snapshot arrives, so the card does not
+    wait for its own, much longer, refresh interval.
+    """
+    if refresher.snapshot(name) is not None:
+        st.rerun()
+    elif refresher.loading(name):
+        st.info(f"Loading {label.lower()}...")
+    else:
+        st.warning(f"{label} temporarily unavailable")
+
+def page_index(name: str | None) -> int:
+    """Return the menu position of a page name (case-insensitive), defaulting to the dashboard."""
+    names = [page.lower() for page in PAGES]
+    return names.index(name.lower()) if name and name.lower() in names else 0
+
+def dashboard_card(run_every: float | None = None):
+    """
+    Turn a dashboard card into a fragment that re-runs on its own.
+
+    The card re-renders every run_every seconds and on its own widget
+    interactions, and an error in it leaves the other cards in place.
+    """
+    def decorator(render):
+        @st.fragment(run_every=run_every)
+        @functools.wraps(render)
+        def card() -> None:
+            try:
+                with section(f"dashboard.{render.__name__}"):
+                    render()
+            except Exception as e:
+                logger.error(f"Error in dashboard card {render.__name__}: {str(e)}")
+                st.warning("This section is temporarily unavailable")
+        return card
+    return decorator
+
+def show_snapshot_status(snapshot) -> None:
+    """Mark dashboard data that is past its hard TTL as stale."""
+    if snapshot is not None and snapshot.stale:
+        fetched = datetime.fromtimestamp(snapshot.fetched_at).strftime("%H:%M")
+        st.caption(f"⚠️ Stale data from {fetched}, refreshing in the background")
+
 def load_lottie_url(url: str) -> dict | None:
     """
     Load a Lottie animation from a URL.
@@ -72,16 +209,26 @@ def load_lottie_url(url: str) -> dict | None:
         dict | None: The Lottie animation as a dictionary if successful, None otherwise
     """
     try:
-        r = requests.get(url)
+        r = http_client.get(url)
         r.raise_for_status()
         return r.json()
     except Exception as e:
         logger.error(f"Error loading Lottie animation from {url}: {str(e)}")
         return None
 
-# Load animations
-lottie_chicken = load_lottie_url("https://lottie.host/58194a35-654d-4e9d-9d2d-4296f8c55938/KpvLxvEGVr.json")
-lottie_weather = load_lottie_url("https://lottie.host/c022a6f8-2c28-46cc-9769-27c9c3c8f27c/6woQQX7Bhs.json")
+LOTTIE_CHICKEN_URL = "https://lottie.host/58194a35-654d-4e9d-9d2d-4296f8c55938/KpvLxvEGVr.json"
+LOTTIE_WEATHER_URL = "https://lottie.host/c022a6f8-2c28-46cc-9769-27c9c3c8f27c/6woQQX7Bhs.json"
+
+# No spinner: this runs before st.set_page_config
+@st.cache_resource(show_spinner=False)
+def get_lottie_assets() -> LottieAssetLoader:
+    """Create the process-wide Lottie loader, shared across reruns and sessions."""
+    return LottieAssetLoader(fetch=load_lottie_url)
+
+# Load animations from memory, disk or the bundled defaults; never from the network
+lottie_assets = get_lottie_assets()
+lottie_chicken = lottie_assets.get(LOTTIE_CHICKEN_URL, default="chicken")
+lottie_weather = lottie_assets.get(LOTTIE_WEATHER_URL, default="weather")
 
 # Page configuration
 st.set_page_config(
@@ -91,327 +238,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Add Font Awesome
-st.markdown("""
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-""", unsafe_allow_html=True)
-
-# Modern mobile-first CSS with enhanced design
-st.markdown("""
-<style>
-    /* Global Styling */
-    .stApp {
-        background: linear-gradient(125deg, #0f1c2e 0%, #1a2332 50%, #0f1c2e 100%);
-        font-family: 'Plus Jakarta Sans', 'Inter', system-ui, -apple-system, sans-serif;
-        color: #e2e8f0;
-        background-attachment: fixed;
-    }
-
-    /* Glassmorphism Effects */
-    .glass-card {
-        background: rgba(23, 32, 47, 0.6);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        border: 1px solid rgba(255, 255, 255, 0.08);
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-    }
-
-    /* Typography Improvements */
-    h1 {
-        color: #ffffff;
-        font-size: 3.5rem;
-        font-weight: 800;
-        margin-bottom: 1.5rem;
-        letter-spacing: -0.5px;
-        text-shadow: 0 2px 10px rgba(0,0,0,0.3);
-        background: linear-gradient(120deg, #60a5fa, #c084fc);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-
-    h2 {
-        color: #ffffff;
-        font-size: 2.2rem;
-        font-weight: 700;
-        margin-bottom: 1rem;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        background: linear-gradient(120deg, #60a5fa, #c084fc);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-
-    h3 {
-        color: #ffffff;
-        font-size: 1.5rem;
-        font-weight: 600;
-        text-shadow: 0 1px 2px rgba(0,0,0,0.2);
-        margin-top: 1.5rem;
-        margin-bottom: 1rem;
-    }
-
-    p {
-        color: #e2e8f0;
-        line-height: 1.8;
-        font-size: 1.1rem;
-        font-weight: 400;
-    }
-
-    /* Modern Card Design */
-    .modern-card {
-        background: rgba(23, 32, 47, 0.6);
-        padding: 1.8rem;
-        border-radius: 24px;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.2);
-        margin-bottom: 1.5rem;
-        border: 1px solid rgba(255, 255, 255, 0.08);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-
-    .modern-card:hover {
-        transform: translateY(-4px) scale(1.01);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.3);
-        border-color: rgba(96, 165, 250, 0.2);
-        background: rgba(23, 32, 47, 0.8);
-    }
-
-    /* Dashboard Cards */
-    .dashboard-card {
-        background: rgba(23, 32, 47, 0.6);
-        padding: 1.8rem;
-        border-radius: 24px;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1.5rem;
-        border: 1px solid rgba(255, 255, 255, 0.08);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-
-    .dashboard-card:hover {
-        transform: translateY(-2px) scale(1.01);
-        box-shadow: 0 8px 30px rgba(0, 0, 0, 0.2);
-        border-color: rgba(96, 165, 250, 0.2);
-    }
-
-    /* Input Fields */
-    .stTextInput input, .stSelectbox select, .stTextArea textarea {
-        border-radius: 16px;
-        border: 2px solid rgba(96, 165, 250, 0.2);
-        padding: 0.75rem 1rem;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        font-size: 1rem;
-        color: #e2e8f0;
-        background: rgba(23, 32, 47, 0.6);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-    }
-
-    .stTextInput input:focus, .stSelectbox select:focus, .stTextArea textarea:focus {
-        border-color: #60a5fa;
-        box-shadow: 0 0 0 4px rgba(96, 165, 250, 0.2);
-        background: rgba(23, 32, 47, 0.8);
-    }
-
-    /* Buttons */
-    .stButton button {
-        border-radius: 16px;
-        padding: 0.75rem 1.75rem;
-        font-weight: 600;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        background: linear-gradient(135deg, #60a5fa, #c084fc);
-        color: #ffffff;
-        border: none;
-        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.2);
-        box-shadow: 0 4px 12px rgba(96, 165, 250, 0.3);
-    }
-
-    .stButton button:hover {
-        transform: translateY(-2px) scale(1.02);
-        box-shadow: 0 6px 20px rgba(96, 165, 250, 0.4);
-        opacity: 0.95;
-    }
-
-    /* Navigation Menu */
-    .nav-link {
-        border-radius: 16px !important;
-        margin: 4px 0 !important;
-        padding: 1.2rem !important;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        color: #e2e8f0 !important;
-        background: rgba(23, 32, 47, 0.6) !important;
-        border: 1px solid rgba(255, 255, 255, 0.08) !important;
-        backdrop-filter: blur(12px) !important;
-        -webkit-backdrop-filter: blur(12px) !important;
-    }
-
-    .nav-link:hover {
-        background: rgba(96, 165, 250, 0.1) !important;
-        color: #ffffff !important;
-        border-color: rgba(96, 165, 250, 0.2) !important;
-        transform: translateY(-1px) !important;
-    }
-
-    .nav-link.active {
-        background: linear-gradient(135deg, #60a5fa, #c084fc) !important;
-        color: #ffffff !important;
-        font-weight: 600 !important;
-        box-shadow: 0 4px 12px rgba(96, 165, 250, 0.3) !important;
-        transform: translateY(-1px) !important;
-    }
-
-    /* Metrics and KPIs */
-    .metric-card {
-        background: rgba(23, 32, 47, 0.6);
-        padding: 1.8rem;
-        border-radius: 24px;
-        border: 1px solid rgba(255, 255, 255, 0.08);
-        margin-bottom: 1.5rem;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-    }
-
-    .metric-card:hover {
-        transform: translateY(-2px) scale(1.01);
-        border-color: rgba(96, 165, 250, 0.2);
-        background: rgba(23, 32, 47, 0.8);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.2);
-    }
-
-    .metric-value {
-        font-size: 2.8rem;
-        font-weight: 700;
-        color: #ffffff;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        background: linear-gradient(135deg, #60a5fa, #c084fc);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.75rem;
-        line-height: 1.2;
-    }
-
-    .metric-label {
-        font-size: 1.1rem;
-        color: #94a3b8;
-        font-weight: 500;
-        letter-spacing: 0.5px;
-    }
-
-    /* Notifications */
-    .notification {
-        background: rgba(23, 32, 47, 0.6);
-        padding: 1.2rem 1.5rem;
-        border-radius: 16px;
-        border-left: 4px solid #60a5fa;
-        margin-bottom: 1rem;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-
-    .notification:hover {
-        transform: translateX(4px) scale(1.01);
-        background: rgba(23, 32, 47, 0.8);
-        box-shadow: 0 6px 16px rgba(0, 0, 0, 0.2);
-    }
-
-    /* News Cards */
-    .news-card {
-        background: rgba(23, 32, 47, 0.6);
-        padding: 1.8rem;
-        border-radius: 24px;
-        border: 1px solid rgba(255, 255, 255, 0.08);
-        margin-bottom: 1.5rem;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-    }
-
-    .news-card:hover {
-        transform: translateY(-2px) scale(1.01);
-        border-color: rgba(96, 165, 250, 0.2);
-        background: rgba(23, 32, 47, 0.8);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.2);
-    }
-
-    .news-title {
-        font-size: 1.3rem;
-        font-weight: 600;
-        color: #ffffff;
-        margin-bottom: 0.75rem;
-        line-height: 1.4;
-    }
-
-    .news-meta {
-        font-size: 0.95rem;
-        color: #94a3b8;
-        margin-bottom: 1rem;
-        letter-spacing: 0.5px;
-    }
-
-    /* Weather Widget */
-    .weather-widget {
-        background: rgba(23, 32, 47, 0.6);
-        padding: 1.8rem;
-        border-radius: 24px;
-        border: 1px solid rgba(255, 255, 255, 0.08);
-        margin-bottom: 1.5rem;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-    }
-
-    .weather-widget:hover {
-        transform: translateY(-2px) scale(1.01);
-        border-color: rgba(96, 165, 250, 0.2);
-        background: rgba(23, 32, 47, 0.8);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.2);
-    }
-
-    /* Custom Scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-        height: 10px;
-    }
-
-    ::-webkit-scrollbar-track {
-        background: rgba(23, 32, 47, 0.6);
-        border-radius: 8px;
-    }
-
-    ::-webkit-scrollbar-thumb {
-        background: rgba(96, 165, 250, 0.3);
-        border-radius: 8px;
-        border: 2px solid rgba(23, 32, 47, 0.6);
-    }
-
-    ::-webkit-scrollbar-thumb:hover {
-        background: rgba(96, 165, 250, 0.4);
-    }
-
-    /* Hide default elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    .block-container {padding-bottom: 1rem;}
-
-    /* Animations */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    .stApp > * {
-        animation: fadeIn 0.6s ease-out;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Add Font Awesome and the prebuilt app stylesheet
+inject_styles()
 
+@section("main")
 def main() -> None:
     """
     Main application function that sets up the Streamlit interface and handles navigation.
@@ -437,6 +267,11 @@ def main() -> None:
                 if lottie_weather:
                     st_lottie(lottie_weather, height=100, key="weather_anim")
 
+        # Serve /metrics, /livez and /readyz on the side port (no-op when serve.py started it)
+        ops_server.start()
+        # Receive barn telemetry over UDP or a tailed file when configured (no-op after the first run)
+        start_listeners()
+        
         # Initialize session state
         if 'notifications' not in st.session_state:
             st.session_state.notifications = []
@@ -444,13 +279,13 @@ def main() -> None:
         # Display any pending notifications
         display_notifications()
         
-        # Navigation menu with improved styling
+        # Navigation menu with improved styling; ?page=<name> links straight to a page
         selected = option_menu(
             menu_title=None,
-            options=["Dashboard", "Weather", "News", "Collaboration"],
-            icons=["house-fill", "cloud-sun-fill", "newspaper", "people-fill"],
+            options=list(PAGES),
+            icons=PAGE_ICONS,
             menu_icon="cast",
-            default_index=0,
+            default_index=page_index(st.query_params.get("page")),
             orientation="horizontal",
             styles={
                 "container": {"padding": "0.5rem", "background-color": "rgba(30, 41, 59, 0.3)", "border-radius": "12px", "margin": "1rem 0"},
@@ -470,14 +305,10 @@ def main() -> None:
         )
         
         # Display selected section
-        if selected == "Dashboard":
-            display_dashboard()
-        elif selected == "Weather":
-            weather.show_weather()
-        elif selected == "News":
-            news.show_news()
-        elif selected == "Collaboration":
-            collaboration.show_collaboration_module()
+        module_name, function_name = PAGES[selected]
+        with section(f"page.{selected.lower()}"):
+            page = globals()[function_name] if module_name is None else getattr(lazy_import(module_name), function_name)
+            page()
             
     except Exception as e:
         logger.error(f"Error in main application: {e}")
@@ -486,8 +317,17 @@ def main() -> None:
 def display_dashboard() -> None:
     """
     Display the main dashboard with integrated market analysis and insights.
+
+    Each card is a fragment, so interacting with one card or refreshing it
+    on its interval re-runs only that card.
     """
     try:
+        # Keep dashboard data sources warm in the background, then start every
+        # one at once so the cards below render from warm snapshots
+        register_dashboard_sources()
+        with section("dashboard.prefetch"):
+            prefetch_dashboard_sources()
+
         # Dashboard Header with Animation and Stats
         st.markdown("""
             <div class='glass-card' style='padding: 2rem; margin-bottom: 2rem;'>
@@ -574,160 +414,188 @@ def display_dashboard() -> None:
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            # Weather Forecast with Enhanced Design
-            st.markdown("""
-                <div class='dashboard-card'>
-                    <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
-                        <div style='display: flex; align-items: center;'>
-                            <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
-                                <i class="fas fa-cloud-sun" style='color: #60a5fa; font-size: 1.5rem;'></i>
-                            </div>
-                            <h3 style='margin: 0;'>Weather Forecast</h3>
-                        </div>
-                        <div style='margin-left: auto;'>
-                            <button style='background: none; border: none; cursor: pointer;'>
-                                <i class="fas fa-sync-alt" style='color: #60a5fa; font-size: 1.2rem;'></i>
-                            </button>
-                        </div>
-                    </div>
-                    <div class='weather-widget'>
-            """, unsafe_allow_html=True)
-            weather.display_weather_widget()
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            # Market Analysis with Enhanced Visuals
-            st.markdown("""
-                <div class='dashboard-card'>
-                    <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
-                        <div style='display: flex; align-items: center;'>
-                            <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
-                                <i class="fas fa-chart-line" style='color: #60a5fa; font-size: 1.5rem;'></i>
-                            </div>
-                            <h3 style='margin: 0;'>Market Insights</h3>
-                        </div>
-                        <div style='margin-left: auto;'>
-                            <button style='background: none; border: none; cursor: pointer;'>
-                                <i class="fas fa-ellipsis-v" style='color: #60a5fa; font-size: 1.2rem;'></i>
-                            </button>
-                        </div>
-                    </div>
-                    <div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1.5rem;'>
-            """, unsafe_allow_html=True)
-            
-            st.metric(
-                "Market Sentiment",
-                "Positive",
-                "2.1%",
-                help="Overall market sentiment based on recent trends"
-            )
-            st.metric(
-                "Supply Status",
-                "Stable",
-                "0.5%",
-                help="Current supply chain status"
-            )
-            st.metric(
-                "Demand Trend",
-                "Growing",
-                "3.2%",
-                help="Current demand trend in the market"
-            )
-            
-            st.markdown("</div></div>", unsafe_allow_html=True)
-            
-            # Recent Updates with Enhanced Design
-            st.markdown("""
-                <div class='dashboard-card'>
-                    <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
-                        <div style='display: flex; align-items: center;'>
-                            <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
-                                <i class="fas fa-users" style='color: #60a5fa; font-size: 1.5rem;'></i>
-                            </div>
-                            <h3 style='margin: 0;'>Recent Updates</h3>
-                        </div>
-                        <div style='margin-left: auto;'>
-                            <button style='background: none; border: none; cursor: pointer;'>
-                                <i class="fas fa-plus" style='color: #60a5fa; font-size: 1.2rem;'></i>
-                            </button>
-                        </div>
-                    </div>
-            """, unsafe_allow_html=True)
-            collaboration.init_session_state()
-            recent_posts = st.session_state.posts[:3]
-            for post in recent_posts:
-                collaboration.show_post(post)
-            st.markdown("</div>", unsafe_allow_html=True)
+            show_weather_card()
+            show_market_card()
+            show_recent_posts_card()
         
         with col2:
-            # Active Alerts with Enhanced Styling
-            st.markdown("""
-                <div class='glass-card' style='padding: 1.8rem; margin-bottom: 1.5rem;'>
-                    <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
-                        <div style='display: flex; align-items: center;'>
-                            <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
-                                <i class="fas fa-bell" style='color: #60a5fa; font-size: 1.5rem;'></i>
-                            </div>
-                            <h3 style='margin: 0;'>Active Alerts</h3>
-                        </div>
-                        <div style='margin-left: auto;'>
-                            <button style='background: none; border: none; cursor: pointer;'>
-                                <i class="fas fa-cog" style='color: #60a5fa; font-size: 1.2rem;'></i>
-                            </button>
-                        </div>
-                    </div>
-            """, unsafe_allow_html=True)
-            if st.session_state.notifications:
-                for notification in st.session_state.notifications:
-                    st.markdown(f"""
-                        <div class="notification">
-                            <div style='display: flex; align-items: center; margin-bottom: 0.5rem;'>
-                                <strong style='color: #ffffff;'>{notification['title']}</strong>
-                                <div style='margin-left: auto; font-size: 0.9rem; color: #94a3b8;'>Just now</div>
-                            </div>
-                            <p style='margin: 0; color: #94a3b8;'>{notification['message']}</p>
-                        </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.info("No new notifications")
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            # Latest News with Enhanced Design
-            st.markdown("""
-                <div class='glass-card' style='padding: 1.8rem;'>
-                    <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
-                        <div style='display: flex; align-items: center;'>
-                            <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
-                                <i class="fas fa-newspaper" style='color: #60a5fa; font-size: 1.5rem;'></i>
-                            </div>
-                            <h3 style='margin: 0;'>Latest News</h3>
-                        </div>
-                        <div style='margin-left: auto;'>
-                            <button style='background: none; border: none; cursor: pointer;'>
-                                <i class="fas fa-external-link-alt" style='color: #60a5fa; font-size: 1.2rem;'></i>
-                            </button>
-                        </div>
-                    </div>
-            """, unsafe_allow_html=True)
-            news.show_news_summary()
-            st.markdown("</div>", unsafe_allow_html=True)
+            show_alerts_card()
+            show_news_card()
             
     except Exception as e:
         logger.error(f"Error in dashboard display: {str(e)}")
         st.error("Unable to load dashboard components. Please refresh the page.")
 
+@dashboard_card(run_every=WEATHER_CARD_INTERVAL)
+def show_weather_card() -> None:
+    """Render the weather card from the latest background snapshot."""
+    weather = lazy_import("modules.weather")
+    # Weather Forecast with Enhanced Design
+    st.markdown("""
+        <div class='dashboard-card'>
+            <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
+                <div style='display: flex; align-items: center;'>
+                    <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
+                        <i class="fas fa-cloud-sun" style='color: #60a5fa; font-size: 1.5rem;'></i>
+                    </div>
+                    <h3 style='margin: 0;'>Weather Forecast</h3>
+                </div>
+                <div style='margin-left: auto;'>
+                    <button style='background: none; border: none; cursor: pointer;'>
+                        <i class="fas fa-sync-alt" style='color: #60a5fa; font-size: 1.2rem;'></i>
+                    </button>
+                </div>
+            </div>
+            <div class='weather-widget'>
+    """, unsafe_allow_html=True)
+    weather_snapshot = refresher.get("weather")
+    if weather_snapshot:
+        weather.display_weather_widget(weather_data=weather_snapshot.value)
+        show_snapshot_status(weather_snapshot)
+    else:
+        show_source_placeholder("weather", "Weather information")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+@dashboard_card(run_every=MARKET_CARD_INTERVAL)
+def show_market_card() -> None:
+    """Render market insights from the latest background snapshot."""
+    # Market Analysis with Enhanced Visuals
+    st.markdown("""
+        <div class='dashboard-card'>
+            <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
+                <div style='display: flex; align-items: center;'>
+                    <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
+                        <i class="fas fa-chart-line" style='color: #60a5fa; font-size: 1.5rem;'></i>
+                    </div>
+                    <h3 style='margin: 0;'>Market Insights</h3>
+                </div>
+                <div style='margin-left: auto;'>
+                    <button style='background: none; border: none; cursor: pointer;'>
+                        <i class="fas fa-ellipsis-v" style='color: #60a5fa; font-size: 1.2rem;'></i>
+                    </button>
+                </div>
+            </div>
+            <div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1.5rem;'>
+    """, unsafe_allow_html=True)
+    
+    st.metric(
+        "Market Sentiment",
+        "Positive",
+        "2.1%",
+        help="Overall market sentiment based on recent trends"
+    )
+    st.metric(
+        "Supply Status",
+        "Stable",
+        "0.5%",
+        help="Current supply chain status"
+    )
+    st.metric(
+        "Demand Trend",
+        "Growing",
+        "3.2%",
+        help="Current demand trend in the market"
+    )
+    
+    market_snapshot = refresher.get("market")
+    if market_snapshot:
+        prices = market_snapshot.value.get('data', {})
+        st.caption(" • ".join(f"{name.replace('_', ' ').title()}: {price}" for name, price in prices.items()))
+        show_snapshot_status(market_snapshot)
+    elif refresher.loading("market"):
+        st.caption("Loading market prices...")
+    
+    st.markdown("</div></div>", unsafe_allow_html=True)
+
+@dashboard_card()
+def show_recent_posts_card() -> None:
+    """Render the latest community posts; likes re-run only this card."""
+    collaboration = lazy_import("modules.collaboration")
+    # Recent Updates with Enhanced Design
+    st.markdown("""
+        <div class='dashboard-card'>
+            <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
+                <div style='display: flex; align-items: center;'>
+                    <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
+                        <i class="fas fa-users" style='color: #60a5fa; font-size: 1.5rem;'></i>
+                    </div>
+                    <h3 style='margin: 0;'>Recent Updates</h3>
+                </div>
+                <div style='margin-left: auto;'>
+                    <button style='background: none; border: none; cursor: pointer;'>
+                        <i class="fas fa-plus" style='color: #60a5fa; font-size: 1.2rem;'></i>
+                    </button>
+                </div>
+            </div>
+    """, unsafe_allow_html=True)
+    collaboration.init_session_state()
+    recent_posts, _ = st.session_state.post_index.page(limit=3)
+    for post in recent_posts:
+        collaboration.show_post(post, rerun_scope="fragment")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+@dashboard_card()
+def show_alerts_card() -> None:
+    """Render the active alerts for this session."""
+    # Active Alerts with Enhanced Styling
+    st.markdown("""
+        <div class='glass-card' style='padding: 1.8rem; margin-bottom: 1.5rem;'>
+            <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
+                <div style='display: flex; align-items: center;'>
+                    <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
+                        <i class="fas fa-bell" style='color: #60a5fa; font-size: 1.5rem;'></i>
+                    </div>
+                    <h3 style='margin: 0;'>Active Alerts</h3>
+                </div>
+                <div style='margin-left: auto;'>
+                    <button style='background: none; border: none; cursor: pointer;'>
+                        <i class="fas fa-cog" style='color: #60a5fa; font-size: 1.2rem;'></i>
+                    </button>
+                </div>
+            </div>
+    """, unsafe_allow_html=True)
+    if st.session_state.notifications:
+        markdown_list(ALERT_ITEM, st.session_state.notifications)
+    else:
+        st.info("No new notifications")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+@dashboard_card(run_every=NEWS_CARD_INTERVAL)
+def show_news_card() -> None:
+    """Render the latest headlines from the background snapshot."""
+    news = lazy_import("modules.news")
+    # Latest News with Enhanced Design
+    st.markdown("""
+        <div class='glass-card' style='padding: 1.8rem;'>
+            <div style='display: flex; align-items: center; margin-bottom: 1.5rem;'>
+                <div style='display: flex; align-items: center;'>
+                    <div style='background: rgba(96, 165, 250, 0.1); padding: 0.75rem; border-radius: 12px; margin-right: 1rem;'>
+                        <i class="fas fa-newspaper" style='color: #60a5fa; font-size: 1.5rem;'></i>
+                    </div>
+                    <h3 style='margin: 0;'>Latest News</h3>
+                </div>
+                <div style='margin-left: auto;'>
+                    <button style='background: none; border: none; cursor: pointer;'>
+                        <i class="fas fa-external-link-alt" style='color: #60a5fa; font-size: 1.2rem;'></i>
+                    </button>
+                </div>
+            </div>
+    """, unsafe_allow_html=True)
+    news_snapshot = refresher.get("news")
+    if news_snapshot:
+        news.show_news_summary(news_snapshot.value)
+        show_snapshot_status(news_snapshot)
+    else:
+        show_source_placeholder("news", "News")
+    st.markdown("</div>", unsafe_allow_html=True)
+
 def display_notifications() -> None:
     """Display recent notifications and alerts in the dashboard."""
     try:
         with st.container():
             st.markdown("### Recent Notifications")
             if st.session_state.notifications:
-                for notification in st.session_state.notifications:
-                    st.markdown(f"""
-                        <div class="notification">
-                            <strong>{notification['title']}</strong><br>
-                            {notification['message']}
-                        </div>
-                    """, unsafe_allow_html=True)
+                markdown_list(NOTIFICATION_ITEM, st.session_state.notifications)
             else:
                 st.info("No new notifications")
     except Exception as e:
@@ -736,11 +604,8 @@ def display_notifications() -> None:
 
 if __name__ == "__main__":
     try:
-        # Add a health check endpoint
-        if "healthz" in st.query_params:
-            st.success("Health check passed")
-        else:
-            main()
+        # Health probes are served by the ops server (/livez, /readyz), not by this script
+        main()
     except Exception as e:
         logger.critical(f"Application failed to start: {str(e)}")
         st.error("Critical error: Unable to start the application. Please contact support.")
\ No newline at end of file
@@ -1,8 +1,66 @@
 import requests
 import pandas as pd
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import streamlit as st
+import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from urllib.parse import quote
+from modules.http_client import http_client
+from .store import statistics_store
+
+logger = logging.getLogger(__name__)
+
+# Records requested per page when paginating a resource
+PAGE_SIZE = 1000
+# Pages fetched concurrently while paginating
+MAX_PARALLEL_PAGES = 4
+# Where sync checkpoints are kept by default
+DEFAULT_CHECKPOINT_PATH = Path(__file__).resolve().parent.parent / ".cache" / "datagov_checkpoints.json"
+
+class PageCheckpoint:
+    """
+    Persists the next offset to fetch for each resource so an interrupted
+    sync resumes where it left off.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CHECKPOINT_PATH):
+        self.path = Path(path)
+
+    def _read(self) -> Dict[str, int]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint file {self.path}: {e}")
+            return {}
+
+    def load(self, resource_id: str) -> int:
+        """Return the committed offset for a resource, or 0."""
+        return int(self._read().get(resource_id, 0))
+
+    def commit(self, resource_id: str, offset: int) -> None:
+        """Atomically record the next offset to fetch for a resource."""
+        checkpoints = self._read()
+        checkpoints[resource_id] = offset
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoints, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self, resource_id: str) -> None:
+        """Forget the committed offset for a resource."""
+        checkpoints = self._read()
+        if checkpoints.pop(resource_id, None) is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(checkpoints, f)
 
 class DataGovClient:
     BASE_URL = "https://api.data.gov.in/resource"
@@ -34,7 +92,7 @@ class DataGovClient:
 
             # Make request with logging
             st.info("Fetching data from data.gov.in...")
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
 
             # Log response for debugging
             if response.status_code != 200:
@@ -56,6 +114,79 @@ class DataGovClient:
             st.warning(f"Unexpected error: {str(e)}. Using sample data instead.")
             return self.get_mock_data()
 
+    def fetch_page(self, offset: int, limit: int = PAGE_SIZE) -> List[Dict[str, Any]]:
+        """
+        Fetch one page of records, raising on network or HTTP errors
+        """
+        if not self.api_key or not self.resource_id:
+            raise ValueError("API credentials not configured properly")
+
+        url = f"{self.BASE_URL}/{quote(self.resource_id)}"
+        params = {
+            "api-key": self.api_key,
+            "format": "json",
+            "offset": str(offset),
+            "limit": str(limit)
+        }
+        response = http_client.get(url, params=params)
+        response.raise_for_status()
+        return response.json().get('records', [])
+
+    def iter_pages(self, page_size: int = PAGE_SIZE, max_workers: int = MAX_PARALLEL_PAGES,
+                   start_offset: int = 0, checkpoint: Optional[PageCheckpoint] = None) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Yield (offset, records) pages in order, fetching up to max_workers pages ahead.
+
+        At most max_workers pages are held in memory. With a checkpoint, the
+        sync starts from the committed offset and commits the next offset once
+        the caller has consumed a page, so an interrupted sync resumes there.
+        """
+        next_offset = checkpoint.load(self.resource_id) if checkpoint else start_offset
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="datagov") as executor:
+            pending = deque()
+
+            def submit():
+                nonlocal next_offset
+                pending.append((next_offset, executor.submit(self.fetch_page, next_offset, page_size)))
+                next_offset += page_size
+
+            for _ in range(max_workers):
+                submit()
+
+            try:
+                while pending:
+                    offset, future = pending.popleft()
+                    records = future.result()
+                    last_page = len(records) < page_size
+                    if not last_page:
+                        submit()
+
+                    yield offset, records
+
+                    if checkpoint:
+                        checkpoint.commit(self.resource_id, offset + len(records))
+                    if last_page:
+                        break
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def iter_records(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every record of the resource in order, see iter_pages for options
+        """
+        for _, records in self.iter_pages(**kwargs):
+            yield from records
+
+    def iter_frames(self, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Yield one DataFrame chunk per page, see iter_pages for options
+        """
+        for _, records in self.iter_pages(**kwargs):
+            if records:
+                yield pd.DataFrame.from_records(records)
+
     def process_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process the raw API response into a structured format
@@ -69,51 +200,61 @@ class DataGovClient:
             # Add debug information
             st.info(f"Processing {len(records)} records from API")
 
-            # Create production time series
-            production_data = []
-            prices_data = []
-            total_production = 0
-            total_price = 0
-            price_count = 0
-
-            for record in records:
-                # Process each record
-                # Note: Update these field names based on actual API response structure
-                if 'production_value' in record:
-                    production_data.append({
-                        'date': record.get('date', ''),
-                        'value': float(record['production_value'])
-                    })
-                    total_production += float(record['production_value'])
-
-                if 'price' in record:
-                    price = float(record['price'])
-                    prices_data.append({
-                        'region': record.get('region', 'Unknown'),
-                        'price': price
-                    })
-                    total_price += price
-                    price_count += 1
-
-            # Calculate metrics
-            avg_price = total_price / price_count if price_count > 0 else 0
-
-            processed_data = {
-                'production': pd.DataFrame(production_data),
-                'prices': pd.DataFrame(prices_data),
-                'metrics': {
-                    'total_production': round(total_production, 2),
-                    'avg_price': round(avg_price, 2),
-                    'growth_rate': 5.2  # This will be calculated from historical data
-                }
-            }
-
-            return processed_data
+            return self.process_frame(pd.DataFrame.from_records(records))
 
         except Exception as e:
             st.warning(f"Error processing data: {str(e)}. Using sample data instead.")
             return self.get_mock_data()
 
+    def get_statistics(self, start: Optional[str] = None, end: Optional[str] = None,
+                       region: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Aggregate statistics in the local store instead of calling the live API
+        """
+        return statistics_store.aggregate(start, end, region) or self.get_mock_data()
+
+    def process_frame(self, frame: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Build production and price series and metrics from a records frame in
+        one columnar pass. Values that are not numeric become NaN.
+        """
+        # Note: Update these field names based on actual API response structure
+        production_raw = self._column(frame, 'production_value', None)
+        has_production = production_raw.notna()
+        production = pd.DataFrame({
+            'date': self._column(frame, 'date', '')[has_production].fillna('').astype(str),
+            'value': pd.to_numeric(production_raw[has_production], errors='coerce').astype('float64'),
+        }).reset_index(drop=True)
+
+        price_raw = self._column(frame, 'price', None)
+        has_price = price_raw.notna()
+        prices = pd.DataFrame({
+            'region': self._column(frame, 'region', 'Unknown')[has_price].fillna('Unknown').astype(str).astype('category'),
+            'price': pd.to_numeric(price_raw[has_price], errors='coerce').astype('float64'),
+        }).reset_index(drop=True)
+
+        # Calculate metrics, skipping values that failed numeric coercion
+        avg_price = prices['price'].mean()
+
+        processed_data = {
+            'production': production,
+            'prices': prices,
+            'metrics': {
+                'total_production': round(float(production['value'].sum()), 2),
+                'avg_price': round(float(avg_price), 2) if pd.notna(avg_price) else 0,
+                'growth_rate': 5.2  # This will be calculated from historical data
+            }
+        }
+
+        return processed_data
+
+    @staticmethod
+    def _column(frame: pd.DataFrame, name: str, default: Any) -> pd.Series:
+        """Return a column of the frame, or a default-filled series if it is absent."""
+        if name in frame:
+            return frame[name]
+        return pd.Series(default, index=frame.index, dtype=object)
+
     def get_mock_data(self) -> Dict[str, Any]:
         """
         Fallback mock data when API is not configured or fails
@@ -0,0 +1,275 @@
+import hashlib
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Where the local copy of the data.gov.in statistics is kept by default
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / ".cache" / "statistics.db"
+# Bumped when the table layout changes; older local copies are rebuilt by the next sync
+SCHEMA_VERSION = 2
+# Columns that carry a source record's own id, in order of preference
+RECORD_ID_COLUMNS = ('id', 'record_id', '_id')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    resource_id TEXT NOT NULL DEFAULT '',
+    record_key TEXT NOT NULL,
+    date TEXT NOT NULL,
+    region TEXT NOT NULL DEFAULT 'Unknown',
+    production_value REAL,
+    price REAL,
+    UNIQUE (resource_id, record_key)
+);
+CREATE INDEX IF NOT EXISTS idx_records_region_date ON records (region, date);
+CREATE INDEX IF NOT EXISTS idx_records_date ON records (date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource_id TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL
+);
+"""
+
+def record_keys(frame: pd.DataFrame) -> pd.Series:
+    """
+    Return the identity of each record.
+
+    The source record id when the resource provides one, otherwise a digest
+    of every identifying column, so only true re-deliveries share a key.
+    """
+    for column in RECORD_ID_COLUMNS:
+        if column in frame:
+            ids = frame[column]
+            if ids.notna().all():
+                return "id:" + ids.astype(str)
+    columns = frame[['date', 'region', 'production_value', 'price']]
+    columns = columns.astype(object).where(columns.notna(), None)
+    return pd.Series(
+        ["row:" + hashlib.sha1(repr(row).encode()).hexdigest() for row in columns.itertuples(index=False, name=None)],
+        index=frame.index
+    )
+
+class StatisticsStore:
+    """
+    Local SQLite copy of the data.gov.in poultry statistics, indexed by date and region.
+
+    The database file is created by the first write, not when the store is built.
+    """
+
+    def __init__(self, path: Path = DEFAULT_DB_PATH):
+        """Prepare the store at path without touching the filesystem."""
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connect(self, create: bool = False) -> Optional[sqlite3.Connection]:
+        """Return the open connection; None if the file does not exist and create is False."""
+        with self._lock:
+            if self._conn is None:
+                if not create and not self.path.exists():
+                    return None
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                with conn:
+                    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                        # The local copy is a cache of the source; rebuild it on layout changes
+                        conn.executescript("DROP TABLE IF EXISTS records; DROP TABLE IF EXISTS sync_state;")
+                        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                    conn.executescript(SCHEMA)
+                self._conn = conn
+            return self._conn
+
+    def close(self) -> None:
+        """Close the connection if one is open."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def watermark(self, resource_id: Optional[str] = None) -> Optional[str]:
+        """Return the newest stored record date, overall or for one resource, or None if there is none."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            if resource_id is None:
+                return conn.execute("SELECT MAX(date) FROM records").fetchone()[0]
+            return conn.execute("SELECT MAX(date) FROM records WHERE resource_id = ?", (resource_id,)).fetchone()[0]
+
+    def synced_watermark(self, resource_id: str) -> Optional[str]:
+        """Return the watermark recorded by the last completed sync of a resource."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            row = conn.execute("SELECT watermark FROM sync_state WHERE resource_id = ?", (resource_id,)).fetchone()
+            return row[0] if row else None
+
+    def count(self) -> int:
+        """Return the number of stored records."""
+        with self._lock:
+            conn = self._connect()
+            return conn.execute("SELECT COUNT(*) FROM records").fetchone()[0] if conn else 0
+
+    def append(self, frame: pd.DataFrame, after: Optional[str] = None, resource_id: str = '') -> int:
+        """
+        Insert the records of a frame dated on or after the given watermark.
+
+        Dates are normalized to YYYY-MM-DD and numbers coerced to float;
+        rows without a valid date are skipped. Records already stored under
+        the same identity are re-deliveries and ignored. Returns the number
+        inserted.
+        """
+        if frame.empty or 'date' not in frame:
+            return 0
+
+        rows = pd.DataFrame({
+            'date': pd.to_datetime(frame['date'], errors='coerce').dt.strftime('%Y-%m-%d'),
+            'region': frame['region'].fillna('Unknown').astype(str) if 'region' in frame else 'Unknown',
+            'production_value': pd.to_numeric(frame['production_value'], errors='coerce') if 'production_value' in frame else None,
+            'price': pd.to_numeric(frame['price'], errors='coerce') if 'price' in frame else None,
+        })
+        for column in RECORD_ID_COLUMNS:
+            if column in frame:
+                rows[column] = frame[column]
+        rows = rows.dropna(subset=['date'])
+        if after:
+            # Inclusive: records for the watermark date may arrive in a later sync
+            rows = rows[rows['date'] >= after]
+        if rows.empty:
+            return 0
+
+        keyed = pd.DataFrame({
+            'resource_id': resource_id,
+            'record_key': record_keys(rows),
+            'date': rows['date'],
+            'region': rows['region'],
+            'production_value': rows['production_value'],
+            'price': rows['price'],
+        })
+        values = keyed.astype(object).where(keyed.notna(), None).itertuples(index=False, name=None)
+        with self._lock:
+            conn = self._connect(create=True)
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO records (resource_id, record_key, date, region, production_value, price) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    values
+                )
+                return conn.total_changes - before
+
+    @staticmethod
+    def _where(start: Optional[str], end: Optional[str], region: Optional[str]):
+        clauses, params = [], []
+        if start:
+            clauses.append("date >= ?")
+            params.append(start)
+        if end:
+            clauses.append("date <= ?")
+            params.append(end)
+        if region:
+            clauses.append("region = ?")
+            params.append(region)
+        return clauses, params
+
+    def query(self, start: Optional[str] = None, end: Optional[str] = None, region: Optional[str] = None) -> pd.DataFrame:
+        """Return stored records, optionally filtered by date range and region, ordered by date."""
+        clauses, params = self._where(start, end, region)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return pd.DataFrame(columns=['date', 'region', 'production_value', 'price'])
+            return pd.read_sql_query(
+                f"SELECT date, region, production_value, price FROM records {where} ORDER BY date",
+                conn, params=params
+            )
+
+    def aggregate(self, start: Optional[str] = None, end: Optional[str] = None,
+                  region: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return production per day, average price per region and overall metrics.
+
+        Sums and averages are computed by SQLite, so only aggregated rows
+        reach pandas. Returns None when no records match.
+        """
+        clauses, params = self._where(start, end, region)
+        where = " AND ".join(clauses) or "1"
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            records, total_production, avg_price = conn.execute(
+                f"SELECT COUNT(*), SUM(production_value), AVG(price) FROM records WHERE {where}", params
+            ).fetchone()
+            if not records:
+                return None
+            production = pd.read_sql_query(
+                f"SELECT date, SUM(production_value) AS value FROM records "
+                f"WHERE {where} AND production_value IS NOT NULL GROUP BY date ORDER BY date",
+                conn, params=params
+            )
+            prices = pd.read_sql_query(
+                f"SELECT region, AVG(price) AS price FROM records "
+                f"WHERE {where} AND price IS NOT NULL GROUP BY region ORDER BY region",
+                conn, params=params
+            )
+        prices['region'] = prices['region'].astype('category')
+        return {
+            'production': production,
+            'prices': prices,
+            'metrics': {
+                'total_production': round(float(total_production or 0), 2),
+                'avg_price': round(float(avg_price), 2) if avg_price is not None else 0,
+                'growth_rate': 5.2  # This will be calculated from historical data
+            }
+        }
+
+    def sync(self, client, checkpoint=None, **paginate_kwargs) -> int:
+        """
+        Append records of a DataGovClient's resource dated on or after its last synced watermark.
+
+        Pass a PageCheckpoint as checkpoint to resume from the last committed
+        offset instead of walking the resource from the start. A resource
+        that has never completed a sync into this store is walked from the
+        start, even if an older checkpoint exists.
+        """
+        resource_id = client.resource_id
+        watermark = self.synced_watermark(resource_id)
+        if checkpoint is not None:
+            if watermark is None:
+                checkpoint.clear(resource_id)
+            paginate_kwargs['checkpoint'] = checkpoint
+        inserted = 0
+        for frame in client.iter_frames(**paginate_kwargs):
+            inserted += self.append(frame, after=watermark, resource_id=resource_id)
+
+        with self._lock:
+            conn = self._connect(create=True)
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (resource_id, watermark, synced_at) VALUES (?, ?, ?)",
+                    (resource_id, self.watermark(resource_id), time.time())
+                )
+        logger.info(f"Synced {inserted} new statistics records (previous watermark: {watermark})")
+        return inserted
+
+def sync_statistics() -> int:
+    """Run one incremental sync of the configured data.gov.in resource into the local store."""
+    from .api_client import DataGovClient, PageCheckpoint
+    return statistics_store.sync(DataGovClient(), checkpoint=PageCheckpoint())
+
+# Create the process-wide store shared by all sessions; the file is opened on first use
+statistics_store = StatisticsStore()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler(sys.stdout)])
+    sync_statistics()
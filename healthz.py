@@ -1,9 +1,29 @@
-import streamlit as st
+import os
+import sys
+import urllib.error
+import urllib.request
 
-def main():
-    """Simple health check endpoint."""
-    st.success("OK")
-    st.stop()
+# Same default as modules.ops_server; not imported so probes start in milliseconds
+DEFAULT_PORT = 9102
+# Seconds a probe may take before it counts as failed
+PROBE_TIMEOUT = 2
+
+def main(endpoint: str = "readyz") -> int:
+    """
+    Probe the ops server and return a process exit code.
+
+    Usage: python healthz.py [livez|readyz]
+    """
+    port = int(os.environ.get("METRICS_PORT", DEFAULT_PORT))
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/{endpoint}", timeout=PROBE_TIMEOUT) as response:
+            print(response.read().decode())
+            return 0
+    except urllib.error.HTTPError as e:
+        print(e.read().decode())
+    except OSError as e:
+        print(f"{endpoint} probe failed: {e}")
+    return 1
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main(*sys.argv[1:2]))
@@ -1,5 +1,9 @@
-from . import weather
-from . import news
-from . import collaboration
+import importlib
 
 __all__ = ['weather', 'news', 'collaboration']
+
+def __getattr__(name):
+    """Import feature modules on first access instead of with the package."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
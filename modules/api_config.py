@@ -4,9 +4,22 @@ from functools import wraps
 import time
 import logging
 import json
+import random
+from .http_client import http_client
+from .cache import response_cache
+from .circuit_breaker import CircuitBreaker, get_breaker
+from .pipeline import Deadline
 
 logger = logging.getLogger(__name__)
 
+# Attempts per upstream call while the circuit is closed
+MAX_RETRIES = 3
+# Seconds one call may spend on retries, including backoff waits
+RETRY_DEADLINE = 2.0
+# Base and cap in seconds of the exponential backoff with full jitter
+BACKOFF_BASE = 0.1
+BACKOFF_CAP = 1.0
+
 class APIConfig:
     def __init__(self):
         """Initialize API configuration with fallback values."""
@@ -63,23 +76,51 @@ class APIConfig:
             
         return headers
 
-def api_error_handler(func):
-    """Decorator to handle API errors and provide fallback responses."""
+def api_error_handler(func=None, *, upstream=None, max_retries=MAX_RETRIES, deadline=RETRY_DEADLINE):
+    """
+    Decorator to handle API errors and provide fallback responses.
+    
+    Failed calls are retried with jittered exponential backoff while the retry
+    deadline allows. Each upstream has a circuit breaker: while it is open,
+    calls return dummy data immediately until a half-open probe succeeds.
+    The upstream name defaults to the function name without its "get_" prefix.
+    """
+    if func is None:
+        return lambda f: api_error_handler(f, upstream=upstream, max_retries=max_retries, deadline=deadline)
+    
+    breaker_name = upstream or func.__name__.replace('get_', '', 1)
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                return func(*args, **kwargs)
-            except requests.exceptions.RequestException as e:
-                retry_count += 1
-                logger.warning(f"API request failed (attempt {retry_count}/{max_retries}): {e}")
-                if retry_count == max_retries:
-                    # Return dummy data on failure
-                    return get_dummy_response(func.__name__)
-                time.sleep(1)
+        breaker = get_breaker(breaker_name)
+        if not breaker.allow_request():
+            logger.info(f"Circuit for {breaker_name} is open, serving fallback data")
+            return get_dummy_response(func.__name__)
+            
+        # A half-open probe gets a single attempt
+        probe = breaker.state == CircuitBreaker.HALF_OPEN
+        attempts = 1 if probe else max_retries
+        retry_deadline = Deadline(deadline)
+        try:
+            for attempt in range(1, attempts + 1):
+                try:
+                    result = func(*args, **kwargs)
+                    breaker.record_success()
+                    return result
+                except requests.exceptions.RequestException as e:
+                    logger.warning(f"API request failed (attempt {attempt}/{attempts}): {e}")
+                    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+                    if attempt == attempts or delay >= retry_deadline.remaining():
+                        break
+                    time.sleep(delay)
+                    
+            breaker.record_failure()
+        finally:
+            # Any other exception leaves no outcome; free the probe so the circuit is not stuck
+            if probe:
+                breaker.release_probe()
+        # Return dummy data on failure
+        return get_dummy_response(func.__name__)
     return wrapper
 
 def get_dummy_response(endpoint_name):
@@ -122,6 +163,12 @@ class APIClient:
             logger.error(f"Error initializing API client: {e}")
             self.config = None
     
+    def _fetch_json(self, url, params):
+        """Fetch a JSON payload through the shared HTTP client."""
+        response = http_client.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
+
     @api_error_handler
     def get_weather(self, city, country='IN'):
         """Get weather data with fallback to dummy data."""
@@ -131,9 +178,8 @@ class APIClient:
                 'appid': self.config.weather_api_key,
                 'units': 'metric'
             }
-            response = requests.get(f'{self.config.weather_base_url}/forecast', params=params)
-            response.raise_for_status()
-            return response.json()
+            url = f'{self.config.weather_base_url}/forecast'
+            return response_cache.get_or_fetch('weather', url, params, lambda: self._fetch_json(url, params))
         return get_dummy_response('get_weather')
     
     @api_error_handler
@@ -146,9 +192,8 @@ class APIClient:
                 'language': 'en',
                 'from': time.strftime('%Y-%m-%d', time.localtime(time.time() - days * 86400))
             }
-            response = requests.get(f'{self.config.news_base_url}/everything', params=params)
-            response.raise_for_status()
-            return response.json()
+            url = f'{self.config.news_base_url}/everything'
+            return response_cache.get_or_fetch('news', url, params, lambda: self._fetch_json(url, params))
         return get_dummy_response('get_news')
     
     def get_market_prices(self, commodity='poultry'):
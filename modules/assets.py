@@ -0,0 +1,144 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Default animations shipped with the app, used until a fetched copy exists
+BUNDLED_DIR = PROJECT_ROOT / "static" / "lottie"
+# Fetched animations, stored with a content hash
+CACHE_DIR = PROJECT_ROOT / ".cache" / "lottie"
+# Seconds before a fetched animation is refreshed in the background
+REFRESH_INTERVAL = 24 * 60 * 60
+# Seconds before a failed fetch is retried, doubled after each further failure
+RETRY_INTERVAL = 60
+# Longest wait between retries of a failing fetch
+MAX_RETRY_INTERVAL = 60 * 60
+
+def content_hash(animation: dict) -> str:
+    """Return the SHA-256 of an animation's canonical JSON."""
+    return hashlib.sha256(json.dumps(animation, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+class LottieAssetLoader:
+    """
+    Serves Lottie animations without waiting on the network.
+
+    Lookups go memory, then disk cache, then the bundled default. Remote
+    copies are fetched and refreshed only in the background, and failed
+    fetches are retried with exponential backoff.
+    """
+
+    def __init__(self, fetch: Callable[[str], Optional[dict]], bundled_dir: Path = BUNDLED_DIR,
+                 cache_dir: Path = CACHE_DIR, refresh_interval: float = REFRESH_INTERVAL):
+        self.fetch = fetch
+        self.bundled_dir = Path(bundled_dir)
+        self.cache_dir = Path(cache_dir)
+        self.refresh_interval = refresh_interval
+        self._memory: Dict[str, dict] = {}
+        self._refreshed_at: Dict[str, float] = {}
+        # url -> (consecutive failed fetches, time of the next attempt)
+        self._retries: Dict[str, Tuple[int, float]] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lottie")
+
+    def get(self, url: str, default: Optional[str] = None) -> Optional[dict]:
+        """Return the animation for url immediately, scheduling a refresh if it is due."""
+        animation = self._memory.get(url)
+        if animation is None:
+            animation = self._read_cache(url)
+            if animation is not None:
+                self._memory[url] = animation
+        if self._refresh_due(url):
+            self._schedule_refresh(url)
+        if animation is None and default:
+            animation = self._read_bundled(default)
+        return animation
+
+    def _refresh_due(self, url: str) -> bool:
+        retry = self._retries.get(url)
+        if retry is not None:
+            return time.time() >= retry[1]
+        return time.time() - self._refreshed_at.get(url, 0) > self.refresh_interval
+
+    def _schedule_refresh(self, url: str) -> None:
+        with self._lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+        self._executor.submit(self._refresh, url)
+
+    def _refresh(self, url: str) -> None:
+        try:
+            try:
+                animation = self.fetch(url)
+            except Exception as e:
+                logger.warning(f"Fetching animation {url} failed: {e}")
+                animation = None
+            if animation is None:
+                failures = self._retries.get(url, (0, 0.0))[0] + 1
+                delay = min(MAX_RETRY_INTERVAL, RETRY_INTERVAL * 2 ** (failures - 1))
+                self._retries[url] = (failures, time.time() + delay)
+                return
+            self._retries.pop(url, None)
+            self._memory[url] = animation
+            self._refreshed_at[url] = time.time()
+            self._write_cache(url, animation)
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+    def _cache_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _read_cache(self, url: str) -> Optional[dict]:
+        path = self._cache_path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+            if content_hash(stored["animation"]) != stored["sha256"]:
+                logger.warning(f"Discarding corrupt cached animation for {url}")
+                return None
+            self._refreshed_at.setdefault(url, path.stat().st_mtime)
+            return stored["animation"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cached animation {path}: {e}")
+            return None
+
+    def _write_cache(self, url: str, animation: dict) -> None:
+        path = self._cache_path(url)
+        digest = content_hash(animation)
+        try:
+            if path.exists():
+                with open(path) as f:
+                    if json.load(f).get("sha256") == digest:
+                        # Unchanged content, only mark it as fresh
+                        os.utime(path)
+                        return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"url": url, "sha256": digest, "animation": animation}, f)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not cache animation for {url}: {e}")
+
+    def _read_bundled(self, name: str) -> Optional[dict]:
+        animation = self._memory.get(f"bundled:{name}")
+        if animation is None:
+            try:
+                with open(self.bundled_dir / f"{name}.json") as f:
+                    animation = json.load(f)
+                self._memory[f"bundled:{name}"] = animation
+            except (OSError, ValueError) as e:
+                logger.error(f"Bundled animation {name} is unavailable: {e}")
+        return animation
@@ -0,0 +1,200 @@
+import streamlit as st
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .metrics import metrics
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# TTL in seconds used when [settings].cache_timeout is missing
+DEFAULT_CACHE_TIMEOUT = 300
+# Sources that change more slowly than the default TTL
+DEFAULT_SOURCE_TTLS = {
+    'news': 1800,
+}
+# Upper bound on the serialized size of all cached payloads
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+# Query parameters that carry credentials and must not end up in keys or on disk
+SECRET_PARAMS = {'appid', 'apikey', 'api-key', 'api_key'}
+
+class ResponseCache:
+    """Thread-safe LRU cache of upstream JSON payloads with a TTL per source."""
+
+    def __init__(self, default_ttl: float = DEFAULT_CACHE_TIMEOUT,
+                 source_ttls: Optional[Dict[str, float]] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 persist_dir: Optional[str] = None):
+        """Initialize an empty cache, optionally persisted to persist_dir."""
+        self.default_ttl = default_ttl
+        self.source_ttls = dict(DEFAULT_SOURCE_TTLS)
+        self.source_ttls.update(source_ttls or {})
+        self.max_bytes = max_bytes
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        if self.persist_dir:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+        # key -> (expires_at, size, value), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self._inflight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_secrets(cls) -> "ResponseCache":
+        """Build the cache from [settings] and [cache_ttl] in Streamlit secrets."""
+        try:
+            settings = st.secrets.get("settings", {})
+            return cls(
+                default_ttl=settings.get("cache_timeout", DEFAULT_CACHE_TIMEOUT),
+                source_ttls=dict(st.secrets.get("cache_ttl", {})),
+                max_bytes=int(settings.get("cache_max_mb", DEFAULT_MAX_BYTES // (1024 * 1024))) * 1024 * 1024,
+                persist_dir=settings.get("cache_dir") or os.environ.get("POULTRY_CACHE_DIR"),
+            )
+        except Exception as e:
+            logger.warning(f"Using default cache configuration: {e}")
+            return cls()
+
+    def ttl_for(self, source: str) -> float:
+        """Return the TTL in seconds for a data source."""
+        return self.source_ttls.get(source, self.default_ttl)
+
+    @staticmethod
+    def make_key(source: str, url: str, params: Optional[dict] = None) -> str:
+        """Build a normalized key from the source, endpoint and parameters."""
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        query.update({k: str(v) for k, v in (params or {}).items()})
+        query = {k: v for k, v in query.items() if k.lower() not in SECRET_PARAMS}
+        endpoint = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+        return f"{source}:{endpoint}?{json.dumps(sorted(query.items()))}"
+
+    def _path_for(self, key: str) -> Optional[Path]:
+        if not self.persist_dir:
+            return None
+        return self.persist_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached payload, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._load(key)
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                metrics.record_cache(hit=True)
+                return entry[2]
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            metrics.record_cache(hit=False)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a payload for ttl seconds, evicting least recently used entries."""
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Not caching unserializable payload for {key}")
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, len(serialized), value)
+            self._size += len(serialized)
+            self._evict()
+            path = self._path_for(key)
+            if path and key in self._entries:
+                self._write(path, key, expires_at, value)
+
+    def get_or_fetch(self, source: str, url: str, params: Optional[dict] = None,
+                     fetch: Optional[Callable[[], Any]] = None, ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached payload for a request, calling fetch on a miss.
+        
+        Concurrent misses for the same key share a single upstream call.
+        """
+        key = self.make_key(source, url, params)
+        value = self.get(key)
+        if value is not None:
+            return value
+            
+        def fetch_and_store():
+            value = fetch()
+            if value is not None:
+                self.set(key, value, ttl if ttl is not None else self.ttl_for(source))
+            return value
+            
+        return self._inflight.do(key, fetch_and_store)
+
+    def clear(self) -> None:
+        """Drop every cached entry, including persisted ones."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for monitoring."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self._inflight.shared,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+        path = self._path_for(key)
+        if path and path.exists():
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove cache file {path}: {e}")
+
+    def _evict(self) -> None:
+        # Drop least recently used entries until under the cap, keeping the newest
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+    def _load(self, key: str) -> Optional[Tuple[float, int, Any]]:
+        path = self._path_for(key)
+        if not path or not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+            serialized = json.dumps(stored['value'])
+            entry = (stored['expires_at'], len(serialized), stored['value'])
+            self._entries[key] = entry
+            self._size += entry[1]
+            self._evict()
+            return entry
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+
+    def _write(self, path: Path, key: str, expires_at: float, value: Any) -> None:
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"key": key, "expires_at": expires_at, "value": value}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist cache entry {key}: {e}")
+
+# Create the process-wide cache shared across sessions
+response_cache = ResponseCache.from_secrets()
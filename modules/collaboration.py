@@ -1,12 +1,38 @@
 import streamlit as st
-import pandas as pd
+from streamlit.errors import StreamlitAPIException
 from datetime import datetime
 import logging
-import random
-from typing import Dict, List, Optional
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+from .templates import HtmlTemplate
 
 logger = logging.getLogger(__name__)
 
+POST_HEADER = HtmlTemplate("""
+    <div class="modern-card" style="padding: 1rem; margin-bottom: 1rem;">
+        <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem; cursor: pointer;">
+            <span style="font-size: 1.5rem;">{image}</span>
+            <div>
+                <strong>{name}</strong><br>
+                <small style="opacity: 0.8;">{title} at {company}</small>
+            </div>
+        </div>
+        <p style="margin: 0.5rem 0;">{content}</p>
+""")
+
+POST_FOOTER = HtmlTemplate("""
+        <div style="color: rgba(255,255,255,0.7); font-size: 0.9rem; margin-top: 0.5rem;">
+            {timestamp} • {likes} likes • {comments} comments
+        </div>
+    </div>
+""")
+
+# Posts per feed page when [collaboration].feed_page_size is missing
+DEFAULT_FEED_PAGE_SIZE = 10
+
+# Author shown for posts whose author is not a known user
+UNKNOWN_AUTHOR = {"name": "Unknown User", "image": "👤", "title": "Member", "company": "22Poultry"}
+
 # Enhanced dummy data
 DUMMY_USERS = {
     "john.doe": {
@@ -66,6 +92,55 @@ DUMMY_POSTS = [
     }
 ]
 
+class PostIndex:
+    """
+    Posts ordered by (timestamp, id) for cursor-based paging, newest first.
+
+    A cursor is the key of the last post on a page, so new posts never
+    shift the pages a reader is already on.
+    """
+
+    def __init__(self, posts: List[Dict] = ()):
+        """Index the given posts."""
+        self._keys: List[Tuple[str, int]] = []
+        self._posts: Dict[Tuple[str, int], Dict] = {}
+        for post in posts:
+            self.add(post)
+
+    @staticmethod
+    def key(post: Dict) -> Tuple[str, int]:
+        """Return the sort key of a post."""
+        return (post["timestamp"], post["id"])
+
+    def add(self, post: Dict) -> None:
+        """Add a post in timestamp order."""
+        key = self.key(post)
+        if key not in self._posts:
+            insort(self._keys, key)
+        self._posts[key] = post
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def page(self, cursor: Optional[Tuple[str, int]] = None, limit: int = DEFAULT_FEED_PAGE_SIZE) -> Tuple[List[Dict], Optional[Tuple[str, int]]]:
+        """
+        Return up to limit posts older than cursor, newest first.
+
+        Also returns the cursor of the next page, or None on the last page.
+        """
+        end = len(self._keys) if cursor is None else bisect_left(self._keys, tuple(cursor))
+        start = max(0, end - limit)
+        keys = self._keys[start:end][::-1]
+        next_cursor = keys[-1] if keys and start > 0 else None
+        return [self._posts[key] for key in keys], next_cursor
+
+def feed_page_size() -> int:
+    """Return the configured number of posts per feed page."""
+    try:
+        return int(st.secrets.get("collaboration", {}).get("feed_page_size", DEFAULT_FEED_PAGE_SIZE))
+    except Exception:
+        return DEFAULT_FEED_PAGE_SIZE
+
 def init_session_state():
     """Initialize session state variables."""
     if "user_profile" not in st.session_state:
@@ -75,6 +150,11 @@ def init_session_state():
         }
     if "posts" not in st.session_state:
         st.session_state.posts = DUMMY_POSTS
+    if "post_index" not in st.session_state:
+        st.session_state.post_index = PostIndex(st.session_state.posts)
+    if "feed_cursors" not in st.session_state:
+        # Cursors of the pages before the current one; the last is the current page
+        st.session_state.feed_cursors = [None]
     if "users" not in st.session_state:
         st.session_state.users = DUMMY_USERS
     if "active_chat" not in st.session_state:
@@ -183,42 +263,43 @@ def create_post():
                 "image": image.name if image else None
             }
             st.session_state.posts.insert(0, new_post)
+            st.session_state.post_index.add(new_post)
+            st.session_state.feed_cursors = [None]
             st.success("Post created successfully!")
             st.rerun()
 
-def show_post(post: Dict, show_interactions: bool = True):
-    """Display a single post in card format."""
-    author = st.session_state.users.get(post["author"], {"name": "Unknown User", "image": "👤"})
+def _rerun(scope: str) -> None:
+    """Rerun with the given scope, or the whole app when a fragment rerun is not allowed."""
+    try:
+        st.rerun(scope=scope)
+    except StreamlitAPIException:
+        st.rerun()
+
+def show_post(post: Dict, show_interactions: bool = True, rerun_scope: str = "app"):
+    """
+    Display a single post in card format.
+
+    Pass rerun_scope="fragment" when the post is rendered inside a fragment,
+    so that liking or commenting re-runs only that fragment.
+    """
+    author = st.session_state.users.get(post["author"], UNKNOWN_AUTHOR)
+    header = POST_HEADER.render(author, content=post['content'])
+    footer = POST_FOOTER.render(timestamp=post['timestamp'], likes=post['likes'], comments=len(post['comments']))
     
     with st.container():
-        st.markdown(f"""
-        <div class="modern-card" style="padding: 1rem; margin-bottom: 1rem;">
-            <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem; cursor: pointer;">
-                <span style="font-size: 1.5rem;">{author['image']}</span>
-                <div>
-                    <strong>{author['name']}</strong><br>
-                    <small style="opacity: 0.8;">{author['title']} at {author['company']}</small>
-                </div>
-            </div>
-            <p style="margin: 0.5rem 0;">{post['content']}</p>
-            """, unsafe_allow_html=True)
-        
         if post.get("image"):
+            st.markdown(header, unsafe_allow_html=True)
             st.image(post["image"], use_column_width=True)
-        
-        st.markdown(f"""
-            <div style="color: rgba(255,255,255,0.7); font-size: 0.9rem; margin-top: 0.5rem;">
-                {post['timestamp']} • {post['likes']} likes • {len(post['comments'])} comments
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+            st.markdown(footer, unsafe_allow_html=True)
+        else:
+            st.markdown(header + "\n" + footer, unsafe_allow_html=True)
         
         if show_interactions:
             col1, col2, col3 = st.columns(3)
             with col1:
                 if st.button("👍 Like", key=f"like_{post['id']}"):
                     post["likes"] += 1
-                    st.rerun()
+                    _rerun(rerun_scope)
             with col2:
                 if st.button("💬 Comment", key=f"comment_{post['id']}"):
                     comment = st.text_input("Add a comment", key=f"comment_input_{post['id']}")
@@ -227,11 +308,36 @@ def show_post(post: Dict, show_interactions: bool = True):
                             "user": st.session_state.user_profile["username"],
                             "content": comment
                         })
-                        st.rerun()
+                        _rerun(rerun_scope)
             with col3:
                 if st.button("↗ Share", key=f"share_{post['id']}"):
                     st.success("Post shared!")
 
+def show_feed():
+    """Show one page of the feed; only the visible posts create widgets."""
+    index = st.session_state.post_index
+    cursors = st.session_state.feed_cursors
+    page_size = feed_page_size()
+    posts, next_cursor = index.page(cursors[-1], page_size)
+    
+    for post in posts:
+        show_post(post)
+    
+    if not posts:
+        st.info("No posts yet. Be the first to share an update!")
+        return
+    
+    first = (len(cursors) - 1) * page_size + 1
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        # Cursors move in callbacks, so the next run renders the new page directly
+        st.button("← Newer", key="feed_newer", disabled=len(cursors) == 1, on_click=cursors.pop)
+    with col2:
+        st.caption(f"Posts {first}–{first + len(posts) - 1} of {len(index)}")
+    with col3:
+        st.button("Older →", key="feed_older", disabled=next_cursor is None,
+                  on_click=cursors.append, args=(next_cursor,))
+
 def show_chat():
     """Display chat interface."""
     st.markdown("### Messages")
@@ -322,8 +428,7 @@ def show_collaboration_module():
         create_post()
         
         st.markdown("### Recent Posts")
-        for post in st.session_state.posts:
-            show_post(post)
+        show_feed()
     
     with tab2:
         st.markdown("### Your Network")
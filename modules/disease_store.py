@@ -0,0 +1,326 @@
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Text columns, stored as integer codes into a per-column category list
+CATEGORICAL_COLUMNS = ('disease', 'region', 'risk_level', 'status')
+# Stand-in for alerts that arrive without a value in a categorical column
+UNKNOWN = 'Unknown'
+
+class _Categories:
+    """Category names of one column and their codes; new names are appended."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for name in names:
+            self.code(name)
+
+    def code(self, name: str) -> int:
+        """Return the code of a name, adding it if it is new."""
+        if name not in self.codes:
+            self.codes[name] = len(self.names)
+            self.names.append(name)
+        return self.codes[name]
+
+    def encode(self, values) -> np.ndarray:
+        """Return the codes of a column of names, converting each distinct name once."""
+        if not isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+            values = pd.Series(values, dtype=object).fillna(UNKNOWN).astype(str)
+        values = pd.Categorical(values)
+        # The last slot maps missing values (code -1) to UNKNOWN
+        mapping = np.array([self.code(str(name)) for name in values.categories] + [self.code(UNKNOWN)], dtype=np.int32)
+        return mapping[values.codes]
+
+class _Index:
+    """Rows of each code, in date order, as slices of one permutation."""
+
+    def __init__(self, codes: np.ndarray, size: int):
+        self.order = np.argsort(codes, kind='stable')
+        self.bounds = np.searchsorted(codes[self.order], np.arange(size + 1))
+
+    def rows(self, code: int) -> np.ndarray:
+        return self.order[self.bounds[code]:self.bounds[code + 1]]
+
+# Days of spare room added to the cube whenever its date range grows
+CUBE_DAY_CHUNK = 64
+
+class _DayCube:
+    """Alert counts and affected farms per region, disease and day, grown as alerts arrive."""
+
+    def __init__(self):
+        self.origin: Optional[np.datetime64] = None
+        self.days = 0
+        self.alerts = np.zeros((0, 0, 0), dtype=np.int64)
+        self.farms = np.zeros((0, 0, 0), dtype=np.int64)
+
+    def add(self, regions: np.ndarray, diseases: np.ndarray, dates: np.ndarray, farms: np.ndarray,
+            shape: Tuple[int, int]) -> None:
+        """Add a batch of alerts, given as region and disease codes, days and farm counts."""
+        first, last = dates.min(), dates.max()
+        origin = first if self.origin is None else min(self.origin, first)
+        shift = 0 if self.origin is None else int((self.origin - origin).astype(np.int64))
+        days = max(shift + self.days, int((last - origin).astype(np.int64)) + 1)
+        rows, columns, capacity = self.alerts.shape
+        if shift or shape[0] > rows or shape[1] > columns or days > capacity:
+            grown = (max(shape[0], rows), max(shape[1], columns),
+                     days + CUBE_DAY_CHUNK if days > capacity or shift else capacity)
+            for name in ('alerts', 'farms'):
+                cube = np.zeros(grown, dtype=np.int64)
+                cube[:rows, :columns, shift:shift + self.days] = getattr(self, name)[:, :, :self.days]
+                setattr(self, name, cube)
+        self.origin, self.days = origin, days
+
+        cells = np.ravel_multi_index((regions, diseases, (dates - origin).astype(np.int64)), self.alerts.shape)
+        if len(cells) * 8 < self.alerts.size:
+            np.add.at(self.alerts.reshape(-1), cells, 1)
+            np.add.at(self.farms.reshape(-1), cells, farms)
+        else:
+            # Large batches: one pass over the cube beats scattered updates
+            self.alerts += np.bincount(cells, minlength=self.alerts.size).reshape(self.alerts.shape)
+            self.farms += np.bincount(cells, weights=farms, minlength=self.farms.size).astype(np.int64).reshape(self.farms.shape)
+
+    def window(self, start=None, end=None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return alert and farm totals per region and disease over an inclusive date range."""
+        if self.origin is None:
+            return self.alerts.sum(axis=2), self.farms.sum(axis=2)
+        lo = 0 if start is None else int(np.clip((np.datetime64(start, 'D') - self.origin).astype(np.int64), 0, self.days))
+        hi = self.days if end is None else int(np.clip((np.datetime64(end, 'D') - self.origin).astype(np.int64) + 1, 0, self.days))
+        return self.alerts[:, :, lo:max(lo, hi)].sum(axis=2), self.farms[:, :, lo:max(lo, hi)].sum(axis=2)
+
+def _alert_keys(frame: pd.DataFrame) -> List[tuple]:
+    """Return every identifying column of each alert as one comparable tuple."""
+    keys = pd.DataFrame({
+        'date': pd.to_datetime(frame['date'], errors='coerce').dt.strftime('%Y-%m-%d'),
+        **{column: frame[column].astype(str) if column in frame else UNKNOWN for column in CATEGORICAL_COLUMNS},
+        'affected_farms': pd.to_numeric(frame['affected_farms'], errors='coerce').fillna(0).astype(np.int64)
+        if 'affected_farms' in frame else 0,
+    }, index=frame.index)
+    return list(keys.itertuples(index=False, name=None))
+
+class DiseaseAlertStore:
+    """
+    In-memory columnar store of disease alerts.
+
+    Rows are kept sorted by date (then risk level), text columns are
+    categorical codes, and rows per region and per disease are looked up
+    as slices of precomputed indexes. Summary counts and a region x
+    disease x day cube are kept up to date as alerts are appended, and
+    version increases with every append so derived results can be cached
+    against it.
+    """
+
+    def __init__(self, categories: Optional[Dict[str, Iterable[str]]] = None,
+                 high_risk: str = 'High', active: str = 'Active'):
+        """
+        Create an empty store.
+
+        Args:
+            categories (dict): Known names per categorical column, in display order
+            high_risk (str): Risk level counted as high risk
+            active (str): Status counted as an active case
+        """
+        categories = categories or {}
+        self.categories = {column: _Categories(categories.get(column, ())) for column in CATEGORICAL_COLUMNS}
+        self._high_risk = self.categories['risk_level'].code(high_risk)
+        self._active = self.categories['status'].code(active)
+        self._columns = {
+            'date': np.array([], dtype='datetime64[D]'),
+            'affected_farms': np.array([], dtype=np.int64),
+            **{column: np.array([], dtype=np.int32) for column in CATEGORICAL_COLUMNS},
+        }
+        # region code -> [alerts, high risk, active cases]
+        self._region_counts = np.zeros((len(self.categories['region'].names), 3), dtype=np.int64)
+        self._cube = _DayCube()
+        self._indexes: Dict[str, _Index] = {}
+        self._indexed_version = -1
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._columns['date'])
+
+    def append(self, alerts) -> int:
+        """
+        Add alerts, given as records or as columns.
+
+        Returns:
+            int: Number of alerts added
+        """
+        frame = pd.DataFrame(alerts)
+        if frame.empty:
+            return 0
+        dates = pd.to_datetime(frame['date'], errors='coerce')
+        valid = dates.notna().to_numpy()
+        if not valid.all():
+            frame = frame[valid]
+        farms = frame['affected_farms'] if 'affected_farms' in frame else pd.Series(0, index=frame.index)
+        batch = {
+            'date': dates.to_numpy()[valid].astype('datetime64[D]'),
+            'affected_farms': pd.to_numeric(farms, errors='coerce').fillna(0).astype(np.int64).to_numpy(),
+        }
+        if not len(frame):
+            return 0
+        with self._lock:
+            for column in CATEGORICAL_COLUMNS:
+                batch[column] = self.categories[column].encode(frame[column] if column in frame else [UNKNOWN] * len(frame))
+            order = np.lexsort((batch['risk_level'], batch['date']))
+            batch = {name: values[order] for name, values in batch.items()}
+
+            columns = self._columns
+            in_order = not len(self) or (batch['date'][0], batch['risk_level'][0]) >= (columns['date'][-1], columns['risk_level'][-1])
+            merged = {name: np.concatenate([columns[name], batch[name]]) for name in columns}
+            if not in_order:
+                order = np.lexsort((merged['risk_level'], merged['date']))
+                merged = {name: values[order] for name, values in merged.items()}
+            self._columns = merged
+
+            size = len(self.categories['region'].names)
+            counts = np.zeros((size, 3), dtype=np.int64)
+            counts[:len(self._region_counts)] = self._region_counts
+            regions = batch['region']
+            counts[:, 0] += np.bincount(regions, minlength=size)
+            counts[:, 1] += np.bincount(regions[batch['risk_level'] == self._high_risk], minlength=size)
+            counts[:, 2] += np.bincount(regions[batch['status'] == self._active], minlength=size)
+            self._region_counts = counts
+            self._cube.add(batch['region'], batch['disease'], batch['date'], batch['affected_farms'],
+                           (size, len(self.categories['disease'].names)))
+            self.version += 1
+        return len(batch['date'])
+
+    def latest_date(self) -> Optional[np.datetime64]:
+        """Return the newest alert date, or None if the store is empty."""
+        dates = self._columns['date']
+        return dates[-1] if len(dates) else None
+
+    def append_new(self, alerts) -> int:
+        """
+        Add only the alerts not stored yet, for feeds that repeat earlier alerts.
+
+        Alerts after the newest stored day are new. Alerts on that day are
+        matched against the stored ones on every column, so late alerts for
+        it are still added; older alerts are taken as already stored.
+
+        Returns:
+            int: Number of alerts added
+        """
+        frame = pd.DataFrame(alerts)
+        latest = self.latest_date()
+        if frame.empty or latest is None:
+            return self.append(frame)
+        days = pd.to_datetime(frame['date'], errors='coerce').to_numpy().astype('datetime64[D]')
+        same_day = frame[days == latest]
+        if len(same_day):
+            stored = Counter(_alert_keys(self.frame(start=latest, end=latest)))
+            fresh = []
+            for key in _alert_keys(same_day):
+                fresh.append(not stored[key])
+                if stored[key]:
+                    stored[key] -= 1
+            same_day = same_day[fresh]
+        return self.append(pd.concat([same_day, frame[days > latest]]))
+
+    def summary(self, region: Optional[str] = None) -> dict:
+        """Return total, high-risk and active alert counts, overall or for one region."""
+        counts = self._region_counts
+        if region is None:
+            totals = counts.sum(axis=0)
+        else:
+            code = self.categories['region'].codes.get(region)
+            totals = counts[code] if code is not None and code < len(counts) else np.zeros(3, dtype=np.int64)
+        return {'total_alerts': int(totals[0]), 'high_risk': int(totals[1]), 'active_cases': int(totals[2])}
+
+    def totals(self, value: str = 'affected_farms', start=None, end=None) -> pd.DataFrame:
+        """
+        Return a region x disease table of alert counts or affected farms.
+
+        Read from the cube, so the cost depends on the number of regions,
+        diseases and days in the range, not on the number of alerts.
+
+        Args:
+            value (str): 'affected_farms' or 'alerts'
+            start, end: Inclusive date range, unbounded when None
+        """
+        with self._lock:
+            alerts, farms = self._cube.window(start, end)
+            regions = list(self.categories['region'].names)
+            diseases = list(self.categories['disease'].names)
+        table = farms if value == 'affected_farms' else alerts
+        matrix = np.zeros((len(regions), len(diseases)), dtype=np.int64)
+        matrix[:table.shape[0], :table.shape[1]] = table
+        return pd.DataFrame(matrix, index=pd.Index(regions, name='region'), columns=pd.Index(diseases, name='disease'))
+
+    def region_insights(self, start=None, end=None) -> pd.DataFrame:
+        """
+        Return per-region alert count, most common disease and mean affected farms.
+
+        One pass over the cube for all regions; regions without alerts are left out.
+        """
+        with self._lock:
+            alerts, farms = self._cube.window(start, end)
+            regions = self.categories['region'].names[:alerts.shape[0]]
+            diseases = np.array(self.categories['disease'].names[:alerts.shape[1]], dtype=object)
+        counts = alerts.sum(axis=1)
+        seen = counts > 0
+        return pd.DataFrame({
+            'total_alerts': counts[seen],
+            # Ties go to the disease listed first
+            'most_common_disease': diseases[alerts[seen].argmax(axis=1)] if len(diseases) else [],
+            'average_affected_farms': farms.sum(axis=1)[seen] / counts[seen],
+        }, index=pd.Index(np.array(regions, dtype=object)[seen], name='region'))
+
+    def rows(self, region: Optional[str] = None, disease: Optional[str] = None,
+             start=None, end=None) -> np.ndarray:
+        """
+        Return the positions of matching alerts in date order.
+
+        Region or disease picks a slice of its index, and the date range is
+        then found by binary search within that slice.
+        """
+        return self._rows(*self._snapshot(), region, disease, start, end)
+
+    def frame(self, region: Optional[str] = None, disease: Optional[str] = None,
+              start=None, end=None, newest_first: bool = False) -> pd.DataFrame:
+        """Return matching alerts as a DataFrame with categorical text columns."""
+        columns, indexes = self._snapshot()
+        rows = self._rows(columns, indexes, region, disease, start, end)
+        if newest_first:
+            rows = rows[::-1]
+        frame = pd.DataFrame({'date': columns['date'][rows]})
+        for column in ('disease', 'region', 'risk_level'):
+            frame[column] = pd.Categorical.from_codes(columns[column][rows], list(self.categories[column].names))
+        frame['affected_farms'] = columns['affected_farms'][rows]
+        frame['status'] = pd.Categorical.from_codes(columns['status'][rows], list(self.categories['status'].names))
+        return frame
+
+    def _rows(self, columns, indexes, region, disease, start, end) -> np.ndarray:
+        rows = None
+        for column, name in (('region', region), ('disease', disease)):
+            if name is None:
+                continue
+            code = self.categories[column].codes.get(name)
+            if code is None or code >= len(indexes[column].bounds) - 1:
+                return np.array([], dtype=np.int64)
+            candidates = indexes[column].rows(code)
+            rows = candidates if rows is None else np.intersect1d(rows, candidates, assume_unique=True)
+        dates = columns['date'] if rows is None else columns['date'][rows]
+        lo = np.searchsorted(dates, np.datetime64(start, 'D'), side='left') if start is not None else 0
+        hi = np.searchsorted(dates, np.datetime64(end, 'D'), side='right') if end is not None else len(dates)
+        return np.arange(lo, hi) if rows is None else rows[lo:hi]
+
+    def _snapshot(self):
+        """Return the current columns and their indexes, rebuilding indexes after appends."""
+        with self._lock:
+            if self._indexed_version != self.version:
+                self._indexes = {
+                    column: _Index(self._columns[column], len(self.categories[column].names))
+                    for column in ('region', 'disease')
+                }
+                self._indexed_version = self.version
+            return self._columns, self._indexes
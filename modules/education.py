@@ -122,51 +122,7 @@ def show_content():
         }
     }
 
-    # Modern card layout for modules
-    st.markdown("""
-    <style>
-    .module-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 2px 12px rgba(0,0,0,0.1);
-        margin-bottom: 1rem;
-    }
-    .module-header {
-        display: flex;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    .module-icon {
-        font-size: 2rem;
-        margin-right: 1rem;
-    }
-    .module-title {
-        font-size: 1.2rem;
-        color: #333;
-        margin: 0;
-    }
-    .section-content {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 10px;
-        margin-top: 0.5rem;
-    }
-    .progress-bar {
-        height: 4px;
-        background: #eee;
-        border-radius: 2px;
-        margin-top: 0.5rem;
-    }
-    .progress-value {
-        height: 100%;
-        background: #ff4b4b;
-        border-radius: 2px;
-        transition: width 0.3s ease;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
+    # Modern card layout for modules, styled by static/css/education.css
     # Display modules
     for module_id, module in modules.items():
         st.markdown(f"""
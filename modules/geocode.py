@@ -0,0 +1,149 @@
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+GEOCODE_URL = "http://api.openweathermap.org/geo/1.0/direct"
+# Shortest place name sent to the geocoding API
+MIN_QUERY_LENGTH = 3
+# Seconds a geocoding API answer for a query is reused, including "not found"
+LOOKUP_TTL = 3600
+# Where resolved locations are persisted between runs
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parent.parent / ".cache" / "geocode.json"
+# Locations available before any lookup has been made
+SEED_LOCATIONS = {
+    "Manila": {"lat": 14.5995, "lon": 120.9842, "country": "PH"},
+    "Cebu": {"lat": 10.3157, "lon": 123.8854, "country": "PH"},
+    "Davao": {"lat": 7.1907, "lon": 125.4553, "country": "PH"},
+}
+
+def normalize_name(name: str) -> str:
+    """Normalize a place name: strip accents and punctuation, casefold, collapse spaces."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    cleaned = re.sub(r"[^\w\s,]", " ", stripped.casefold())
+    cleaned = re.sub(r"\s*,\s*", ", ", cleaned)
+    return re.sub(r"\s+", " ", cleaned).strip(" ,")
+
+class GeocodeIndex:
+    """Persistent index of resolved locations with prefix lookup."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_INDEX_PATH, seeds: Optional[Dict[str, dict]] = None):
+        """Load the index from disk and add the seed locations."""
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, dict] = {}
+        self._keys: List[str] = []
+        # Normalized query -> (monotonic time, canonical key or None when not found)
+        self._lookups: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._load()
+        for name, coords in (SEED_LOCATIONS if seeds is None else seeds).items():
+            if normalize_name(name) not in self._entries:
+                self._insert(name, coords)
+
+    def get(self, name: str) -> Optional[dict]:
+        """Return the stored location for a place name, if known."""
+        return self._entries.get(normalize_name(name))
+
+    def prefix_search(self, prefix: str, limit: int = 10) -> List[dict]:
+        """Return up to limit known locations whose name starts with prefix."""
+        key = normalize_name(prefix)
+        with self._lock:
+            start = bisect.bisect_left(self._keys, key)
+            matches = []
+            for stored in self._keys[start:]:
+                if not stored.startswith(key) or len(matches) >= limit:
+                    break
+                matches.append(self._entries[stored])
+            return matches
+
+    def names(self) -> List[str]:
+        """Return the display names of every known location."""
+        with self._lock:
+            return [self._entries[key]["name"] for key in self._keys]
+
+    def add(self, name: str, lat: float, lon: float, country: Optional[str] = None) -> dict:
+        """Record a resolved location and persist the index."""
+        with self._lock:
+            entry = self._insert(name, {"lat": lat, "lon": lon, "country": country})
+        self.save()
+        return entry
+
+    def resolve(self, name: str, api_key: str) -> Optional[dict]:
+        """
+        Resolve a place name locally, falling back to the OpenWeather geocoding API.
+
+        Only the canonical name returned by the API is added to the index.
+        Names shorter than MIN_QUERY_LENGTH are not sent, and each query's
+        answer, found or not, is reused for LOOKUP_TTL seconds.
+        """
+        entry = self.get(name)
+        if entry:
+            return entry
+        key = normalize_name(name)
+        if len(key) < MIN_QUERY_LENGTH:
+            return None
+        with self._lock:
+            lookup = self._lookups.get(key)
+        if lookup and time.monotonic() - lookup[0] < LOOKUP_TTL:
+            return self._entries.get(lookup[1]) if lookup[1] else None
+
+        response = http_client.get(GEOCODE_URL, params={"q": name, "limit": 1, "appid": api_key})
+        response.raise_for_status()
+        geo_data = response.json()
+        result = geo_data[0] if geo_data else None
+        if not result or not result.get("name"):
+            with self._lock:
+                self._lookups[key] = (time.monotonic(), None)
+            return None
+
+        entry = self.get(result["name"]) or self.add(result["name"], result["lat"], result["lon"], result.get("country"))
+        with self._lock:
+            self._lookups[key] = (time.monotonic(), normalize_name(result["name"]))
+        return entry
+
+    def save(self) -> None:
+        """Write the index to disk atomically."""
+        if not self.path:
+            return
+        with self._lock:
+            data = list(self._entries.values())
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist geocode index: {e}")
+
+    def _insert(self, name: str, coords: dict) -> dict:
+        key = normalize_name(name)
+        entry = {"name": name.strip(), "lat": coords["lat"], "lon": coords["lon"], "country": coords.get("country")}
+        if key not in self._entries:
+            bisect.insort(self._keys, key)
+        self._entries[key] = entry
+        return entry
+
+    def _load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                for entry in json.load(f):
+                    self._insert(entry["name"], entry)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable geocode index {self.path}: {e}")
+
+# Create the process-wide index shared by all sessions
+geocode_index = GeocodeIndex()
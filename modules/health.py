@@ -1,31 +1,103 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import logging
+import threading
+import time
 from .api_config import api_client
+from .disease_store import DiseaseAlertStore
+from .telemetry import telemetry
+from .templates import HtmlTemplate, markdown_list
 
 logger = logging.getLogger(__name__)
 
-def get_health_data():
-    """Get health monitoring data with fallback to dummy data."""
+# Border color of an alert by risk level
+RISK_COLORS = {
+    'High': 'red',
+    'Medium': 'orange',
+    'Low': 'green'
+}
+
+DISEASES = [
+    "Avian Influenza",
+    "Newcastle Disease",
+    "Infectious Bronchitis",
+    "Coccidiosis",
+    "Salmonella"
+]
+REGIONS = ["North", "South", "East", "West", "Central"]
+RISK_LEVELS = ['Low', 'Medium', 'High']
+STATUSES = ['Active', 'Contained', 'Monitoring']
+# Fixed seed so every worker process generates the same sample alerts
+MOCK_SEED = 22
+# Share of (date, disease, region) cells that have an alert
+MOCK_ALERT_RATE = 0.3
+# Affected farms per sample alert are drawn from [0, MOCK_MAX_FARMS)
+MOCK_MAX_FARMS = 50
+
+ALERT_CARD = HtmlTemplate("""
+    <div style='border-left: 5px solid {color}; padding-left: 10px;'>
+        <h4>{disease}</h4>
+        <p>Region: {region} | Risk Level: {risk_level} | Status: {status}</p>
+        <p>Date: {date} | Affected Farms: {affected_farms}</p>
+    </div>
+""")
+
+# Shown where no barn telemetry has been received yet
+SAMPLE_HEALTH_DATA = {
+    'mortality_rate': 2.5,
+    'feed_consumption': 85.3,
+    'water_consumption': 92.1,
+    'temperature': 25.6,
+    'humidity': 65.2,
+    'ammonia_levels': 15.4,
+    'last_vaccination': '2024-03-10',
+    'next_vaccination': '2024-04-10'
+}
+# Telemetry sensor -> health data key; feed and water keys are only present when reported
+TELEMETRY_FIELDS = {
+    'temperature': 'temperature',
+    'humidity': 'humidity',
+    'ammonia': 'ammonia_levels',
+    'water_flow': 'water_flow',
+    'feed_weight': 'feed_weight'
+}
+# Seconds of telemetry charted on the environment tab
+TELEMETRY_CHART_WINDOW = 3600
+# Metric deltas compare against the reading this many seconds earlier
+TELEMETRY_DELTA_WINDOW = 600
+
+def get_health_data(house=None):
+    """
+    Get health monitoring data, with live barn readings where telemetry has arrived.
+
+    Sensor values are the latest reading of the given house, or the mean of
+    the latest readings across houses; 'live' tells whether any were used.
+    """
     try:
-        # Dummy health data for demonstration
-        return {
-            'mortality_rate': 2.5,
-            'feed_consumption': 85.3,
-            'water_consumption': 92.1,
-            'temperature': 25.6,
-            'humidity': 65.2,
-            'ammonia_levels': 15.4,
-            'last_vaccination': '2024-03-10',
-            'next_vaccination': '2024-04-10'
-        }
+        health_data = dict(SAMPLE_HEALTH_DATA, live=False)
+        for sensor, key in TELEMETRY_FIELDS.items():
+            if house:
+                reading = telemetry.latest(house, sensor)
+                value = reading[1] if reading else None
+            else:
+                value = telemetry.latest_mean(sensor)
+            if value is not None:
+                health_data[key] = round(value, 1)
+                health_data['live'] = True
+        return health_data
     except Exception as e:
         logger.error(f"Error getting health data: {e}")
         return None
 
+def telemetry_delta(house, sensor, seconds=TELEMETRY_DELTA_WINDOW):
+    """Return the change of a house sensor over the last seconds, or None."""
+    _, values = telemetry.window(house, sensor, seconds)
+    return float(values[-1] - values[0]) if len(values) > 1 else None
+
 def display_health_summary():
     """Display key health metrics in the dashboard."""
     try:
@@ -44,19 +116,26 @@ def display_health_summary():
                 "-0.5%"
             )
         
+        # Live feed and water sensors replace the sample consumption figures
         with col2:
-            st.metric(
-                "Feed Consumption",
-                f"{health_data['feed_consumption']}%",
-                "2.1%"
-            )
+            if 'feed_weight' in health_data:
+                st.metric("Feed in Hoppers", f"{health_data['feed_weight']} kg")
+            else:
+                st.metric(
+                    "Feed Consumption",
+                    f"{health_data['feed_consumption']}%",
+                    "2.1%"
+                )
         
         with col3:
-            st.metric(
-                "Water Consumption",
-                f"{health_data['water_consumption']}%",
-                "1.8%"
-            )
+            if 'water_flow' in health_data:
+                st.metric("Water Flow", f"{health_data['water_flow']} L/min")
+            else:
+                st.metric(
+                    "Water Consumption",
+                    f"{health_data['water_consumption']}%",
+                    "1.8%"
+                )
     except Exception as e:
         logger.error(f"Error displaying health summary: {e}")
         st.warning("Unable to display health summary")
@@ -88,10 +167,19 @@ def show_health_module():
         st.markdown("### Basic Health Information")
         display_health_summary()
 
+def metric_delta(house, sensor, unit, sample):
+    """Format a sensor's recent change for st.metric; the sample delta when showing sample data."""
+    if house is None:
+        return sample
+    change = telemetry_delta(house, sensor)
+    return f"{change:+.1f}{unit}" if change is not None else None
+
 def show_environmental_conditions():
     """Display environmental conditions monitoring."""
     try:
-        health_data = get_health_data()
+        houses = telemetry.houses()
+        house = st.selectbox("Barn House", houses) if houses else None
+        health_data = get_health_data(house)
         if not health_data:
             st.warning("Environmental data temporarily unavailable")
             return
@@ -105,32 +193,58 @@ def show_environmental_conditions():
             st.metric(
                 "Temperature",
                 f"{health_data['temperature']}°C",
-                "0.8°C"
+                metric_delta(house, 'temperature', "°C", "0.8°C")
             )
         
         with col2:
             st.metric(
                 "Humidity",
                 f"{health_data['humidity']}%",
-                "-2.3%"
+                metric_delta(house, 'humidity', "%", "-2.3%")
             )
         
         with col3:
             st.metric(
                 "Ammonia Levels",
                 f"{health_data['ammonia_levels']} ppm",
-                "-1.2 ppm"
+                metric_delta(house, 'ammonia', " ppm", "-1.2 ppm")
             )
+
+        if 'feed_weight' in health_data or 'water_flow' in health_data:
+            col1, col2 = st.columns(2)
+            if 'feed_weight' in health_data:
+                with col1:
+                    st.metric(
+                        "Feed in Hoppers",
+                        f"{health_data['feed_weight']} kg",
+                        metric_delta(house, 'feed_weight', " kg", None)
+                    )
+            if 'water_flow' in health_data:
+                with col2:
+                    st.metric(
+                        "Water Flow",
+                        f"{health_data['water_flow']} L/min",
+                        metric_delta(house, 'water_flow', " L/min", None)
+                    )
             
         # Add a line chart for temperature trends
-        dates = pd.date_range(start='2024-03-01', end='2024-03-17', freq='D')
-        temp_data = pd.DataFrame({
-            'Date': dates,
-            'Temperature': [25 + i * 0.1 for i in range(len(dates))]
-        })
-        
-        fig = px.line(temp_data, x='Date', y='Temperature',
-                     title='Temperature Trend')
+        if house is not None:
+            times, values = telemetry.window(house, 'temperature', TELEMETRY_CHART_WINDOW)
+            temp_data = pd.DataFrame({
+                'Time': pd.to_datetime(times, unit='s'),
+                'Temperature': values
+            })
+            fig = px.line(temp_data, x='Time', y='Temperature',
+                         title=f'Temperature Trend, {house} (last hour)')
+        else:
+            st.caption("Sample data: no barn telemetry received yet")
+            dates = pd.date_range(start='2024-03-01', end='2024-03-17', freq='D')
+            temp_data = pd.DataFrame({
+                'Date': dates,
+                'Temperature': [25 + i * 0.1 for i in range(len(dates))]
+            })
+            fig = px.line(temp_data, x='Date', y='Temperature',
+                         title='Temperature Trend')
         st.plotly_chart(fig, use_container_width=True)
         
     except Exception as e:
@@ -244,7 +358,11 @@ def show_vaccination_schedule():
 
 def get_disease_data(region='all'):
     """Get disease tracking data for poultry"""
-    response = api_client.get_disease_alerts(region)
+    # The API client has no disease feed in every deployment
+    fetch_alerts = getattr(api_client, 'get_disease_alerts', None)
+    if fetch_alerts is None:
+        return get_mock_disease_data()
+    response = fetch_alerts(region)
     
     if response.get('error'):
         st.warning(f"Error fetching disease data: {response['message']}")
@@ -252,61 +370,161 @@ def get_disease_data(region='all'):
         
     return response
 
-def get_mock_disease_data():
-    """Provide sample disease tracking data for demonstration"""
-    today = datetime.now()
-    dates = [(today - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(30)]
-    
-    diseases = [
-        "Avian Influenza",
-        "Newcastle Disease",
-        "Infectious Bronchitis",
-        "Coccidiosis",
-        "Salmonella"
-    ]
-    
-    regions = ["North", "South", "East", "West", "Central"]
-    
-    alerts = []
-    for date in dates:
-        for disease in diseases:
-            for region in regions:
-                if (hash(f"{date}{disease}{region}") % 10) < 3:  # Random occurrence
-                    alerts.append({
-                        'date': date,
-                        'disease': disease,
-                        'region': region,
-                        'risk_level': ['Low', 'Medium', 'High'][hash(f"{date}{disease}") % 3],
-                        'affected_farms': hash(f"{date}{disease}{region}") % 50,
-                        'status': ['Active', 'Contained', 'Monitoring'][hash(f"{date}{disease}{region}") % 3]
-                    })
-    
+def load_disease_store() -> DiseaseAlertStore:
+    """
+    Return the process-wide alert store, adding new alerts at most every DISEASE_REFRESH_INTERVAL seconds.
+
+    The first call waits for the fetch; later refreshes are made by one
+    session while the others read the store as it is. The fetch time is
+    recorded even when the fetch fails or has no alerts.
+    """
+    global _disease_store_fetched_at
+    fetched_at = _disease_store_fetched_at
+    if fetched_at is not None and time.monotonic() - fetched_at < DISEASE_REFRESH_INTERVAL:
+        return disease_store
+    if not _disease_store_lock.acquire(blocking=fetched_at is None):
+        return disease_store
+    try:
+        if _disease_store_fetched_at == fetched_at:
+            _disease_store_fetched_at = time.monotonic()
+            try:
+                disease_store.append_new(get_disease_data('all')['alerts'])
+            except Exception as e:
+                logger.error(f"Error refreshing disease alerts: {e}")
+    finally:
+        _disease_store_lock.release()
+    return disease_store
+
+def _mix(keys: np.ndarray) -> np.ndarray:
+    """Spread uint64 keys over all 64 bits (the SplitMix64 finalizer)."""
+    z = keys + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def _uniform(seed: int, *keys) -> np.ndarray:
+    """Return a uniform value in [0, 1) per element of the broadcast keys, fixed by the seed and keys."""
+    hashed = np.full(np.broadcast(*keys).shape, seed, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for key in keys:
+            hashed = _mix(hashed ^ np.asarray(key).astype(np.uint64))
+    return (hashed >> np.uint64(11)) * (1.0 / (1 << 53))
+
+def get_mock_disease_data(days: int = 30, regions=None, diseases=None, seed: int = MOCK_SEED, end_date=None) -> dict:
+    """
+    Provide sample disease tracking data for demonstration and load tests.
+
+    Every draw is a hash of the seed, the calendar date, the disease and
+    the region, computed over all (date, disease, region) cells at once.
+    A day therefore has the same alerts whatever end_date and days cover
+    it, in every process, and years of dates across hundreds of regions
+    take well under a second.
+
+    Args:
+        days (int): Number of days back from end_date to cover
+        regions (list): Region names, defaults to REGIONS
+        diseases (list): Disease names, defaults to DISEASES
+        seed (int): Seed of the draws
+        end_date (date): Most recent day, defaults to today
+
+    Returns:
+        dict: 'alerts' as equal-length columns (datetime64 date and
+        categorical disease, region, risk_level and status, plus
+        affected_farms), newest day first, and 'summary' counts
+    """
+    regions = list(regions if regions is not None else REGIONS)
+    diseases = list(diseases if diseases is not None else DISEASES)
+
+    end = np.datetime64(end_date or datetime.now().date(), 'D')
+    dates = end - np.arange(days)
+    day_keys = dates.astype(np.int64)
+    disease_keys = np.arange(len(diseases))
+    region_keys = np.arange(len(regions))
+
+    # One risk level per (date, disease), shared by all regions that day
+    risk_by_day = (_uniform(seed, day_keys[:, None], disease_keys[None, :], 1) * len(RISK_LEVELS)).astype(np.int8)
+    hits = _uniform(seed, day_keys[:, None, None], disease_keys[None, :, None], region_keys[None, None, :], 0)
+    cells = np.flatnonzero(hits < MOCK_ALERT_RATE)
+    date_idx, rest = np.divmod(cells, len(diseases) * len(regions))
+    disease_idx, region_idx = np.divmod(rest, len(regions))
+    risk = risk_by_day[date_idx, disease_idx]
+    alert_keys = (day_keys[date_idx], disease_idx, region_idx)
+    status = (_uniform(seed, *alert_keys, 2) * len(STATUSES)).astype(np.int8)
+    farms = (_uniform(seed, *alert_keys, 3) * MOCK_MAX_FARMS).astype(np.int64)
+
+    # Text columns are categorical codes, so no per-alert strings are built
+    alerts = {
+        'date': dates[date_idx],
+        'disease': pd.Categorical.from_codes(disease_idx, diseases),
+        'region': pd.Categorical.from_codes(region_idx, regions),
+        'risk_level': pd.Categorical.from_codes(risk, RISK_LEVELS),
+        'affected_farms': farms,
+        'status': pd.Categorical.from_codes(status, STATUSES),
+    }
     return {
         'alerts': alerts,
         'summary': {
-            'total_alerts': len(alerts),
-            'high_risk': sum(1 for a in alerts if a['risk_level'] == 'High'),
-            'active_cases': sum(1 for a in alerts if a['status'] == 'Active')
+            'total_alerts': len(cells),
+            'high_risk': int(np.count_nonzero(risk == RISK_LEVELS.index('High'))),
+            'active_cases': int(np.count_nonzero(status == STATUSES.index('Active')))
         }
     }
 
-def create_disease_heatmap(data):
-    """Create a heatmap of disease occurrences by region"""
-    df = pd.DataFrame(data)
-    pivot = pd.pivot_table(
-        df,
-        values='affected_farms',
-        index='region',
-        columns='disease',
-        aggfunc='sum',
-        fill_value=0
-    )
-    
+# Create the process-wide alert store shared by all sessions
+disease_store = DiseaseAlertStore(categories={
+    'disease': DISEASES,
+    'region': REGIONS,
+    'risk_level': RISK_LEVELS,
+    'status': STATUSES
+})
+_disease_store_lock = threading.Lock()
+_disease_store_fetched_at = None
+# Seconds between fetches of new disease alerts into the shared store
+DISEASE_REFRESH_INTERVAL = 900
+
+# Days of alerts listed in the Current Alerts tab, up to the newest stored day
+ALERT_LIST_DAYS = 7
+
+# Heatmap time windows in days; None covers every stored alert
+HEATMAP_WINDOWS = {
+    "All time": None,
+    "Last 7 days": 7,
+    "Last 30 days": 30
+}
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def heatmap_snapshot(version: int, start=None) -> pd.DataFrame:
+    """
+    Return affected farms per region and disease since start, read from the store's cube.
+
+    Shared by every session and computed once per store version and window.
+    """
+    return disease_store.totals(start=start)
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def regional_insights(version: int) -> pd.DataFrame:
+    """Return alert count, most common disease and mean affected farms per region, once per store version."""
+    return disease_store.region_insights()
+
+def recent_alerts(store, region=None, days: int = ALERT_LIST_DAYS) -> list:
+    """Return the alerts of the last days up to the store's newest day as display records, newest first."""
+    latest = store.latest_date()
+    if latest is None:
+        return []
+    # Newest first, highest risk first within a day: the store's order reversed
+    alerts = store.frame(region=region, start=latest - np.timedelta64(days - 1, 'D'), newest_first=True).to_dict('records')
+    for alert in alerts:
+        alert['color'] = RISK_COLORS[alert['risk_level']]
+        alert['date'] = f"{alert['date']:%Y-%m-%d}"
+    return alerts
+
+def create_disease_heatmap(pivot, title="Disease Occurrence Heatmap by Region"):
+    """Create a heatmap of disease occurrences by region from a region x disease table"""
     fig = px.imshow(
         pivot,
         aspect="auto",
         color_continuous_scale="RdYlBu_r",
-        title="Disease Occurrence Heatmap by Region"
+        title=title
     )
     
     fig.update_layout(height=400)
@@ -318,32 +536,34 @@ def show_health_monitoring():
     # Region selection
     region = st.selectbox(
         "Select Region",
-        ["All Regions", "North", "South", "East", "West", "Central"],
+        ["All Regions", *REGIONS],
         help="Choose a region to view specific health alerts"
     )
     
-    # Get disease data
-    disease_data = get_disease_data(region.lower() if region != "All Regions" else "all")
+    # Alerts come from the shared store; region filters are index lookups
+    store = load_disease_store()
+    selected_region = None if region == "All Regions" else region
+    summary = store.summary(selected_region)
     
-    if disease_data:
+    if len(store):
         # Summary metrics
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric(
                 "Total Alerts",
-                disease_data['summary']['total_alerts'],
+                summary['total_alerts'],
                 help="Total number of disease alerts in the selected region"
             )
         with col2:
             st.metric(
                 "High Risk Cases",
-                disease_data['summary']['high_risk'],
+                summary['high_risk'],
                 help="Number of high-risk disease cases"
             )
         with col3:
             st.metric(
                 "Active Cases",
-                disease_data['summary']['active_cases'],
+                summary['active_cases'],
                 help="Number of currently active disease cases"
             )
         
@@ -351,45 +571,27 @@ def show_health_monitoring():
         tabs = st.tabs(["Current Alerts", "Disease Map", "Prevention Guide"])
         
         with tabs[0]:
-            # Filter alerts
-            alerts_df = pd.DataFrame(disease_data['alerts'])
-            if region != "All Regions":
-                alerts_df = alerts_df[alerts_df['region'] == region]
-            
-            # Sort by date and risk level
-            alerts_df = alerts_df.sort_values(['date', 'risk_level'], ascending=[False, False])
-            
-            # Display alerts with color coding
-            for _, alert in alerts_df.iterrows():
-                color = {
-                    'High': 'red',
-                    'Medium': 'orange',
-                    'Low': 'green'
-                }[alert['risk_level']]
-                
-                with st.container():
-                    st.markdown(f"""
-                    <div style='border-left: 5px solid {color}; padding-left: 10px;'>
-                        <h4>{alert['disease']}</h4>
-                        <p>Region: {alert['region']} | Risk Level: {alert['risk_level']} | Status: {alert['status']}</p>
-                        <p>Date: {alert['date']} | Affected Farms: {alert['affected_farms']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    st.divider()
+            # Only the last days are listed; the map tab covers the full history
+            alerts = recent_alerts(store, selected_region)
+            st.caption(f"Alerts from the last {ALERT_LIST_DAYS} days")
+            markdown_list(ALERT_CARD, alerts, separator="\n<hr>\n")
         
         with tabs[1]:
             # Disease heatmap
-            st.plotly_chart(create_disease_heatmap(disease_data['alerts']), use_container_width=True)
+            window = st.radio("Time window", list(HEATMAP_WINDOWS), horizontal=True)
+            days = HEATMAP_WINDOWS[window]
+            start = (datetime.now().date() - timedelta(days=days - 1)).isoformat() if days else None
+            pivot = heatmap_snapshot(store.version, start)
+            st.plotly_chart(create_disease_heatmap(pivot, f"Disease Occurrence Heatmap by Region ({window})"),
+                            use_container_width=True)
             
-            # Additional insights
+            # Additional insights, one grouped pass over the store's cube
             st.subheader("Regional Insights")
-            alerts_df = pd.DataFrame(disease_data['alerts'])
-            for region in alerts_df['region'].unique():
-                region_data = alerts_df[alerts_df['region'] == region]
+            for region, insight in regional_insights(store.version).iterrows():
                 with st.expander(f"{region} Region Analysis"):
-                    st.write(f"Total Alerts: {len(region_data)}")
-                    st.write(f"Most Common Disease: {region_data['disease'].mode().iloc[0]}")
-                    st.write(f"Average Affected Farms: {region_data['affected_farms'].mean():.1f}")
+                    st.write(f"Total Alerts: {insight['total_alerts']}")
+                    st.write(f"Most Common Disease: {insight['most_common_disease']}")
+                    st.write(f"Average Affected Farms: {insight['average_affected_farms']:.1f}")
         
         with tabs[2]:
             st.subheader("Disease Prevention Guidelines")
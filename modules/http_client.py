@@ -0,0 +1,86 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeout in seconds used when a caller does not pass one
+DEFAULT_TIMEOUT = (3.05, 10)
+# Number of upstream hosts whose connection pools are kept alive
+POOL_CONNECTIONS = 8
+# Keep-alive connections kept open per upstream host
+POOL_MAXSIZE = 10
+# Simultaneous in-flight requests allowed per upstream host
+MAX_CONCURRENCY_PER_HOST = 8
+
+Timeout = Union[float, Tuple[float, float]]
+
+class HTTPClient:
+    """Process-wide HTTP transport shared by every upstream call."""
+
+    def __init__(self, timeout: Timeout = DEFAULT_TIMEOUT,
+                 pool_maxsize: int = POOL_MAXSIZE,
+                 max_concurrency: int = MAX_CONCURRENCY_PER_HOST):
+        """Create a keep-alive session with one connection pool per host."""
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._limits: Dict[str, threading.BoundedSemaphore] = {}
+        # host -> (reachable, monotonic time of the last outcome, last error)
+        self._outcomes: Dict[str, Tuple[bool, float, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _limit_for(self, host: str) -> threading.BoundedSemaphore:
+        """Return the concurrency limiter for an upstream host."""
+        with self._lock:
+            if host not in self._limits:
+                self._limits[host] = threading.BoundedSemaphore(self.max_concurrency)
+            return self._limits[host]
+
+    def request(self, method: str, url: str, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        """Send a request through the shared pool, waiting for a free upstream slot."""
+        timeout = timeout if timeout is not None else self.timeout
+        host = urlsplit(url).netloc
+        limit = self._limit_for(host)
+        wait = timeout[0] if isinstance(timeout, tuple) else timeout
+        if not limit.acquire(timeout=wait):
+            raise requests.exceptions.ConnectTimeout(f"Concurrency limit reached for {host}")
+        metrics.record_upstream_call(host)
+        try:
+            response = self.session.request(method, url, timeout=timeout, **kwargs)
+            self._outcomes[host] = (True, time.monotonic(), None)
+            return response
+        except requests.RequestException as e:
+            self._outcomes[host] = (False, time.monotonic(), type(e).__name__)
+            raise
+        finally:
+            limit.release()
+
+    def host_status(self) -> Dict[str, dict]:
+        """
+        Return whether each upstream host answered its last request.
+
+        Based only on past traffic, so checking it never touches the network.
+        """
+        now = time.monotonic()
+        return {
+            host: {'reachable': reachable, 'age': round(now - at, 1), 'error': error}
+            for host, (reachable, at, error) in list(self._outcomes.items())
+        }
+
+    def get(self, url: str, params: Optional[dict] = None, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        """Send a GET request through the shared pool."""
+        return self.request("GET", url, params=params, timeout=timeout, **kwargs)
+
+# Create the process-wide instance shared by all modules
+http_client = HTTPClient()
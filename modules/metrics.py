@@ -0,0 +1,168 @@
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import ContextDecorator
+from typing import Dict, List, Tuple
+
+# Upper bounds in seconds of the render time histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Sections entered by the current thread or task, innermost last
+_active_sections: contextvars.ContextVar[Tuple["_SectionStats", ...]] = contextvars.ContextVar("active_sections", default=())
+
+class Histogram:
+    """Cumulative Prometheus-style histogram."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return (le, cumulative count) pairs, ending with +Inf."""
+        pairs, total = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+class _SectionStats:
+    """Counters of one in-progress section run."""
+
+    __slots__ = ("upstream_calls", "cache_hits", "cache_misses")
+
+    def __init__(self):
+        self.upstream_calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+class MetricsRegistry:
+    """Render timings per section plus upstream and cache counters, in Prometheus text format."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._durations: Dict[str, Histogram] = {}
+        self._section_counters: Dict[str, Dict[str, int]] = {}
+        self._upstream_calls: Dict[str, int] = {}
+        self._cache = {"hit": 0, "miss": 0}
+        self._lock = threading.Lock()
+
+    def section(self, name: str) -> "Section":
+        """Return a context manager and decorator that times the named section."""
+        return Section(name, self)
+
+    def record_section(self, name: str, seconds: float, stats: _SectionStats) -> None:
+        """Add one finished section run to its histogram and counters."""
+        with self._lock:
+            histogram = self._durations.get(name)
+            if histogram is None:
+                histogram = self._durations[name] = Histogram(self.buckets)
+                self._section_counters[name] = {"upstream_calls": 0, "cache_hits": 0, "cache_misses": 0}
+            histogram.observe(seconds)
+            counters = self._section_counters[name]
+            counters["upstream_calls"] += stats.upstream_calls
+            counters["cache_hits"] += stats.cache_hits
+            counters["cache_misses"] += stats.cache_misses
+
+    def record_upstream_call(self, host: str) -> None:
+        """Count an upstream HTTP request, attributing it to the active sections."""
+        for stats in _active_sections.get():
+            stats.upstream_calls += 1
+        with self._lock:
+            self._upstream_calls[host] = self._upstream_calls.get(host, 0) + 1
+
+    def record_cache(self, hit: bool) -> None:
+        """Count a response cache lookup, attributing it to the active sections."""
+        for stats in _active_sections.get():
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+        with self._lock:
+            self._cache["hit" if hit else "miss"] += 1
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines += [
+                "# HELP poultry_section_duration_seconds Wall time spent rendering a section.",
+                "# TYPE poultry_section_duration_seconds histogram",
+            ]
+            for name, histogram in sorted(self._durations.items()):
+                label = _label(name)
+                for le, count in histogram.cumulative():
+                    lines.append(f'poultry_section_duration_seconds_bucket{{section="{label}",le="{le}"}} {count}')
+                lines.append(f'poultry_section_duration_seconds_sum{{section="{label}"}} {histogram.sum:.6f}')
+                lines.append(f'poultry_section_duration_seconds_count{{section="{label}"}} {histogram.count}')
+
+            for counter, help_text in (("upstream_calls", "Upstream HTTP requests made while rendering a section."),
+                                       ("cache_hits", "Response cache hits while rendering a section."),
+                                       ("cache_misses", "Response cache misses while rendering a section.")):
+                lines += [
+                    f"# HELP poultry_section_{counter}_total {help_text}",
+                    f"# TYPE poultry_section_{counter}_total counter",
+                ]
+                for name, counters in sorted(self._section_counters.items()):
+                    lines.append(f'poultry_section_{counter}_total{{section="{_label(name)}"}} {counters[counter]}')
+
+            lines += [
+                "# HELP poultry_upstream_requests_total Upstream HTTP requests by host.",
+                "# TYPE poultry_upstream_requests_total counter",
+            ]
+            for host, count in sorted(self._upstream_calls.items()):
+                lines.append(f'poultry_upstream_requests_total{{host="{_label(host)}"}} {count}')
+
+            lines += [
+                "# HELP poultry_cache_lookups_total Response cache lookups by result.",
+                "# TYPE poultry_cache_lookups_total counter",
+            ]
+            for result, count in sorted(self._cache.items()):
+                lines.append(f'poultry_cache_lookups_total{{result="{result}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+class Section(ContextDecorator):
+    """
+    Times a block or function as a named section.
+
+    Upstream calls and cache lookups made while the section is active,
+    including in nested sections, are counted against it.
+    """
+
+    def __init__(self, name: str, registry: MetricsRegistry):
+        self.name = name
+        self.registry = registry
+
+    def _recreate_cm(self) -> "Section":
+        # Each decorated call gets its own timer, so concurrent calls do not share state
+        return Section(self.name, self.registry)
+
+    def __enter__(self) -> "Section":
+        self._stats = _SectionStats()
+        self._token = _active_sections.set(_active_sections.get() + (self._stats,))
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        _active_sections.reset(self._token)
+        self.registry.record_section(self.name, time.perf_counter() - self._start, self._stats)
+        return False
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Create the process-wide registry shared by all sessions
+metrics = MetricsRegistry()
+
+def section(name: str) -> Section:
+    """Time a block or function as a named section of the process-wide registry."""
+    return metrics.section(name)
@@ -1,11 +1,37 @@
 import streamlit as st
 import requests
-import pandas as pd
 from datetime import datetime, timedelta
 import logging
+from .http_client import http_client
+from .cache import response_cache
+from .templates import HtmlTemplate, markdown_list, safe_url
 
 logger = logging.getLogger(__name__)
 
+NEWS_CARD = HtmlTemplate("""
+    <div class="modern-card">
+        <h3>{title}</h3>
+        <p>{description}</p>
+        <p><small>Published: {published}</small></p>
+        <a href="{url}" target="_blank" rel="noopener noreferrer">Read more</a>
+    </div>
+""")
+
+NEWS_HEADLINE = HtmlTemplate("""
+    <p style="margin-bottom: 0.25rem;"><strong><a href="{url}" target="_blank" rel="noopener noreferrer">{title}</a></strong></p>
+    <p style="color: #94a3b8; font-size: 0.9rem; margin-top: 0;">{source} • {published}</p>
+""")
+
+NEWS_ARTICLE_BODY = HtmlTemplate("""
+    <h3 style="margin: 0; color: #2c3e50;">{title}</h3>
+    <p style="color: #666; margin: 0.5rem 0; font-size: 0.9rem;">
+        {published} | {source}
+    </p>
+    <p style="color: #444; margin: 1rem 0;">
+        {description}
+    </p>
+""")
+
 def get_news_data(query: str = "poultry farming") -> dict:
     """Fetch news data from News API with error handling."""
     try:
@@ -23,9 +49,12 @@ def get_news_data(query: str = "poultry farming") -> dict:
             'language': 'en'
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        def fetch():
+            response = http_client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+        return response_cache.get_or_fetch("news", url, params, fetch)
     except KeyError:
         logger.error("News API key not found in secrets")
         return {"error": "API key not configured"}
@@ -33,21 +62,47 @@ def get_news_data(query: str = "poultry farming") -> dict:
         logger.error(f"News API request failed: {str(e)}")
         return {"error": "News service temporarily unavailable"}
 
+def news_card_values(article: dict) -> dict:
+    """Extract the template fields of a news article."""
+    return {
+        'title': article.get('title') or 'No title available',
+        'description': article.get('description') or 'No description available',
+        'published': (article.get('publishedAt') or 'Date unknown')[:10],
+        'source': (article.get('source') or {}).get('name') or 'Unknown source',
+        'url': safe_url(article.get('url')),
+    }
+
 def display_news_card(article: dict) -> None:
     """Display a single news article in a card format."""
+    display_news_cards([article])
+
+def display_news_cards(articles: list) -> None:
+    """Display news articles as cards in a single markdown element."""
     try:
-        with st.container():
-            st.markdown(f"""
-                <div class="modern-card">
-                    <h3>{article.get('title', 'No title available')}</h3>
-                    <p>{article.get('description', 'No description available')}</p>
-                    <p><small>Published: {article.get('publishedAt', 'Date unknown')[:10]}</small></p>
-                    <a href="{article.get('url', '#')}" target="_blank">Read more</a>
-                </div>
-            """, unsafe_allow_html=True)
+        markdown_list(NEWS_CARD, [news_card_values(article) for article in articles])
+    except Exception as e:
+        logger.error(f"Error displaying news cards: {str(e)}")
+        st.warning("Unable to display these news articles")
+
+def show_news_summary(news_data: dict = None, limit: int = 3) -> None:
+    """Display the latest headlines in a compact list for the dashboard."""
+    try:
+        if news_data is None:
+            news_data = get_news_data()
+            
+        if "error" in news_data:
+            st.warning(news_data["error"])
+            return
+            
+        articles = news_data.get("articles", [])[:limit]
+        if not articles:
+            st.info("No recent news available.")
+            return
+            
+        markdown_list(NEWS_HEADLINE, [news_card_values(article) for article in articles])
     except Exception as e:
-        logger.error(f"Error displaying news card: {str(e)}")
-        st.warning("Unable to display this news article")
+        logger.error(f"Error displaying news summary: {str(e)}")
+        st.warning("Unable to display latest news")
 
 def show_news_module():
     """Main news module display."""
@@ -75,14 +130,12 @@ def show_news_module():
             return
             
         # Display news articles
-        for article in articles[:5]:  # Show top 5 articles
-            display_news_card(article)
+        display_news_cards(articles[:5])  # Show top 5 articles
             
         # Add a "Load More" button
         if len(articles) > 5:
             if st.button("Load More Articles"):
-                for article in articles[5:10]:
-                    display_news_card(article)
+                display_news_cards(articles[5:10])
                     
     except Exception as e:
         logger.error(f"Error in news module: {str(e)}")
@@ -112,7 +165,7 @@ def show_news():
             f"&apiKey={api_key}"
         )
         
-        response = requests.get(url)
+        response = http_client.get(url)
         news_data = response.json()
         
         if news_data.get('status') == 'ok' and news_data.get('articles'):
@@ -151,18 +204,15 @@ def show_news():
                         )
                 
                 with col2:
-                    st.markdown(f"""
-                    <h3 style="margin: 0; color: #2c3e50;">{article['title']}</h3>
-                    <p style="color: #666; margin: 0.5rem 0; font-size: 0.9rem;">
-                        {format_date(article['publishedAt'])} | {article['source']['name']}
-                    </p>
-                    <p style="color: #444; margin: 1rem 0;">
-                        {article.get('description', '')}
-                    </p>
-                    """, unsafe_allow_html=True)
+                    st.markdown(NEWS_ARTICLE_BODY.render(
+                        title=article['title'],
+                        published=format_date(article['publishedAt']),
+                        source=article['source']['name'],
+                        description=article.get('description') or ''
+                    ), unsafe_allow_html=True)
                     
                     if st.button("Read More", key=article['url']):
-                        st.markdown(f"[Read the full article]({article['url']})")
+                        st.markdown(f"[Read the full article]({safe_url(article['url'])})")
                 
                 st.markdown("</div>", unsafe_allow_html=True)
                 
@@ -0,0 +1,223 @@
+import hmac
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+
+from streamlit.runtime import Runtime, RuntimeState
+
+from .cache import response_cache
+from .circuit_breaker import CircuitBreaker, breaker_states
+from .http_client import http_client
+from .metrics import metrics
+from .refresher import refresher
+from .telemetry import telemetry_route
+
+logger = logging.getLogger(__name__)
+
+# Port of the operations endpoints, separate from the Streamlit port
+DEFAULT_PORT = 9102
+DEFAULT_HOST = "0.0.0.0"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json"
+
+# Largest request body accepted by POST routes
+MAX_BODY_BYTES = 1024 * 1024
+
+# A route returns (status, content type, body)
+Route = Callable[[], Tuple[int, str, bytes]]
+# A POST route receives the request body and returns the same
+PostRoute = Callable[[bytes], Tuple[int, str, bytes]]
+
+class OpsServer:
+    """
+    Small HTTP server for operational endpoints, run beside Streamlit.
+
+    Requests are answered from in-process state on the server's own
+    threads and never execute the Streamlit script. POST routes take
+    pushed data such as barn telemetry.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.routes: Dict[str, Route] = {}
+        # path -> (handler, bearer token the request must carry)
+        self.post_routes: Dict[str, Tuple[PostRoute, str]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        # Set by the first start; a failed bind is not retried on later runs
+        self._attempted = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "OpsServer":
+        """Build the server from METRICS_HOST and METRICS_PORT."""
+        return cls(
+            host=os.environ.get("METRICS_HOST", DEFAULT_HOST),
+            port=int(os.environ.get("METRICS_PORT", DEFAULT_PORT)),
+        )
+
+    def route(self, path: str, handler: Route) -> None:
+        """Serve GET requests for path from handler."""
+        self.routes[path] = handler
+
+    def route_post(self, path: str, handler: PostRoute, token: str) -> None:
+        """
+        Serve POST requests for path from handler, which receives the body.
+
+        Requests must send "Authorization: Bearer <token>"; others get 401
+        before their body is read.
+        """
+        if not token:
+            raise ValueError(f"POST route {path} needs a token")
+        self.post_routes[path] = (handler, token)
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def start(self) -> bool:
+        """
+        Start serving in a daemon thread unless already running. Returns whether it runs.
+
+        Safe to call on every run: the bind is tried, and a failure
+        logged, once per process until stop() is called.
+        """
+        with self._lock:
+            if self._server is not None:
+                return True
+            if self._attempted:
+                return False
+            self._attempted = True
+            try:
+                self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+            except OSError as e:
+                logger.warning(f"Ops endpoints not started on {self.host}:{self.port}: {e}")
+                return False
+            self._server.daemon_threads = True
+            self.port = self._server.server_address[1]
+            threading.Thread(target=self._server.serve_forever, name="ops-server", daemon=True).start()
+            logger.info(f"Serving ops endpoints on {self.host}:{self.port}")
+            return True
+
+    def stop(self) -> None:
+        """Stop serving."""
+        with self._lock:
+            if self._server is not None:
+                self._server.shutdown()
+                self._server.server_close()
+                self._server = None
+            self._attempted = False
+
+    def _handler_class(self):
+        routes = self.routes
+        post_routes = self.post_routes
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                handler = routes.get(self.path.split("?", 1)[0])
+                self._respond(*self._call(handler))
+
+            def do_POST(self):
+                handler, token = post_routes.get(self.path.split("?", 1)[0], (None, None))
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    length = -1
+                # Rejected bodies are never read, so the connection cannot be reused
+                if length < 0:
+                    self._reject(400, b"invalid Content-Length\n")
+                elif handler is None:
+                    self._reject(404, b"not found\n")
+                elif not hmac.compare_digest(self.headers.get("Authorization", "").encode(), f"Bearer {token}".encode()):
+                    self._reject(401, b"unauthorized\n")
+                elif length > MAX_BODY_BYTES:
+                    self._reject(413, b"request body too large\n")
+                else:
+                    body = self.rfile.read(length) if length else b""
+                    self._respond(*self._call(handler, body))
+
+            def _reject(self, status, message):
+                self.close_connection = True
+                self._respond(status, "text/plain; charset=utf-8", message)
+
+            def _call(self, handler, *args):
+                if handler is None:
+                    return 404, "text/plain; charset=utf-8", b"not found\n"
+                try:
+                    return handler(*args)
+                except Exception as e:
+                    logger.error(f"Ops endpoint {self.path} failed: {e}")
+                    return 500, "text/plain; charset=utf-8", b"error\n"
+
+            def _respond(self, status, content_type, body):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Probes and scrapes are frequent; keep them out of the app log
+                pass
+
+        return Handler
+
+def metrics_route() -> Tuple[int, str, bytes]:
+    """Serve the metrics registry in Prometheus text format."""
+    return 200, PROMETHEUS_CONTENT_TYPE, metrics.render().encode()
+
+def livez_route() -> Tuple[int, str, bytes]:
+    """Report that the process is alive and serving requests."""
+    return 200, "text/plain; charset=utf-8", b"ok\n"
+
+def streamlit_running() -> bool:
+    """Return True once the Streamlit server in this process accepts sessions."""
+    if not Runtime.exists():
+        return False
+    return Runtime.instance().state in (RuntimeState.NO_SESSIONS_CONNECTED, RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED)
+
+def readiness() -> dict:
+    """
+    Collect readiness from in-process state only.
+
+    The app is ready once Streamlit is serving. Open circuits and
+    unreachable hosts mark it as degraded but still ready, because pages
+    fall back to cached, stale or sample data.
+    """
+    breakers = breaker_states()
+    hosts = http_client.host_status()
+    snapshots = refresher.status()
+    degraded = sorted(
+        [f"breaker:{name}" for name, state in breakers.items() if state['state'] == CircuitBreaker.OPEN] +
+        [f"host:{host}" for host, status in hosts.items() if not status['reachable']]
+    )
+    ready = streamlit_running()
+    return {
+        'status': 'degraded' if ready and degraded else 'ready' if ready else 'starting',
+        'degraded': degraded,
+        'cache': response_cache.stats(),
+        'snapshots': snapshots,
+        'warm': bool(snapshots) and not any(status['stale'] for status in snapshots.values()),
+        'breakers': breakers,
+        'upstreams': hosts,
+    }
+
+def readyz_route() -> Tuple[int, str, bytes]:
+    """Serve readiness as JSON, with 503 until Streamlit is serving."""
+    report = readiness()
+    status = 503 if report['status'] == 'starting' else 200
+    return status, JSON_CONTENT_TYPE, json.dumps(report, default=str).encode()
+
+# Create the process-wide server; serve.py starts it before Streamlit, app.py on first run otherwise
+ops_server = OpsServer.from_env()
+ops_server.route("/metrics", metrics_route)
+ops_server.route("/livez", livez_route)
+ops_server.route("/readyz", readyz_route)
+# Pushed telemetry is only accepted with the shared token; without one the route is not served
+if os.environ.get("TELEMETRY_TOKEN"):
+    ops_server.route_post("/telemetry", telemetry_route, token=os.environ["TELEMETRY_TOKEN"])
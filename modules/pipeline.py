@@ -0,0 +1,57 @@
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Worker threads shared by every concurrent fetch stage
+MAX_WORKERS = 16
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="fetch")
+
+class Deadline:
+    """A point in time shared by every request of one fetch stage."""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self, minimum: float = 0.0) -> float:
+        """Return the seconds left before the deadline, never less than minimum."""
+        return max(self.expires_at - time.monotonic(), minimum)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+def fetch_concurrently(tasks: Dict[str, Callable[[], Any]], deadline: Deadline) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+    """
+    Run independent fetches in parallel under one shared deadline.
+
+    Args:
+        tasks (Dict[str, Callable]): Zero-argument callables keyed by name
+        deadline (Deadline): Deadline shared by all tasks
+
+    Returns:
+        Tuple[Dict, Dict]: Results of the tasks that finished in time, and the
+        exception of every task that failed or missed the deadline
+    """
+    # Run each task in a copy of the caller's context so metrics sections see its calls
+    futures = {name: _executor.submit(contextvars.copy_context().run, task) for name, task in tasks.items()}
+    done, _ = wait(futures.values(), timeout=deadline.remaining())
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    for name, future in futures.items():
+        if future not in done:
+            future.cancel()
+            errors[name] = TimeoutError(f"{name} did not finish before the deadline")
+        elif future.exception() is not None:
+            errors[name] = future.exception()
+        else:
+            results[name] = future.result()
+
+    for name, error in errors.items():
+        logger.warning(f"Concurrent fetch '{name}' failed: {error}")
+    return results, errors
@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background checks for snapshots past their soft TTL
+CHECK_INTERVAL = 5
+# Worker threads used for background refreshes
+MAX_WORKERS = 4
+
+class Snapshot:
+    """The last good value of a data source and when it was fetched."""
+
+    def __init__(self, value: Any, fetched_at: float, hard_ttl: float):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.hard_ttl = hard_ttl
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def stale(self) -> bool:
+        """True once the snapshot is older than its hard TTL."""
+        return self.age > self.hard_ttl
+
+class BackgroundRefresher:
+    """
+    Keeps data-source snapshots warm with stale-while-revalidate semantics.
+
+    Readers always get the last good snapshot immediately. Once a snapshot is
+    older than its soft TTL a refresh is scheduled in the background; past the
+    hard TTL the snapshot is reported as stale. A loader result that is a dict
+    with an "error" key counts as a failed refresh and keeps the old snapshot.
+    """
+
+    def __init__(self, check_interval: float = CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._sources: Dict[str, dict] = {}
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._refreshing = set()
+        self._attempted = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="refresh")
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, loader: Callable[[], Any], soft_ttl: float, hard_ttl: float) -> None:
+        """Register or update a data source."""
+        with self._lock:
+            self._sources[name] = {'loader': loader, 'soft_ttl': soft_ttl, 'hard_ttl': hard_ttl}
+
+    def get(self, name: str) -> Optional[Snapshot]:
+        """
+        Return the last good snapshot of a source, scheduling a refresh if it is old.
+
+        Only the very first read of a source waits for its loader; if that
+        fails, later reads return None while retries run in the background.
+        """
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            with self._lock:
+                first_read = name not in self._attempted
+                if first_read:
+                    self._attempted.add(name)
+                    self._refreshing.add(name)
+            if first_read:
+                self._refresh_and_release(name)
+            else:
+                self.schedule(name)
+            return self._snapshots.get(name)
+        if snapshot.age > self._sources[name]['soft_ttl']:
+            self.schedule(name)
+        return snapshot
+
+    def registered(self, name: str) -> bool:
+        """Return True if a data source of this name is registered."""
+        return name in self._sources
+
+    def loading(self, name: str) -> bool:
+        """Return True while a refresh of the source is running."""
+        return name in self._refreshing
+
+    def snapshot(self, name: str) -> Optional[Snapshot]:
+        """Return the last good snapshot of a source without scheduling a refresh."""
+        return self._snapshots.get(name)
+
+    def schedule(self, name: str) -> None:
+        """Refresh a source in the background unless a refresh is already running."""
+        with self._lock:
+            # A scheduled load counts as the first attempt, so a first read does not start another
+            self._attempted.add(name)
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+        self._executor.submit(self._refresh_and_release, name)
+
+    def refresh(self, name: str) -> bool:
+        """Run a source's loader now and store the result if it succeeded."""
+        source = self._sources[name]
+        try:
+            value = source['loader']()
+        except Exception as e:
+            logger.warning(f"Refreshing '{name}' failed: {e}")
+            return False
+        if value is None or (isinstance(value, dict) and "error" in value):
+            logger.warning(f"Refreshing '{name}' returned no usable data")
+            return False
+        self._snapshots[name] = Snapshot(value, time.time(), source['hard_ttl'])
+        return True
+
+    def start(self) -> None:
+        """Start the daemon thread that keeps registered sources warm."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="snapshot-refresher", daemon=True)
+            self._thread.start()
+
+    def status(self) -> Dict[str, dict]:
+        """Return the age and staleness of every snapshot for monitoring."""
+        return {
+            name: {'age': snapshot.age, 'stale': snapshot.stale}
+            for name, snapshot in list(self._snapshots.items())
+        }
+
+    def _refresh_and_release(self, name: str) -> None:
+        try:
+            self.refresh(name)
+        finally:
+            with self._lock:
+                self._refreshing.discard(name)
+
+    def _run(self) -> None:
+        while True:
+            for name, source in list(self._sources.items()):
+                snapshot = self._snapshots.get(name)
+                if snapshot is None or snapshot.age > source['soft_ttl']:
+                    self.schedule(name)
+            time.sleep(self.check_interval)
+
+# Create the process-wide refresher shared by all sessions
+refresher = BackgroundRefresher()
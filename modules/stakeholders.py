@@ -1,5 +1,17 @@
 import streamlit as st
 import pandas as pd
+from .templates import HtmlTemplate, markdown_list
+
+CONTACT_CARD = HtmlTemplate("""
+    <div class="stakeholder-card">
+        <h3>{name}</h3>
+        <p>📍 {location}</p>
+        <p>{icon} {details}</p>
+        <a href="mailto:{contact}" class="contact-button">
+            ✉️ Contact
+        </a>
+    </div>
+""")
 
 def show_directory():
     st.markdown("""
@@ -8,22 +20,7 @@ def show_directory():
     </h1>
     """, unsafe_allow_html=True)
 
-    # Modern filter section
-    st.markdown("""
-    <style>
-    .filter-container {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 2px 12px rgba(0,0,0,0.1);
-        margin-bottom: 1.5rem;
-    }
-    .stSelectbox {
-        margin-bottom: 0.5rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
+    # Modern filter section, styled by static/css/stakeholders.css
     st.markdown('<div class="filter-container">', unsafe_allow_html=True)
 
     # Directory filters with icons
@@ -38,32 +35,6 @@ def show_directory():
     )
     st.markdown('</div>', unsafe_allow_html=True)
 
-    # Custom styling for cards
-    st.markdown("""
-    <style>
-    .stakeholder-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        margin-bottom: 1rem;
-        transition: transform 0.2s;
-    }
-    .stakeholder-card:hover {
-        transform: translateY(-2px);
-    }
-    .contact-button {
-        background-color: #ff4b4b;
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 5px;
-        text-decoration: none;
-        display: inline-block;
-        margin-top: 0.5rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
     # Display directory based on filters
     if category == "Farmers":
         show_farmers(state)
@@ -74,18 +45,23 @@ def show_directory():
     elif category == "Veterinarians":
         show_veterinarians(state)
 
+def contact_card_values(data):
+    """Extract the template fields of a stakeholder record"""
+    return {
+        'name': data['Name'],
+        'location': data['Location'],
+        'icon': get_icon_for_category(data),
+        'details': get_details_text(data),
+        'contact': data['Contact'],
+    }
+
 def create_contact_card(data):
     """Helper function to create a consistent contact card layout"""
-    st.markdown(f"""
-    <div class="stakeholder-card">
-        <h3>{data['Name']}</h3>
-        <p>📍 {data['Location']}</p>
-        <p>{get_icon_for_category(data)} {get_details_text(data)}</p>
-        <a href="mailto:{data['Contact']}" class="contact-button">
-            ✉️ Contact
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
+    create_contact_cards([data])
+
+def create_contact_cards(records):
+    """Render contact cards for a list of records in a single markdown element"""
+    markdown_list(CONTACT_CARD, [contact_card_values(data) for data in records])
 
 def get_icon_for_category(data):
     if 'Farm Size' in data:
@@ -120,8 +96,7 @@ def show_farmers(state):
     if state != "All States":
         farmers = farmers[farmers["Location"] == state]
 
-    for _, farmer in farmers.iterrows():
-        create_contact_card(farmer)
+    create_contact_cards(farmers.to_dict('records'))
 
 def show_suppliers(state):
     suppliers = pd.DataFrame({
@@ -134,8 +109,7 @@ def show_suppliers(state):
     if state != "All States":
         suppliers = suppliers[suppliers["Location"] == state]
 
-    for _, supplier in suppliers.iterrows():
-        create_contact_card(supplier)
+    create_contact_cards(suppliers.to_dict('records'))
 
 def show_manufacturers(state):
     manufacturers = pd.DataFrame({
@@ -148,8 +122,7 @@ def show_manufacturers(state):
     if state != "All States":
         manufacturers = manufacturers[manufacturers["Location"] == state]
 
-    for _, manufacturer in manufacturers.iterrows():
-        create_contact_card(manufacturer)
+    create_contact_cards(manufacturers.to_dict('records'))
 
 def show_veterinarians(state):
     vets = pd.DataFrame({
@@ -162,5 +135,4 @@ def show_veterinarians(state):
     if state != "All States":
         vets = vets[vets["Location"] == state]
 
-    for _, vet in vets.iterrows():
-        create_contact_card(vet)
\ No newline at end of file
+    create_contact_cards(vets.to_dict('records'))
\ No newline at end of file
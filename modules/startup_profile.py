@@ -0,0 +1,66 @@
+import importlib
+import logging
+import re
+import subprocess
+import sys
+import time
+from types import ModuleType
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds spent in each lazy import made by the running app
+_import_times: Dict[str, float] = {}
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module on first use, recording how long the import took."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    _import_times[name] = time.perf_counter() - start
+    logger.info(f"Lazily imported {name} in {_import_times[name] * 1000:.0f} ms")
+    return module
+
+def lazy_import_times() -> Dict[str, float]:
+    """Return the seconds spent in each lazy import so far."""
+    return dict(_import_times)
+
+def profile_imports(*names: str, top: int = 15) -> List[Tuple[str, float]]:
+    """
+    Measure the cumulative import cost of modules in a fresh interpreter.
+
+    Runs `python -X importtime` so that nothing is already cached, and
+    returns the top modules by cumulative import time in seconds.
+    """
+    code = "; ".join(f"import {name}" for name in names)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True
+    )
+    costs: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if not match:
+            continue
+        cumulative, indent, module = match.groups()
+        # Only keep top-level imports; nested ones are included in their parent
+        if not indent:
+            costs[module] = costs.get(module, 0.0) + int(cumulative) / 1e6
+    return sorted(costs.items(), key=lambda item: item[1], reverse=True)[:top]
+
+def format_report(costs: List[Tuple[str, float]]) -> str:
+    """Format import costs as a plain-text table."""
+    total = sum(seconds for _, seconds in costs)
+    lines = [f"{'module':<30} {'ms':>8} {'share':>7}"]
+    for module, seconds in costs:
+        share = seconds / total * 100 if total else 0
+        lines.append(f"{module:<30} {seconds * 1000:>8.0f} {share:>6.1f}%")
+    lines.append(f"{'total':<30} {total * 1000:>8.0f}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    # Usage: python -m modules.startup_profile [module ...]
+    targets = sys.argv[1:] or ["streamlit", "modules.weather", "modules.news", "modules.collaboration"]
+    print(format_report(profile_imports(*targets)))
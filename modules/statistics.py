@@ -3,6 +3,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from data.mock_statistics import get_mock_data
+from data.store import statistics_store
 
 def show_dashboard():
     st.markdown("<h2>Farm Performance Dashboard</h2>", unsafe_allow_html=True)
@@ -178,4 +179,29 @@ def show_dashboard():
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """, unsafe_allow_html=True)
+    
+    show_government_statistics()
+
+def show_government_statistics():
+    """Display data.gov.in statistics served from the local store."""
+    st.markdown("<h3>Government Statistics</h3>", unsafe_allow_html=True)
+    
+    # Aggregated by SQLite; only per-day and per-region rows are loaded
+    processed = statistics_store.aggregate()
+    if processed is None:
+        st.info("Government statistics have not been synced yet. Run `python -m data.store` to sync them.")
+        return
+        
+    metrics = processed['metrics']
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Production", f"{metrics['total_production']:,.0f}")
+    with col2:
+        st.metric("Average Price", f"₹{metrics['avg_price']:,.2f}")
+        
+    production = processed['production']
+    if not production.empty:
+        fig = px.line(production, x='date', y='value', title='Production (data.gov.in)')
+        st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
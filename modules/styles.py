@@ -0,0 +1,99 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import hashlib
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Hand-written stylesheets, app.css first and then one per feature module
+CSS_DIR = PROJECT_ROOT / "static" / "css"
+# Minified, fingerprinted bundles produced by the build step
+DIST_DIR = PROJECT_ROOT / "static" / "dist"
+FONT_AWESOME_URL = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css"
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    # Spaces before ':' are kept, they are significant in selectors
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+def source_files(css_dir: Path = CSS_DIR) -> list:
+    """Return the stylesheets in bundle order."""
+    return sorted(Path(css_dir).glob("*.css"), key=lambda path: (path.stem != "app", path.name))
+
+def build_stylesheet(css_dir: Path = CSS_DIR, dist_dir: Path = DIST_DIR) -> Tuple[str, str]:
+    """
+    Minify the module stylesheets into one bundle named by its content hash.
+
+    Reuses an existing bundle for unchanged sources and removes stale ones.
+    Returns the fingerprint and the minified CSS.
+    """
+    sources = source_files(css_dir)
+    css = "".join(minify_css(path.read_text()) for path in sources)
+    fingerprint = hashlib.sha256(css.encode()).hexdigest()[:12]
+    dist_dir = Path(dist_dir)
+    bundle = dist_dir / f"app.{fingerprint}.css"
+    if not bundle.exists():
+        dist_dir.mkdir(parents=True, exist_ok=True)
+        for stale in dist_dir.glob("app.*.css"):
+            stale.unlink()
+        bundle.write_text(css)
+        logger.info(f"Built {bundle.name} from {len(sources)} stylesheets ({len(css)} bytes)")
+    return fingerprint, css
+
+@st.cache_resource(show_spinner=False)
+def load_stylesheet() -> Tuple[str, str]:
+    """Build or reuse the stylesheet bundle once per process."""
+    return build_stylesheet()
+
+def inject_styles(fingerprint: Optional[str] = None, css: Optional[str] = None) -> None:
+    """
+    Add Font Awesome and the app stylesheet to the page head once per session.
+
+    The styles live in the parent document rather than in an element, so
+    later reruns send nothing. A new fingerprint replaces the old bundle.
+    """
+    if fingerprint is None:
+        try:
+            fingerprint, css = load_stylesheet()
+        except OSError as e:
+            logger.error(f"Could not build stylesheet: {e}")
+            return
+    if st.session_state.get("_styles_injected") == fingerprint:
+        return
+
+    components.html(f"""
+        <script>
+        const head = window.parent.document.head;
+        if (!head.querySelector("#font-awesome")) {{
+            const link = window.parent.document.createElement("link");
+            link.id = "font-awesome";
+            link.rel = "stylesheet";
+            link.href = {json.dumps(FONT_AWESOME_URL)};
+            head.appendChild(link);
+        }}
+        if (!head.querySelector("#app-css-{fingerprint}")) {{
+            head.querySelectorAll("style[id^='app-css-']").forEach((old) => old.remove());
+            const style = window.parent.document.createElement("style");
+            style.id = "app-css-{fingerprint}";
+            style.textContent = {json.dumps(css)};
+            head.appendChild(style);
+        }}
+        </script>
+    """, height=0)
+    st.session_state["_styles_injected"] = fingerprint
+
+if __name__ == "__main__":
+    # Usage: python -m modules.styles
+    logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler(sys.stdout)])
+    fingerprint, _ = build_stylesheet()
+    print(DIST_DIR / f"app.{fingerprint}.css")
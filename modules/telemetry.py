@@ -0,0 +1,352 @@
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Sensors reported by each barn house
+SENSORS = ('temperature', 'humidity', 'ammonia', 'water_flow', 'feed_weight')
+# Readings kept per house and sensor: one hour at 1 Hz
+RING_CAPACITY = 3600
+# Largest UDP datagram accepted by the listener
+MAX_DATAGRAM = 65507
+# Seconds between checks of a tailed file for new lines
+TAIL_INTERVAL = 0.5
+# Seconds a reading may be stamped ahead of this host's clock; later ones are rejected
+MAX_CLOCK_SKEW = 5.0
+# Most houses kept per process; readings for further houses are rejected
+MAX_HOUSES = 256
+
+# (house, sensor, unix timestamp, value)
+Reading = Tuple[str, str, float, float]
+
+class RingBuffer:
+    """Fixed-size buffer of timestamped readings backed by two NumPy arrays."""
+
+    def __init__(self, capacity: int = RING_CAPACITY):
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Store a reading, overwriting the oldest once the buffer is full."""
+        self.times[self._next] = timestamp
+        self.values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self.count += 1
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """Return the newest (timestamp, value), or None if empty."""
+        if not self.count:
+            return None
+        index = self._next - 1
+        return float(self.times[index]), float(self.values[index])
+
+    def last(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return copies of the newest n timestamps and values, oldest first."""
+        n = min(n, len(self))
+        start = self._next - n
+        if start >= 0:
+            return self.times[start:self._next].copy(), self.values[start:self._next].copy()
+        return (np.concatenate([self.times[start:], self.times[:self._next]]),
+                np.concatenate([self.values[start:], self.values[:self._next]]))
+
+    def since(self, timestamp: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the readings at or after a timestamp, oldest first."""
+        times, values = self.last(len(self))
+        start = np.searchsorted(times, timestamp, side='left')
+        return times[start:], values[start:]
+
+def parse_readings(payload, now: Optional[float] = None) -> List[Reading]:
+    """
+    Turn a decoded payload into readings.
+
+    Accepts one object or a list of objects, each either
+    {"house", "sensor", "value", "ts"} or {"house", "ts", <sensor>: <value>, ...}.
+    A missing ts means now; items with an invalid ts, unknown sensors and
+    non-numeric values are skipped.
+    """
+    now = time.time() if now is None else now
+    readings = []
+    for item in payload if isinstance(payload, list) else [payload]:
+        if not isinstance(item, dict) or 'house' not in item:
+            continue
+        house = str(item['house'])
+        try:
+            timestamp = float(item.get('ts', now))
+        except (TypeError, ValueError):
+            continue
+        if not math.isfinite(timestamp):
+            continue
+        pairs = [(item.get('sensor'), item.get('value'))] if 'sensor' in item else item.items()
+        for sensor, value in pairs:
+            if sensor not in SENSORS:
+                continue
+            try:
+                readings.append((house, sensor, timestamp, float(value)))
+            except (TypeError, ValueError):
+                continue
+    return readings
+
+class TelemetryStore:
+    """
+    Latest barn sensor readings, one ring buffer per house and sensor.
+
+    Latest values are O(1) reads and windows are slices of the buffer.
+    Readings older than the newest one already stored for the same house
+    and sensor are dropped so every buffer stays in time order, and
+    readings stamped more than MAX_CLOCK_SKEW ahead of this host's clock
+    are rejected so a bad clock cannot block a sensor. Buffers are only
+    created for allowed houses, and for at most max_houses of them, so
+    senders cannot grow memory by inventing house names.
+    """
+
+    def __init__(self, capacity: int = RING_CAPACITY, max_houses: int = MAX_HOUSES,
+                 allowed_houses: Optional[Collection[str]] = None):
+        self.capacity = capacity
+        self.max_houses = max_houses
+        self.allowed_houses = set(allowed_houses) if allowed_houses else None
+        self._buffers: Dict[Tuple[str, str], RingBuffer] = {}
+        self._houses: Set[str] = set()
+        self._lock = threading.Lock()
+        self.accepted = 0
+        self.rejected = 0
+        self.malformed = 0
+
+    def ingest(self, readings: Iterable[Reading], now: Optional[float] = None) -> int:
+        """Store readings and return how many were accepted."""
+        latest_allowed = (time.time() if now is None else now) + MAX_CLOCK_SKEW
+        accepted = 0
+        with self._lock:
+            for house, sensor, timestamp, value in readings:
+                if timestamp > latest_allowed:
+                    self.rejected += 1
+                    continue
+                key = (house, sensor)
+                buffer = self._buffers.get(key)
+                if buffer is None:
+                    if not self._admit(house):
+                        self.rejected += 1
+                        continue
+                    buffer = self._buffers[key] = RingBuffer(self.capacity)
+                newest = buffer.latest()
+                if newest is not None and timestamp < newest[0]:
+                    self.rejected += 1
+                    continue
+                buffer.append(timestamp, value)
+                accepted += 1
+            self.accepted += accepted
+        return accepted
+
+    def _admit(self, house: str) -> bool:
+        """Return True if buffers may be created for a house; call with the lock held."""
+        if house in self._houses:
+            return True
+        if self.allowed_houses is not None and house not in self.allowed_houses:
+            return False
+        if len(self._houses) >= self.max_houses:
+            return False
+        self._houses.add(house)
+        return True
+
+    def ingest_json(self, data) -> int:
+        """
+        Decode a JSON document or JSON lines and store the readings in it.
+
+        Malformed lines are skipped and counted; ValueError is raised only
+        when nothing in the data could be decoded.
+        """
+        text = data.decode() if isinstance(data, bytes) else data
+        try:
+            payloads = [json.loads(text)]
+        except ValueError:
+            payloads, malformed = [], 0
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    payloads.append(json.loads(line))
+                except ValueError:
+                    malformed += 1
+            with self._lock:
+                self.malformed += malformed
+            if malformed and not payloads:
+                raise ValueError(f"{malformed} malformed JSON line(s)")
+        return sum(self.ingest(parse_readings(payload)) for payload in payloads)
+
+    def houses(self) -> List[str]:
+        """Return the houses that have reported, sorted."""
+        with self._lock:
+            return sorted(self._houses)
+
+    def latest(self, house: str, sensor: str) -> Optional[Tuple[float, float]]:
+        """Return the newest (timestamp, value) of a house sensor, or None."""
+        buffer = self._buffers.get((house, sensor))
+        if buffer is None:
+            return None
+        with self._lock:
+            return buffer.latest()
+
+    def window(self, house: str, sensor: str, seconds: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Return a house sensor's readings from the last seconds, oldest first."""
+        buffer = self._buffers.get((house, sensor))
+        if buffer is None:
+            return np.array([]), np.array([])
+        with self._lock:
+            newest = buffer.latest()
+            return buffer.since(newest[0] - seconds) if newest else (np.array([]), np.array([]))
+
+    def latest_mean(self, sensor: str) -> Optional[float]:
+        """Return the mean of the newest reading of a sensor across all houses."""
+        values = [reading[1] for reading in (self.latest(house, sensor) for house in self.houses()) if reading]
+        return float(np.mean(values)) if values else None
+
+class UdpListener:
+    """Receives JSON readings as UDP datagrams on a daemon thread."""
+
+    def __init__(self, store: TelemetryStore, host: str = "0.0.0.0", port: int = 0):
+        self.store = store
+        self.host = host
+        self.port = port
+        self._socket: Optional[socket.socket] = None
+
+    def start(self) -> int:
+        """Bind and start receiving; returns the bound port."""
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.bind((self.host, self.port))
+            self.port = self._socket.getsockname()[1]
+            threading.Thread(target=self._run, name="telemetry-udp", daemon=True).start()
+            logger.info(f"Receiving telemetry on udp://{self.host}:{self.port}")
+        return self.port
+
+    def stop(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _run(self) -> None:
+        sock = self._socket
+        while True:
+            try:
+                data, _ = sock.recvfrom(MAX_DATAGRAM)
+            except OSError:
+                return
+            try:
+                self.store.ingest_json(data)
+            except Exception as e:
+                logger.warning(f"Dropped malformed telemetry datagram: {e}")
+
+class FileTail:
+    """
+    Follows a JSON-lines file and stores each new reading.
+
+    Stands in for the MQTT bridge, which appends one JSON message per line.
+    Starts at the end of the file and reopens it after rotation.
+    """
+
+    def __init__(self, store: TelemetryStore, path: Path, interval: float = TAIL_INTERVAL):
+        self.store = store
+        self.path = Path(path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, from_start: bool = False) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, args=(from_start,), name="telemetry-tail", daemon=True)
+            self._thread.start()
+            logger.info(f"Tailing telemetry from {self.path}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, from_start: bool) -> None:
+        handle, inode, partial = None, None, ""
+        while not self._stop.is_set():
+            try:
+                stat = self.path.stat()
+                if handle is None or stat.st_ino != inode or stat.st_size < handle.tell():
+                    if handle:
+                        handle.close()
+                    handle, inode, partial = self.path.open('r'), stat.st_ino, ""
+                    if not from_start:
+                        handle.seek(0, os.SEEK_END)
+                    from_start = True
+                partial += handle.read()
+                lines, _, partial = partial.rpartition("\n")
+                if lines:
+                    try:
+                        self.store.ingest_json(lines)
+                    except Exception as e:
+                        logger.warning(f"Dropped malformed telemetry lines from {self.path}: {e}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Tailing {self.path} failed: {e}")
+            self._stop.wait(self.interval)
+        if handle:
+            handle.close()
+
+def telemetry_route(body: bytes) -> Tuple[int, str, bytes]:
+    """Accept readings POSTed as JSON or JSON lines."""
+    try:
+        accepted = telemetry.ingest_json(body)
+    except (ValueError, UnicodeDecodeError) as e:
+        return 400, "application/json", json.dumps({'error': f"Invalid telemetry: {e}"}).encode()
+    return 202, "application/json", json.dumps({'accepted': accepted}).encode()
+
+_listeners: List[object] = []
+_listeners_started = False
+_listeners_lock = threading.Lock()
+
+def start_listeners() -> None:
+    """
+    Start the UDP listener and file tail configured in the environment.
+
+    TELEMETRY_UDP_PORT enables UDP and TELEMETRY_TAIL_PATH the file tail.
+    Both feed the same store, limited to TELEMETRY_HOUSES when it is set.
+    Safe to call on every run; listeners start once per process.
+    """
+    global _listeners_started
+    with _listeners_lock:
+        if _listeners_started:
+            return
+        _listeners_started = True
+        udp_port = os.environ.get("TELEMETRY_UDP_PORT")
+        if udp_port:
+            listener = UdpListener(telemetry, os.environ.get("TELEMETRY_UDP_HOST", "0.0.0.0"), int(udp_port))
+            try:
+                listener.start()
+                _listeners.append(listener)
+            except OSError as e:
+                logger.warning(f"Telemetry UDP listener not started on port {udp_port}: {e}")
+        tail_path = os.environ.get("TELEMETRY_TAIL_PATH")
+        if tail_path:
+            tail = FileTail(telemetry, Path(tail_path))
+            tail.start()
+            _listeners.append(tail)
+
+def configured_houses() -> Optional[List[str]]:
+    """Return the house IDs listed in TELEMETRY_HOUSES (comma-separated), or None to accept any."""
+    houses = [house.strip() for house in os.environ.get("TELEMETRY_HOUSES", "").split(",") if house.strip()]
+    return houses or None
+
+# Create the process-wide telemetry store shared by all sessions
+telemetry = TelemetryStore(allowed_houses=configured_houses())
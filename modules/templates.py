@@ -0,0 +1,59 @@
+import streamlit as st
+import html
+from string import Formatter
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+# URL schemes allowed in href attributes; anything else renders as "#"
+SAFE_URL_SCHEMES = ("http://", "https://", "mailto:")
+
+class Markup(str):
+    """Trusted HTML that templates insert without escaping."""
+
+def escape(value: Any) -> str:
+    """Escape a value for HTML text or a quoted attribute, keeping line breaks."""
+    if isinstance(value, Markup):
+        return value
+    return html.escape(str(value), quote=True).replace("\n", "<br>")
+
+def safe_url(url: Any) -> str:
+    """Return url if it uses an allowed scheme, otherwise a harmless placeholder."""
+    url = str(url or "").strip()
+    return url if url.lower().startswith(SAFE_URL_SCHEMES) else "#"
+
+class HtmlTemplate:
+    """
+    An HTML snippet with str.format-style fields, parsed once at import.
+
+    Every field is HTML-escaped unless the value is Markup. Indentation is
+    removed at compile time so that rendered snippets stay a single HTML
+    block when Streamlit parses them as markdown.
+    """
+
+    def __init__(self, source: str):
+        """Compile the template source."""
+        source = "\n".join(line.strip() for line in source.strip().splitlines() if line.strip())
+        self._parts: List[Tuple[str, Optional[str], str]] = [
+            (literal, field, spec or "")
+            for literal, field, spec, _ in Formatter().parse(source)
+        ]
+
+    def render(self, values: Optional[Mapping[str, Any]] = None, **kwargs) -> str:
+        """Render the template with escaped values."""
+        values = {**(values or {}), **kwargs}
+        out = []
+        for literal, field, spec in self._parts:
+            out.append(literal)
+            if field is not None:
+                value = values[field]
+                out.append(escape(format(value, spec) if spec else value))
+        return "".join(out)
+
+    def render_many(self, items: Iterable[Mapping[str, Any]], separator: str = "\n") -> str:
+        """Render the template once per item and join the results."""
+        return separator.join(self.render(item) for item in items)
+
+def markdown_list(template: HtmlTemplate, items: Iterable[Mapping[str, Any]], separator: str = "\n") -> None:
+    """Render a list of items as one markdown element instead of one per item."""
+    body = template.render_many(items, separator)
+    if body:
+        st.markdown(body, unsafe_allow_html=True)
@@ -1,28 +1,40 @@
 import streamlit as st
 import requests
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import logging
+from .http_client import http_client
+from .cache import response_cache
+from .pipeline import Deadline, fetch_concurrently
+from .geocode import MIN_QUERY_LENGTH, geocode_index, normalize_name
+from .startup_profile import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# Seconds shared by the current weather and forecast requests of one forecast view
+FORECAST_DEADLINE = 10
+
 def kelvin_to_celsius(kelvin):
     return kelvin - 273.15
 
 def get_weather_icon(icon_code):
     return f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
 
+def fetch_json(url: str, timeout: float = None) -> dict:
+    """Fetch an OpenWeather payload through the shared client and cache."""
+    def fetch():
+        response = http_client.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    return response_cache.get_or_fetch("weather", url, fetch=fetch)
+
 def get_weather_data(lat: float = 0, lon: float = 0) -> dict:
     """Fetch weather data from OpenWeather API with error handling."""
     try:
         api_key = st.secrets["openweather_api_key"]
         url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={api_key}&units=metric"
         
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return fetch_json(url)
     except KeyError:
         logger.error("OpenWeather API key not found in secrets")
         return {"error": "API key not configured"}
@@ -30,11 +42,12 @@ def get_weather_data(lat: float = 0, lon: float = 0) -> dict:
         logger.error(f"Weather API request failed: {str(e)}")
         return {"error": "Weather service temporarily unavailable"}
 
-def display_weather_widget():
+def display_weather_widget(lat: float = 14.5995, lon: float = 120.9842, weather_data: dict = None):
     """Display weather information with error handling."""
     try:
-        # Default coordinates (can be updated based on user location)
-        weather_data = get_weather_data(14.5995, 120.9842)  # Manila coordinates
+        # Defaults to Manila coordinates; callers holding a snapshot pass it in
+        if weather_data is None:
+            weather_data = get_weather_data(lat, lon)
         
         if "error" in weather_data:
             st.warning(weather_data["error"])
@@ -61,12 +74,27 @@ def show_weather_module():
     st.markdown("## Weather Monitoring")
     
     try:
-        # Location selector (can be enhanced with geocoding)
-        st.selectbox("Select Location", ["Manila", "Cebu", "Davao"], key="weather_location")
+        # Location selector, resolved against the local geocode index; the
+        # geocoding API is only asked when the user submits an unknown name
+        query = st.text_input("Search Location", key="weather_location_query",
+                              placeholder="Start typing a farm location...")
+        matches = geocode_index.prefix_search(query) if query else []
+        if query and not matches:
+            if len(normalize_name(query)) < MIN_QUERY_LENGTH:
+                st.caption(f"Type at least {MIN_QUERY_LENGTH} characters to search online.")
+            elif st.button("Search online", key="weather_location_lookup"):
+                resolved = geocode_index.resolve(query, st.secrets["openweather_api_key"])
+                if resolved:
+                    st.session_state.weather_location = resolved["name"]
+                else:
+                    st.warning("Location not found. Showing saved locations instead.")
+        options = [match["name"] for match in matches] or geocode_index.names()
+        selected = st.selectbox("Select Location", options, key="weather_location")
+        location = geocode_index.get(selected)
         
         # Current conditions
         st.markdown("### Current Conditions")
-        display_weather_widget()
+        display_weather_widget(location["lat"], location["lon"])
         
         # Forecast section
         st.markdown("### 5-Day Forecast")
@@ -85,26 +113,31 @@ def show_forecast(location=None):
     
     try:
         # Get coordinates for the location
-        geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={location}&limit=1&appid={api_key}"
-        geo_response = requests.get(geo_url)
-        geo_data = geo_response.json()
+        coordinates = geocode_index.resolve(location, api_key)
         
-        if not geo_data:
+        if not coordinates:
             st.error("Location not found. Please try another location.")
             return
             
-        lat = geo_data[0]['lat']
-        lon = geo_data[0]['lon']
+        lat = coordinates['lat']
+        lon = coordinates['lon']
         
-        # Get current weather
+        # Current weather and 5-day forecast only depend on the coordinates,
+        # so fetch both in parallel under one deadline
         current_url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={api_key}"
-        current_response = requests.get(current_url)
-        current_data = current_response.json()
-        
-        # Get 5-day forecast
         forecast_url = f"https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&appid={api_key}"
-        forecast_response = requests.get(forecast_url)
-        forecast_data = forecast_response.json()
+        deadline = Deadline(FORECAST_DEADLINE)
+        results, errors = fetch_concurrently({
+            'current': lambda: fetch_json(current_url, timeout=deadline.remaining(minimum=0.1)),
+            'forecast': lambda: fetch_json(forecast_url, timeout=deadline.remaining(minimum=0.1)),
+        }, deadline)
+        
+        if errors:
+            st.error("Weather service temporarily unavailable. Please try again later.")
+            return
+            
+        current_data = results['current']
+        forecast_data = results['forecast']
         
         # Display current weather in a modern card
         st.markdown("""
@@ -153,7 +186,8 @@ def show_forecast(location=None):
             humidity.append(item['main']['humidity'])
             icons.append(item['weather'][0]['icon'])
         
-        # Create temperature chart
+        # Create temperature chart; plotly is only imported once a forecast is shown
+        go = lazy_import("plotly.graph_objects")
         fig = go.Figure()
         
         # Add temperature line
@@ -0,0 +1,21 @@
+import sys
+
+from streamlit.web import cli as stcli
+
+from modules.ops_server import ops_server
+from modules.telemetry import start_listeners
+
+def main() -> int:
+    """
+    Start the ops endpoints and telemetry listeners, then Streamlit, in one process.
+
+    Probes can reach /livez and /readyz before the first session, and the
+    app script shares the same ops server, cache and breakers.
+    """
+    ops_server.start()
+    start_listeners()
+    sys.argv = ["streamlit", "run", "app.py", *sys.argv[1:]]
+    return stcli.main()
+
+if __name__ == "__main__":
+    sys.exit(main())
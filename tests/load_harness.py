@@ -0,0 +1,275 @@
+"""
+Concurrent-session load harness for app.py.
+
+Drives simulated sessions through page flows with Streamlit's AppTest while
+every upstream HTTP call is answered by a local stand-in server that adds
+latency. Reports rerun latency percentiles, throughput and peak RSS.
+
+AppTest swaps a process-global runtime in and out around each run, so every
+simulated session runs in its own worker process. Process-wide state such
+as the response cache is therefore per session here, unlike in production.
+
+Usage:
+    python -m tests.load_harness --sessions 8 --iterations 3 --latency 0.2
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import numpy as np
+import requests
+import toml
+from requests.adapters import HTTPAdapter
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from streamlit.testing.v1 import AppTest
+from modules.cache import response_cache
+from modules.http_client import http_client
+from modules.ops_server import ops_server
+
+APP_PATH = str(PROJECT_ROOT / "app.py")
+SECRETS_PATH = PROJECT_ROOT / ".streamlit" / "secrets.toml"
+# Pages visited by every simulated session, in order
+DEFAULT_FLOW = ["Dashboard", "Weather", "News", "Collaboration", "Dashboard"]
+# Seconds a single rerun may take before AppTest gives up
+RERUN_TIMEOUT = 60
+
+UPSTREAM_HEADER = "X-Upstream-Host"
+
+def sample_payload(host: str, path: str) -> object:
+    """Return a canned response body for an upstream endpoint."""
+    if "openweathermap" in host:
+        if path.startswith("/geo"):
+            return [{"name": "Manila", "lat": 14.5995, "lon": 120.9842, "country": "PH"}]
+        if path.endswith("/forecast"):
+            return {"list": [
+                {"dt_txt": f"2024-03-{17 + i // 8:02d} {(i % 8) * 3:02d}:00:00",
+                 "main": {"temp": 28 + i % 5, "humidity": 70 + i % 10},
+                 "weather": [{"description": "scattered clouds", "icon": "03d"}],
+                 "wind": {"speed": 3.2}}
+                for i in range(40)
+            ]}
+        return {"name": "Manila", "main": {"temp": 29.5, "humidity": 74, "feels_like": 33.1},
+                "weather": [{"description": "scattered clouds", "icon": "03d"}], "wind": {"speed": 3.2}}
+    if "newsapi" in host:
+        return {"status": "ok", "articles": [
+            {"title": f"Poultry market update {i}", "description": "Feed prices steady across regions.",
+             "url": f"https://example.com/news/{i}", "urlToImage": None,
+             "publishedAt": "2024-03-17T09:30:00Z", "source": {"name": "Farm Wire"}}
+            for i in range(20)
+        ]}
+    if "data.gov.in" in host:
+        return {"total": 0, "records": []}
+    if "lottie" in host:
+        return {"v": "5.5.7", "fr": 30, "ip": 0, "op": 60, "w": 100, "h": 100, "layers": []}
+    return {}
+
+class StandInUpstream:
+    """Local HTTP server answering for every upstream host after a delay."""
+
+    def __init__(self, latency: float = 0.1, jitter: float = 0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> str:
+        """Start serving on a free local port and return its base URL."""
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with upstream._lock:
+                    upstream.requests += 1
+                time.sleep(max(0.0, upstream.latency + random.uniform(-upstream.jitter, upstream.jitter)))
+                body = json.dumps(sample_payload(self.headers.get(UPSTREAM_HEADER, ""), urlsplit(self.path).path)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+class RewritingAdapter(HTTPAdapter):
+    """Sends every request to the stand-in server, keeping path, query and original host."""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url.rstrip("/")
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.headers[UPSTREAM_HEADER] = parts.netloc
+        request.url = f"{self.base_url}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+        return super().send(request, **kwargs)
+
+def route_upstreams_to(base_url: str) -> Dict[str, requests.adapters.BaseAdapter]:
+    """Point the shared HTTP client at the stand-in server; returns the adapters to restore."""
+    previous = dict(http_client.session.adapters)
+    adapter = RewritingAdapter(base_url, pool_maxsize=64)
+    http_client.session.mount("https://", adapter)
+    http_client.session.mount("http://", adapter)
+    return previous
+
+def load_secrets() -> dict:
+    """Load the app secrets, with [general] keys also available at the top level."""
+    secrets = toml.load(SECRETS_PATH) if SECRETS_PATH.exists() else {}
+    for key, value in secrets.get("general", {}).items():
+        secrets.setdefault(key, value)
+    return secrets
+
+def run_session(flow: List[str], iterations: int, secrets: dict, latencies: List[float], errors: List[str]) -> None:
+    """Walk one simulated session through the flow, recording each rerun's latency."""
+    at = AppTest.from_file(APP_PATH, default_timeout=RERUN_TIMEOUT)
+    for key, value in secrets.items():
+        at.secrets[key] = value
+    for _ in range(iterations):
+        for page in flow:
+            at.query_params["page"] = page
+            start = time.perf_counter()
+            try:
+                at.run()
+            except Exception as e:
+                errors.append(f"{page}: {e}")
+                continue
+            latencies.append(time.perf_counter() - start)
+            # main() catches page failures and renders them with st.error
+            errors.extend(f"{page}: {element.value}" for element in [*at.exception, *at.error])
+
+def side_services_disabled() -> ExitStack:
+    """
+    Keep app.py from starting the ops server and telemetry listeners.
+
+    Every session runs in its own worker process, where they would bind the
+    same fixed ports and add threads production only starts once.
+    """
+    stack = ExitStack()
+    stack.enter_context(patch.object(ops_server, "start", return_value=False))
+    stack.enter_context(patch("modules.telemetry.start_listeners"))
+    return stack
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def session_worker(base_url: str, flow: List[str], iterations: int, cold_cache: bool,
+                   ready: "multiprocessing.synchronize.Barrier") -> Tuple[List[float], List[str], float, float, float]:
+    """
+    Run one simulated session in a worker process.
+
+    Returns its rerun latencies, errors, start and end wall-clock times and peak RSS.
+    """
+    logging.basicConfig(level=logging.ERROR)
+    route_upstreams_to(base_url)
+    if cold_cache:
+        response_cache.clear()
+    latencies: List[float] = []
+    errors: List[str] = []
+    # Start every session's flow at the same moment
+    ready.wait()
+    start = time.time()
+    with side_services_disabled():
+        run_session(flow, iterations, load_secrets(), latencies, errors)
+    return latencies, errors, start, time.time(), peak_rss_mb()
+
+def summarize(latencies: List[float], wall_time: float, errors: List[str], upstream_requests: int,
+              session_rss_mb: List[float]) -> dict:
+    """Build the report of one load run."""
+    samples = np.array(latencies) if latencies else np.zeros(1)
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "p50_ms": round(p50 * 1000, 1),
+        "p95_ms": round(p95 * 1000, 1),
+        "p99_ms": round(p99 * 1000, 1),
+        "max_ms": round(float(samples.max()) * 1000, 1),
+        "throughput_rps": round(len(latencies) / wall_time, 2) if wall_time else 0.0,
+        "upstream_requests": upstream_requests,
+        "peak_rss_mb_per_session": round(max(session_rss_mb, default=0.0), 1),
+        "peak_rss_mb_total": round(sum(session_rss_mb), 1),
+    }
+
+def run_load(sessions: int = 4, iterations: int = 1, flow: Optional[List[str]] = None,
+             latency: float = 0.1, jitter: float = 0.0, cold_cache: bool = True) -> dict:
+    """Run the given number of concurrent sessions and return the report."""
+    flow = flow or DEFAULT_FLOW
+    upstream = StandInUpstream(latency, jitter)
+    base_url = upstream.start()
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    rss: List[float] = []
+    starts, ends = [], []
+    context = multiprocessing.get_context("spawn")
+    manager = context.Manager()
+    try:
+        ready = manager.Barrier(sessions)
+        with ProcessPoolExecutor(max_workers=sessions, mp_context=context) as pool:
+            futures = [pool.submit(session_worker, base_url, flow, iterations, cold_cache, ready) for _ in range(sessions)]
+            for future in futures:
+                session_latencies, session_errors, start, end, session_rss = future.result()
+                latencies += session_latencies
+                errors += session_errors
+                starts.append(start)
+                ends.append(end)
+                rss.append(session_rss)
+    finally:
+        manager.shutdown()
+        upstream.stop()
+
+    for error in errors[:5]:
+        logging.getLogger(__name__).warning(f"Session error: {error}")
+    return summarize(latencies, max(ends) - min(starts), errors, upstream.requests, rss)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drive concurrent AppTest sessions against stand-in upstreams.")
+    parser.add_argument("--sessions", type=int, default=4, help="concurrent simulated sessions")
+    parser.add_argument("--iterations", type=int, default=1, help="times each session walks the flow")
+    parser.add_argument("--flow", default=",".join(DEFAULT_FLOW), help="comma-separated page names")
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds added to every upstream response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- seconds added to the latency")
+    parser.add_argument("--warm-cache", action="store_true", help="keep cached upstream responses from earlier runs")
+    parser.add_argument("--max-p95-ms", type=float, help="exit non-zero if p95 exceeds this budget")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = run_load(args.sessions, args.iterations, args.flow.split(","), args.latency, args.jitter, not args.warm_cache)
+    print(json.dumps(report, indent=2))
+    if report["errors"] or (args.max_p95_ms is not None and report["p95_ms"] > args.max_p95_ms):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
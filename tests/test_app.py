@@ -3,11 +3,16 @@ from unittest.mock import patch, MagicMock
 import sys
 import os
 import json
+import subprocess
+import threading
+import time
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import load_lottie_url
+from streamlit.testing.v1 import AppTest
+from app import load_lottie_url, page_index, prefetch_dashboard_sources
+from modules.refresher import BackgroundRefresher
 
 class TestPoultryInnovate(unittest.TestCase):
     """Test cases for the PoultryInnovate application."""
@@ -17,7 +22,7 @@ class TestPoultryInnovate(unittest.TestCase):
         self.test_url = "https://assets5.lottiefiles.com/packages/lf20_GofK09iPAE.json"
         self.mock_lottie_data = {"v": "5.5.7", "fr": 60, "ip": 0, "op": 180, "w": 512, "h": 512}
 
-    @patch('requests.get')
+    @patch('app.http_client.get')
     def test_load_lottie_url_success(self, mock_get):
         """Test successful loading of Lottie animation."""
         # Configure the mock
@@ -33,7 +38,7 @@ class TestPoultryInnovate(unittest.TestCase):
         self.assertEqual(result, self.mock_lottie_data)
         mock_get.assert_called_once_with(self.test_url)
 
-    @patch('requests.get')
+    @patch('app.http_client.get')
     def test_load_lottie_url_failure(self, mock_get):
         """Test failed loading of Lottie animation."""
         # Configure the mock to raise an exception
@@ -46,7 +51,7 @@ class TestPoultryInnovate(unittest.TestCase):
         self.assertIsNone(result)
         mock_get.assert_called_once_with(self.test_url)
 
-    @patch('requests.get')
+    @patch('app.http_client.get')
     def test_load_lottie_url_bad_status(self, mock_get):
         """Test loading Lottie animation with bad HTTP status."""
         # Configure the mock
@@ -61,5 +66,116 @@ class TestPoultryInnovate(unittest.TestCase):
         self.assertIsNone(result)
         mock_get.assert_called_once_with(self.test_url)
 
+    def test_dashboard_card_failure_is_isolated(self):
+        """A failing dashboard card shows a warning without hiding the others."""
+        def script():
+            import streamlit as st
+            from app import dashboard_card
+
+            @dashboard_card()
+            def broken_card():
+                raise ValueError("upstream down")
+
+            @dashboard_card(run_every=60)
+            def working_card():
+                st.write("Still here")
+
+            broken_card()
+            working_card()
+
+        at = AppTest.from_function(script, default_timeout=30)
+        at.run()
+        self.assertFalse(at.exception)
+        self.assertEqual([w.value for w in at.warning], ["This section is temporarily unavailable"])
+        self.assertIn("Still here", [m.value for m in at.markdown])
+
+    def test_page_index_from_query_param(self):
+        """?page= names select their menu entry; unknown names fall back to the dashboard."""
+        self.assertEqual(page_index("weather"), page_index("Weather"))
+        self.assertGreater(page_index("News"), 0)
+        self.assertEqual(page_index("nowhere"), 0)
+        self.assertEqual(page_index(None), 0)
+
+    def test_prefetch_is_bounded_by_the_deadline(self):
+        """Sources load in parallel, and one that misses the deadline is left loading."""
+        refresher = BackgroundRefresher()
+        def slow(value, delay):
+            def load():
+                time.sleep(delay)
+                return value
+            return load
+        refresher.register('weather', slow({'temp': 25}, 0.3), soft_ttl=60, hard_ttl=300)
+        refresher.register('news', slow({'articles': []}, 0.3), soft_ttl=60, hard_ttl=300)
+        refresher.register('market', slow({'data': {}}, 5), soft_ttl=60, hard_ttl=300)
+
+        with patch('app.refresher', refresher):
+            start = time.monotonic()
+            snapshots = prefetch_dashboard_sources(deadline=1)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(set(snapshots), {'weather', 'news'})
+        self.assertLess(elapsed, 1.5)
+        self.assertTrue(refresher.loading('market'))
+
+    def test_other_pages_do_not_load_dashboard_sources(self):
+        """Visiting Collaboration neither registers nor imports the dashboard's weather and news sources."""
+        script = (
+            "import sys\n"
+            "from streamlit.testing.v1 import AppTest\n"
+            "from modules.refresher import refresher\n"
+            "at = AppTest.from_file('app.py', default_timeout=60)\n"
+            "at.query_params['page'] = 'Collaboration'\n"
+            "at.run()\n"
+            "print(refresher.registered('weather'), 'modules.weather' in sys.modules, 'modules.news' in sys.modules)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False False False", result.stderr[-2000:])
+
+    def test_loading_card_appears_when_its_source_arrives(self):
+        """A card whose source missed the deadline polls and re-runs once the snapshot is in."""
+        refresher = BackgroundRefresher()
+        release = threading.Event()
+        def slow():
+            release.wait(5)
+            return {'articles': []}
+        refresher.register('news', slow, soft_ttl=60, hard_ttl=300)
+
+        def script():
+            import streamlit as st
+            import app
+            if app.refresher.snapshot('news') is not None:
+                st.write("news ready")
+            else:
+                app.show_source_placeholder('news', "News")
+
+        with patch('app.refresher', refresher):
+            refresher.schedule('news')
+            at = AppTest.from_function(script)
+            at.run()
+            self.assertEqual([info.value for info in at.info], ["Loading news..."])
+            release.set()
+            refresher._executor.shutdown(wait=True)
+            at.run()
+        self.assertEqual([markdown.value for markdown in at.markdown], ["news ready"])
+
+    def test_poll_reruns_once_the_snapshot_is_in(self):
+        """The loading poll re-runs the app when it finds the source's first snapshot."""
+        refresher = BackgroundRefresher()
+        refresher.register('news', lambda: {'articles': []}, soft_ttl=60, hard_ttl=300)
+        refresher.refresh('news')
+
+        def script():
+            import streamlit as st
+            import app
+            st.session_state.runs = st.session_state.get('runs', 0) + 1
+            if st.session_state.runs == 1:
+                app.wait_for_source('news', "News")
+
+        with patch('app.refresher', refresher):
+            at = AppTest.from_function(script)
+            at.run()
+        self.assertEqual(at.session_state.runs, 2)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.assets import RETRY_INTERVAL, LottieAssetLoader
+
+class TestLottieAssetLoader(unittest.TestCase):
+    """Test cases for the cached Lottie asset loader."""
+
+    def setUp(self):
+        """Set up a loader with temporary bundled and cache directories."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.bundled_dir = Path(self.tmp.name) / "bundled"
+        self.cache_dir = Path(self.tmp.name) / "cache"
+        self.bundled_dir.mkdir()
+        with open(self.bundled_dir / "chicken.json", "w") as f:
+            json.dump({"nm": "bundled"}, f)
+        self.url = "https://lottie.host/chicken.json"
+        self.fetch = MagicMock(return_value={"nm": "remote"})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_loader(self):
+        return LottieAssetLoader(self.fetch, self.bundled_dir, self.cache_dir)
+
+    def test_first_paint_uses_bundled_default(self):
+        """The first lookup returns the bundled animation and fetches in the background."""
+        loader = self.make_loader()
+        self.assertEqual(loader.get(self.url, default="chicken"), {"nm": "bundled"})
+        loader._executor.shutdown(wait=True)
+        self.fetch.assert_called_once_with(self.url)
+        self.assertEqual(loader.get(self.url, default="chicken"), {"nm": "remote"})
+
+    def test_fetched_copy_survives_restart(self):
+        """A fetched animation is served from disk by a new loader."""
+        loader = self.make_loader()
+        loader.get(self.url, default="chicken")
+        loader._executor.shutdown(wait=True)
+
+        self.fetch.reset_mock()
+        restarted = self.make_loader()
+        self.assertEqual(restarted.get(self.url, default="chicken"), {"nm": "remote"})
+        restarted._executor.shutdown(wait=True)
+        self.fetch.assert_not_called()
+
+    def test_corrupt_cache_ignored(self):
+        """A cached file whose hash does not match its content is ignored."""
+        loader = self.make_loader()
+        self.cache_dir.mkdir()
+        with open(loader._cache_path(self.url), "w") as f:
+            json.dump({"sha256": "0" * 64, "animation": {"nm": "tampered"}}, f)
+        self.fetch.return_value = None
+        self.assertEqual(loader.get(self.url, default="chicken"), {"nm": "bundled"})
+
+    def test_failed_fetch_backs_off(self):
+        """A failed fetch is not retried on every lookup, and waits longer after each failure."""
+        self.fetch.return_value = None
+        loader = self.make_loader()
+        now = 1_000_000.0
+
+        def lookup_at(moment):
+            with patch('modules.assets.time.time', return_value=moment):
+                loader.get(self.url, default="chicken")
+                while loader._refreshing:
+                    loader._executor.submit(lambda: None).result()
+
+        lookup_at(now)
+        lookup_at(now + 1)
+        self.assertEqual(self.fetch.call_count, 1)
+        lookup_at(now + RETRY_INTERVAL)
+        self.assertEqual(self.fetch.call_count, 2)
+        lookup_at(now + RETRY_INTERVAL * 2)
+        self.assertEqual(self.fetch.call_count, 2)
+        lookup_at(now + RETRY_INTERVAL * 3)
+        self.assertEqual(self.fetch.call_count, 3)
+
+        self.fetch.return_value = {"nm": "remote"}
+        lookup_at(now + RETRY_INTERVAL * 7)
+        self.assertEqual(loader.get(self.url), {"nm": "remote"})
+        self.assertNotIn(self.url, loader._retries)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cache import ResponseCache
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the shared response cache."""
+
+    def setUp(self):
+        """Set up a fresh cache for each test."""
+        self.cache = ResponseCache(default_ttl=60, source_ttls={'news': 120})
+        self.url = "https://newsapi.org/v2/everything"
+
+    def test_key_ignores_param_order_and_credentials(self):
+        """Equivalent requests share a key and never include API keys."""
+        key1 = ResponseCache.make_key('news', self.url, {'q': 'poultry', 'apiKey': 'secret'})
+        key2 = ResponseCache.make_key('news', self.url + '?apiKey=other', {'q': 'poultry'})
+        self.assertEqual(key1, key2)
+        self.assertNotIn('secret', key1)
+
+    def test_get_or_fetch_calls_upstream_once(self):
+        """A second call within the TTL is served from the cache."""
+        fetch = MagicMock(return_value={'articles': []})
+        self.cache.get_or_fetch('news', self.url, {'q': 'poultry'}, fetch)
+        result = self.cache.get_or_fetch('news', self.url, {'q': 'poultry'}, fetch)
+        self.assertEqual(result, {'articles': []})
+        fetch.assert_called_once()
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_expired_entries_are_refetched(self):
+        """Entries older than their TTL are treated as misses."""
+        self.cache.set('k', {'v': 1}, ttl=10)
+        with patch('modules.cache.time.time', return_value=10**12):
+            self.assertIsNone(self.cache.get('k'))
+
+    def test_source_ttl(self):
+        """Per-source TTLs fall back to the default."""
+        self.assertEqual(self.cache.ttl_for('news'), 120)
+        self.assertEqual(self.cache.ttl_for('weather'), 60)
+
+    def test_lru_eviction_under_memory_cap(self):
+        """The least recently used entry is evicted when the cap is exceeded."""
+        cache = ResponseCache(max_bytes=60)
+        cache.set('a', {'v': 'x' * 20}, ttl=60)
+        cache.set('b', {'v': 'y' * 20}, ttl=60)
+        cache.get('a')
+        cache.set('c', {'v': 'z' * 20}, ttl=60)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+    def test_persistence(self):
+        """Persisted entries survive a new cache instance."""
+        with tempfile.TemporaryDirectory() as tmp:
+            ResponseCache(persist_dir=tmp).set('k', {'v': 1}, ttl=60)
+            self.assertEqual(ResponseCache(persist_dir=tmp).get('k'), {'v': 1})
+
+    def test_loaded_entries_respect_memory_cap(self):
+        """Entries read back from disk evict older ones like new entries do."""
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = ResponseCache(persist_dir=tmp)
+            for key in ('a', 'b', 'c'):
+                writer.set(key, {'v': key * 20}, ttl=60)
+            cache = ResponseCache(max_bytes=60, persist_dir=tmp)
+            for key in ('a', 'b', 'c'):
+                self.assertEqual(cache.get(key), {'v': key * 20})
+            self.assertLessEqual(cache.stats()['bytes'], 60)
+            self.assertEqual(cache.stats()['entries'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
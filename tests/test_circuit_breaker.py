@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+import requests
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.circuit_breaker import CircuitBreaker, breaker_states
+from modules.api_config import api_error_handler, get_dummy_response
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the upstream circuit breaker."""
+
+    def setUp(self):
+        """Set up a breaker that opens after two failures."""
+        self.breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+
+    def test_opens_after_threshold(self):
+        """Consecutive failures open the circuit and count a trip."""
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.snapshot(), {'state': 'open', 'failures': 2, 'trips': 1})
+
+    def test_half_open_probe(self):
+        """After the reset timeout a single probe is let through and closes the circuit."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.opened_at -= 31
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+class TestApiErrorHandler(unittest.TestCase):
+    """Test cases for the retrying, circuit-breaking decorator."""
+
+    @patch('modules.api_config.time.sleep')
+    def test_open_circuit_skips_upstream(self, mock_sleep):
+        """Once the circuit opens, calls return dummy data without calling upstream."""
+        upstream = MagicMock(side_effect=requests.exceptions.ConnectionError("down"))
+        upstream.__name__ = 'get_weather'
+        handled = api_error_handler(upstream, upstream='test_outage', deadline=60)
+
+        for _ in range(3):
+            self.assertEqual(handled()['main'], get_dummy_response('get_weather')['main'])
+        calls = upstream.call_count
+        handled()
+
+        self.assertEqual(upstream.call_count, calls)
+        self.assertEqual(breaker_states()['test_outage']['state'], 'open')
+        self.assertTrue(all(call.args[0] <= 1.0 for call in mock_sleep.call_args_list))
+
+    def test_probe_released_after_unexpected_error(self):
+        """A half-open probe that raises something other than a request error lets the next probe through."""
+        upstream = MagicMock(side_effect=ValueError("bad payload"))
+        upstream.__name__ = 'get_weather'
+        handled = api_error_handler(upstream, upstream='test_probe_error')
+        breaker = CircuitBreaker('test_probe_error', failure_threshold=1)
+        breaker.record_failure()
+        breaker.opened_at -= breaker.reset_timeout
+
+        with patch('modules.api_config.get_breaker', return_value=breaker):
+            with self.assertRaises(ValueError):
+                handled()
+            upstream.side_effect = None
+            upstream.return_value = {'ok': True}
+            self.assertEqual(handled(), {'ok': True})
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest
+from modules.collaboration import PostIndex
+
+def make_post(post_id, minute):
+    """Build a post created at the given minute."""
+    return {
+        "id": post_id,
+        "author": "john.doe",
+        "content": f"Post {post_id}",
+        "timestamp": f"2024-03-17 09:{minute:02d}:00",
+        "likes": 0,
+        "comments": [],
+        "image": None
+    }
+
+class TestPostIndex(unittest.TestCase):
+    """Test cases for cursor-based feed paging."""
+
+    def setUp(self):
+        """Index 25 posts added out of order."""
+        self.index = PostIndex(make_post(i, i) for i in reversed(range(25)))
+
+    def test_pages_are_newest_first(self):
+        """Walking the cursors visits every post once, newest first."""
+        seen, cursor = [], None
+        while True:
+            posts, cursor = self.index.page(cursor, limit=10)
+            seen.append([post["id"] for post in posts])
+            if cursor is None:
+                break
+        self.assertEqual([len(page) for page in seen], [10, 10, 5])
+        self.assertEqual(sum(seen, []), list(reversed(range(25))))
+
+    def test_new_posts_do_not_shift_pages(self):
+        """A cursor keeps pointing at the same older posts after new posts arrive."""
+        _, cursor = self.index.page(limit=10)
+        self.index.add(make_post(99, 59))
+        posts, _ = self.index.page(cursor, limit=10)
+        self.assertEqual(posts[0]["id"], 14)
+        self.assertEqual(self.index.page(limit=1)[0][0]["id"], 99)
+        self.assertEqual(len(self.index), 26)
+
+    def test_feed_only_renders_one_page(self):
+        """Only the visible window of the feed creates post widgets."""
+        def script():
+            import streamlit as st
+            from modules import collaboration
+            from tests.test_collaboration_feed import make_post
+            if "posts" not in st.session_state:
+                st.session_state.posts = [make_post(i, i) for i in range(25)]
+            collaboration.init_session_state()
+            collaboration.show_feed()
+
+        at = AppTest.from_function(script)
+        at.run()
+        likes = [button for button in at.button if button.key.startswith("like_")]
+        self.assertEqual([button.key for button in likes], [f"like_{i}" for i in range(24, 14, -1)])
+
+        at.button(key="feed_older").click().run()
+        at.button(key="feed_older").click().run()
+        likes = [button.key for button in at.button if button.key.startswith("like_")]
+        self.assertEqual(likes, [f"like_{i}" for i in range(4, -1, -1)])
+        self.assertTrue(at.button(key="feed_older").disabled)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.api_client import DataGovClient, PageCheckpoint
+
+TOTAL_RECORDS = 25
+
+def fake_page(offset, limit):
+    """Return a slice of a fake resource of TOTAL_RECORDS rows."""
+    return [{'date': f'2024-01-{i % 28 + 1:02d}', 'row': i} for i in range(offset, min(offset + limit, TOTAL_RECORDS))]
+
+class TestDataGovPaginator(unittest.TestCase):
+    """Test cases for the concurrent data.gov.in paginator."""
+
+    def setUp(self):
+        """Set up a client with fake credentials."""
+        self.client = DataGovClient()
+        self.client.api_key = "key"
+        self.client.resource_id = "resource"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = PageCheckpoint(Path(self.tmp.name) / "checkpoints.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_in_order(self):
+        """Records are yielded in offset order across concurrent pages."""
+        with patch.object(DataGovClient, 'fetch_page', side_effect=fake_page):
+            rows = [record['row'] for record in self.client.iter_records(page_size=4, max_workers=3)]
+        self.assertEqual(rows, list(range(TOTAL_RECORDS)))
+
+    def test_bounded_parallelism(self):
+        """No more than max_workers pages are in flight at once."""
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def tracked_page(offset, limit):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            try:
+                return fake_page(offset, limit)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        with patch.object(DataGovClient, 'fetch_page', side_effect=tracked_page):
+            list(self.client.iter_records(page_size=2, max_workers=2))
+        self.assertLessEqual(in_flight[1], 2)
+
+    def test_resume_from_checkpoint(self):
+        """An interrupted sync resumes from the last committed page."""
+        with patch.object(DataGovClient, 'fetch_page', side_effect=fake_page):
+            pages = self.client.iter_pages(page_size=5, max_workers=2, checkpoint=self.checkpoint)
+            next(pages)
+            next(pages)
+            pages.close()
+            self.assertEqual(self.checkpoint.load("resource"), 5)
+
+            rows = [record['row'] for record in self.client.iter_records(page_size=5, checkpoint=self.checkpoint)]
+        self.assertEqual(rows, list(range(5, TOTAL_RECORDS)))
+        self.assertEqual(self.checkpoint.load("resource"), TOTAL_RECORDS)
+
+    def test_frames(self):
+        """Frames are yielded one per non-empty page."""
+        with patch.object(DataGovClient, 'fetch_page', side_effect=fake_page):
+            frames = list(self.client.iter_frames(page_size=10))
+        self.assertEqual([len(frame) for frame in frames], [10, 10, 5])
+
+class TestProcessData(unittest.TestCase):
+    """Test cases for the columnar record processing."""
+
+    def setUp(self):
+        """Set up a client and a small mixed-quality extract."""
+        self.client = DataGovClient()
+        self.records = [
+            {'date': '2024-01-01', 'production_value': '100.5', 'price': '50', 'region': 'North'},
+            {'date': '2024-01-02', 'production_value': 'n/a', 'price': 70},
+            {'date': '2024-01-03', 'region': 'South'},
+        ]
+
+    def test_bad_values_become_nan(self):
+        """Unparseable numbers become NaN instead of falling back to mock data."""
+        with patch('data.api_client.st'):
+            result = self.client.process_data({'records': self.records})
+        production = result['production']
+        self.assertEqual(list(production['date']), ['2024-01-01', '2024-01-02'])
+        self.assertEqual(production['value'].dtype, 'float64')
+        self.assertTrue(production['value'].isna().iloc[1])
+        self.assertEqual(result['metrics']['total_production'], 100.5)
+
+    def test_prices_and_metrics(self):
+        """Prices keep only rows with a price and default the region."""
+        result = self.client.process_frame(pd.DataFrame.from_records(self.records))
+        self.assertEqual(list(result['prices']['region']), ['North', 'Unknown'])
+        self.assertEqual(result['metrics']['avg_price'], 60.0)
+
+    def test_missing_columns(self):
+        """Extracts without production or price fields produce empty frames."""
+        result = self.client.process_frame(pd.DataFrame.from_records([{'date': '2024-01-01'}]))
+        self.assertTrue(result['production'].empty)
+        self.assertEqual(result['metrics']['avg_price'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+from datetime import date
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from modules import health
+from modules.disease_store import DiseaseAlertStore
+from modules.health import get_mock_disease_data, DISEASES, REGIONS
+
+class TestMockDiseaseData(unittest.TestCase):
+    """Test cases for the vectorized sample disease alerts."""
+
+    def test_same_seed_same_alerts(self):
+        """Sample alerts do not depend on the process, only on the arguments."""
+        first = pd.DataFrame(get_mock_disease_data(end_date=date(2024, 3, 17))['alerts'])
+        second = pd.DataFrame(get_mock_disease_data(end_date=date(2024, 3, 17))['alerts'])
+        other = pd.DataFrame(get_mock_disease_data(end_date=date(2024, 3, 17), seed=7)['alerts'])
+        pd.testing.assert_frame_equal(first, second)
+        self.assertFalse(first.equals(other))
+
+    def test_columns_and_summary_agree(self):
+        """Columns have one entry per alert and the summary counts them."""
+        data = get_mock_disease_data(days=30, end_date=date(2024, 3, 17))
+        alerts = pd.DataFrame(data['alerts'])
+        self.assertEqual(data['summary']['total_alerts'], len(alerts))
+        self.assertEqual(data['summary']['high_risk'], int((alerts['risk_level'] == 'High').sum()))
+        self.assertEqual(data['summary']['active_cases'], int((alerts['status'] == 'Active').sum()))
+        self.assertTrue(set(alerts['disease']) <= set(DISEASES))
+        self.assertTrue(set(alerts['region']) <= set(REGIONS))
+        self.assertEqual(alerts['date'].max(), pd.Timestamp('2024-03-17'))
+        self.assertTrue(alerts['date'].is_monotonic_decreasing)
+        self.assertFalse(alerts.duplicated(['date', 'disease', 'region']).any())
+
+    def test_risk_level_shared_by_regions_on_a_day(self):
+        """Every region sees the same risk level for a disease on a given day."""
+        alerts = pd.DataFrame(get_mock_disease_data(days=60)['alerts'])
+        levels = alerts.groupby(['date', 'disease'], observed=True)['risk_level'].nunique()
+        self.assertTrue((levels == 1).all())
+
+    def test_days_do_not_depend_on_end_date(self):
+        """A day has the same alerts whichever end_date and days cover it."""
+        today = pd.DataFrame(get_mock_disease_data(days=30, end_date=date(2024, 3, 17))['alerts'])
+        tomorrow = pd.DataFrame(get_mock_disease_data(days=30, end_date=date(2024, 3, 18))['alerts'])
+        overlap = tomorrow[tomorrow['date'] <= np.datetime64('2024-03-17')].reset_index(drop=True)
+        pd.testing.assert_frame_equal(overlap, today[today['date'] >= np.datetime64('2024-02-18')].reset_index(drop=True))
+
+    def test_scales_to_years_and_districts(self):
+        """Three years across 700 districts stay columnar and complete."""
+        regions = [f"District {i}" for i in range(700)]
+        data = get_mock_disease_data(days=3 * 365, regions=regions)
+        self.assertGreater(data['summary']['total_alerts'], 1_000_000)
+        self.assertIsInstance(data['alerts']['region'], pd.Categorical)
+        self.assertEqual(data['alerts']['affected_farms'].dtype.kind, 'i')
+        self.assertTrue(np.all(data['alerts']['affected_farms'] < 50))
+
+class TestLoadDiseaseStore(unittest.TestCase):
+    """Test cases for keeping the shared alert store current."""
+
+    def setUp(self):
+        """Give each test an empty store and no previous fetch."""
+        for name, value in (('disease_store', DiseaseAlertStore()), ('_disease_store_fetched_at', None)):
+            patcher = patch.object(health, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.now = 1000.0
+        clock = patch('modules.health.time.monotonic', side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_new_days_are_added_after_the_interval(self):
+        """Reruns within the interval reuse the store; a later fetch adds only the new day."""
+        week = pd.DataFrame(get_mock_disease_data(days=7, end_date=date(2024, 3, 17))['alerts'])
+        new_day = pd.DataFrame(get_mock_disease_data(days=1, end_date=date(2024, 3, 18))['alerts'])
+        feeds = [{'alerts': week}, {'alerts': pd.concat([new_day, week])}]
+        with patch.object(health, 'get_disease_data', side_effect=feeds) as fetch:
+            store = health.load_disease_store()
+            first = len(store)
+            self.now += health.DISEASE_REFRESH_INTERVAL - 1
+            health.load_disease_store()
+            self.assertEqual(fetch.call_count, 1)
+            self.now += 1
+            health.load_disease_store()
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(store.latest_date(), np.datetime64('2024-03-18'))
+        self.assertEqual(first, len(week))
+        self.assertEqual(len(store), len(week) + len(new_day))
+
+    def test_refresh_across_midnight_adds_only_the_new_day(self):
+        """Sample data regenerated after the date changes adds no late alerts for earlier days."""
+        feeds = [get_mock_disease_data(days=30, end_date=date(2024, 3, 17)),
+                 get_mock_disease_data(days=30, end_date=date(2024, 3, 18))]
+        new_day = pd.DataFrame(get_mock_disease_data(days=1, end_date=date(2024, 3, 18))['alerts'])
+        with patch.object(health, 'get_disease_data', side_effect=feeds):
+            store = health.load_disease_store()
+            first = len(store)
+            self.now += health.DISEASE_REFRESH_INTERVAL
+            health.load_disease_store()
+        self.assertEqual(len(store), first + len(new_day))
+        yesterday = pd.DataFrame(feeds[0]['alerts'])
+        self.assertEqual(len(store.frame(start='2024-03-17', end='2024-03-17')),
+                         int((yesterday['date'] == np.datetime64('2024-03-17')).sum()))
+
+    def test_alert_list_covers_the_last_days(self):
+        """The Current Alerts list stops ALERT_LIST_DAYS before the newest stored day."""
+        health.disease_store.append(get_mock_disease_data(days=30, end_date=date(2024, 3, 17))['alerts'])
+        alerts = health.recent_alerts(health.disease_store, 'North')
+        self.assertEqual(alerts[0]['date'], '2024-03-17')
+        self.assertEqual(min(alert['date'] for alert in alerts), '2024-03-11')
+        self.assertEqual({alert['region'] for alert in alerts}, {'North'})
+        self.assertEqual(health.recent_alerts(DiseaseAlertStore()), [])
+
+    def test_empty_fetch_is_not_repeated_on_every_rerun(self):
+        """A first fetch without alerts still counts as loaded until the interval passes."""
+        empty = {'alerts': [], 'summary': {}}
+        with patch.object(health, 'get_disease_data', return_value=empty) as fetch:
+            health.load_disease_store()
+            health.load_disease_store()
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(len(health.disease_store), 0)
+
+if __name__ == '__main__':
+    unittest.main()
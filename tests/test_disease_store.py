@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+from datetime import date
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from modules.disease_store import DiseaseAlertStore
+from modules.health import get_mock_disease_data, RISK_LEVELS
+
+def alert(day, region='North', disease='Coccidiosis', risk_level='Low', status='Monitoring', affected_farms=1):
+    return {'date': day, 'region': region, 'disease': disease, 'risk_level': risk_level,
+            'status': status, 'affected_farms': affected_farms}
+
+class TestDiseaseAlertStore(unittest.TestCase):
+    """Test cases for the indexed disease alert store."""
+
+    def setUp(self):
+        """Set up a store holding the sample alerts."""
+        self.data = get_mock_disease_data(end_date=date(2024, 3, 17))
+        self.store = DiseaseAlertStore(categories={'risk_level': RISK_LEVELS})
+        self.store.append(self.data['alerts'])
+        self.alerts = pd.DataFrame(self.data['alerts'])
+
+    def test_summary_matches_alerts(self):
+        """Counts kept while appending match counting the alerts, overall and per region."""
+        self.assertEqual(self.store.summary(), self.data['summary'])
+        north = self.alerts[self.alerts['region'] == 'North']
+        self.assertEqual(self.store.summary('North'), {
+            'total_alerts': len(north),
+            'high_risk': int((north['risk_level'] == 'High').sum()),
+            'active_cases': int((north['status'] == 'Active').sum()),
+        })
+        self.assertEqual(self.store.summary('Nowhere')['total_alerts'], 0)
+
+    def test_region_and_date_filters(self):
+        """Index lookups return the same alerts as boolean masks would."""
+        frame = self.store.frame(region='East', disease='Salmonella', start='2024-03-10', end='2024-03-15')
+        mask = ((self.alerts['region'] == 'East') & (self.alerts['disease'] == 'Salmonella') &
+                (self.alerts['date'] >= '2024-03-10') & (self.alerts['date'] <= '2024-03-15'))
+        self.assertEqual(len(frame), int(mask.sum()))
+        self.assertTrue(frame['date'].is_monotonic_increasing)
+        self.assertEqual(set(frame['region']), {'East'})
+        self.assertEqual(frame['region'].dtype, 'category')
+
+    def test_newest_first_orders_by_risk_within_a_day(self):
+        """Reversed store order puts the newest day and its highest risk first."""
+        frame = self.store.frame(newest_first=True)
+        self.assertEqual(frame['date'].iloc[0], pd.Timestamp('2024-03-17'))
+        day = frame[frame['date'] == frame['date'].iloc[0]]
+        self.assertTrue(day['risk_level'].cat.codes.is_monotonic_decreasing)
+
+    def test_appends_update_version_and_order(self):
+        """Late alerts are merged into date order and new names become categories."""
+        version = self.store.version
+        self.store.append([alert('2024-01-01', region='Highlands', risk_level='High', status='Active')])
+        self.assertEqual(self.store.version, version + 1)
+        self.assertEqual(self.store.frame()['date'].iloc[0], pd.Timestamp('2024-01-01'))
+        self.assertEqual(self.store.summary('Highlands'), {'total_alerts': 1, 'high_risk': 1, 'active_cases': 1})
+        self.assertEqual(len(self.store.rows(region='Highlands')), 1)
+        self.assertEqual(self.store.append([]), 0)
+        self.assertEqual(self.store.version, version + 1)
+
+class TestAlertCube(unittest.TestCase):
+    """Test cases for the region x disease x day cube."""
+
+    def test_totals_match_pivot_table(self):
+        """Cube totals over a window equal pivoting the alerts in it."""
+        data = get_mock_disease_data(end_date=date(2024, 3, 17))
+        store = DiseaseAlertStore()
+        store.append(data['alerts'])
+        alerts = pd.DataFrame(data['alerts'])
+        recent = alerts[alerts['date'] >= '2024-03-11']
+        expected = pd.pivot_table(recent, values='affected_farms', index='region', columns='disease',
+                                  aggfunc='sum', fill_value=0, observed=False)
+        totals = store.totals(start='2024-03-11')
+        self.assertTrue((totals.loc[expected.index, expected.columns].to_numpy() == expected.to_numpy()).all())
+        self.assertEqual(int(store.totals('alerts').to_numpy().sum()), len(alerts))
+
+    def test_cube_grows_in_both_directions(self):
+        """Alerts before the first day or after the last extend the cube without losing totals."""
+        store = DiseaseAlertStore()
+        store.append([alert('2024-03-10', affected_farms=2)])
+        store.append([alert('2024-05-30', region='South', affected_farms=3)])
+        store.append([alert('2023-12-25', disease='Salmonella', affected_farms=4)])
+        self.assertEqual(int(store.totals().to_numpy().sum()), 9)
+        self.assertEqual(store.totals().loc['North', 'Salmonella'], 4)
+        self.assertEqual(int(store.totals(start='2024-01-01', end='2024-03-31').to_numpy().sum()), 2)
+        self.assertEqual(int(store.totals(start='2025-01-01').to_numpy().sum()), 0)
+
+class TestRegionInsights(unittest.TestCase):
+    """Test cases for the per-region insights read from the cube."""
+
+    def test_matches_per_region_slices(self):
+        """Counts, modes and means agree with filtering each region separately."""
+        data = get_mock_disease_data(end_date=date(2024, 3, 17))
+        store = DiseaseAlertStore()
+        store.append(data['alerts'])
+        alerts = pd.DataFrame(data['alerts'])
+        insights = store.region_insights()
+        for region, region_data in alerts.groupby('region', observed=True):
+            self.assertEqual(insights.loc[region, 'total_alerts'], len(region_data))
+            counts = region_data['disease'].value_counts()
+            self.assertEqual(counts[insights.loc[region, 'most_common_disease']], counts.max())
+            self.assertAlmostEqual(insights.loc[region, 'average_affected_farms'], region_data['affected_farms'].mean())
+
+    def test_regions_without_alerts_are_left_out(self):
+        """Known regions with no alerts do not get an insight row."""
+        store = DiseaseAlertStore(categories={'region': ['North', 'South']})
+        self.assertTrue(store.region_insights().empty)
+        store.append([alert('2024-03-10', affected_farms=4), alert('2024-03-11', affected_farms=2)])
+        insights = store.region_insights()
+        self.assertEqual(list(insights.index), ['North'])
+        self.assertEqual(insights.loc['North', 'average_affected_farms'], 3.0)
+
+class TestIncrementalAppend(unittest.TestCase):
+    """Test cases for adding only new alerts from a repeating feed."""
+
+    def test_repeated_feed_adds_only_new_alerts(self):
+        """Older days are skipped, the newest day keeps late alerts, and later days are added."""
+        store = DiseaseAlertStore()
+        first = [alert('2024-03-10'), alert('2024-03-11'), alert('2024-03-11', region='South')]
+        self.assertEqual(store.append_new(first), 3)
+        second = first + [alert('2024-03-11', region='South'), alert('2024-03-11', region='East'),
+                          alert('2024-03-12')]
+        self.assertEqual(store.append_new(second), 3)
+        self.assertEqual(store.append_new(second), 0)
+        self.assertEqual(len(store), 6)
+        self.assertEqual(store.latest_date(), np.datetime64('2024-03-12'))
+        self.assertEqual(len(store.frame(region='South')), 2)
+
+if __name__ == '__main__':
+    unittest.main()
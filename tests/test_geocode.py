@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest
+from modules.geocode import GEOCODE_URL, GeocodeIndex, normalize_name
+from modules import geocode
+
+def geocode_answer(*results):
+    """Build a geocoding API response returning the given results."""
+    response = MagicMock()
+    response.json.return_value = list(results)
+    return response
+
+class TestGeocodeIndex(unittest.TestCase):
+    """Test cases for the persistent geocode index."""
+
+    def setUp(self):
+        """Set up an index backed by a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "geocode.json"
+        self.index = GeocodeIndex(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_normalize_name(self):
+        """Names differing only in case, accents and spacing normalize equally."""
+        self.assertEqual(normalize_name("  São   Paulo ,BR "), "sao paulo, br")
+
+    def test_prefix_search(self):
+        """Prefix lookup matches seeded locations case-insensitively."""
+        self.assertEqual([m['name'] for m in self.index.prefix_search("ce")], ["Cebu"])
+
+    @patch('modules.geocode.http_client.get')
+    def test_resolve_uses_index_before_api(self, mock_get):
+        """Known locations resolve without a network call."""
+        self.assertEqual(self.index.resolve("manila", "key")['lat'], 14.5995)
+        mock_get.assert_not_called()
+
+    @patch('modules.geocode.http_client.get')
+    def test_lookups_are_persisted(self, mock_get):
+        """A resolved location is available to a new index without the API."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{'name': 'Pune', 'lat': 18.52, 'lon': 73.85, 'country': 'IN'}]
+        mock_get.return_value = mock_response
+
+        self.index.resolve("pune", "key")
+        reloaded = GeocodeIndex(self.path)
+        self.assertEqual(reloaded.get("PUNE")['lon'], 73.85)
+        mock_get.assert_called_once()
+
+    @patch('modules.geocode.http_client.get')
+    def test_only_canonical_names_are_stored(self, mock_get):
+        """A partial query resolves to the API's canonical name and is not stored itself."""
+        mock_get.return_value = geocode_answer({'name': 'Pune', 'lat': 18.52, 'lon': 73.85, 'country': 'IN'})
+        self.assertEqual(self.index.resolve("pun", "key")['name'], "Pune")
+        self.assertIsNone(self.index.get("pun"))
+        self.assertEqual(GeocodeIndex(self.path).names(), ["Cebu", "Davao", "Manila", "Pune"])
+        self.assertEqual(self.index.resolve("pun", "key")['name'], "Pune")
+        mock_get.assert_called_once()
+
+    @patch('modules.geocode.http_client.get')
+    def test_short_and_unknown_names_are_not_resent(self, mock_get):
+        """Names below the minimum length are never sent; misses are cached until the TTL passes."""
+        mock_get.return_value = geocode_answer()
+        self.assertIsNone(self.index.resolve("ab", "key"))
+        mock_get.assert_not_called()
+        self.assertIsNone(self.index.resolve("Atlantis", "key"))
+        self.assertIsNone(self.index.resolve("atlantis ", "key"))
+        self.assertEqual(mock_get.call_count, 1)
+        with patch('modules.geocode.time.monotonic', return_value=geocode.time.monotonic() + geocode.LOOKUP_TTL):
+            self.index.resolve("Atlantis", "key")
+        self.assertEqual(mock_get.call_count, 2)
+
+class TestLocationSearch(unittest.TestCase):
+    """Test cases for the weather page's location search."""
+
+    def test_api_is_only_called_on_submit(self):
+        """Typing an unknown name makes no API call until Search online is clicked."""
+        def script():
+            from modules.weather import show_weather_module
+            show_weather_module()
+
+        def fake_get(url, params=None, **kwargs):
+            if url == GEOCODE_URL:
+                return geocode_answer({'name': 'Iloilo City', 'lat': 10.72, 'lon': 122.56, 'country': 'PH'})
+            return geocode_answer()
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(geocode.geocode_index, 'path', Path(tmp) / "geocode.json"), \
+                patch.object(geocode.geocode_index, '_entries', dict(geocode.geocode_index._entries)), \
+                patch.object(geocode.geocode_index, '_keys', list(geocode.geocode_index._keys)), \
+                patch('modules.geocode.http_client.get', side_effect=fake_get) as mock_get:
+            at = AppTest.from_function(script)
+            at.secrets["openweather_api_key"] = "key"
+            at.run()
+            at.text_input(key="weather_location_query").input("Iloilo").run()
+            self.assertFalse(any(call.args[0] == GEOCODE_URL for call in mock_get.call_args_list))
+            at.button(key="weather_location_lookup").click().run()
+            self.assertEqual(at.selectbox(key="weather_location").value, "Iloilo City")
+            self.assertEqual(sum(call.args[0] == GEOCODE_URL for call in mock_get.call_args_list), 1)
+            self.assertIsNone(geocode.geocode_index.get("Iloilo"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+import requests
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.http_client import HTTPClient, DEFAULT_TIMEOUT
+
+class TestHTTPClient(unittest.TestCase):
+    """Test cases for the shared HTTP transport."""
+
+    def setUp(self):
+        """Set up a fresh client for each test."""
+        self.client = HTTPClient(max_concurrency=1)
+        self.url = "https://api.openweathermap.org/data/2.5/weather"
+
+    def test_default_timeout_applied(self):
+        """Requests without a timeout use the client default."""
+        with patch.object(self.client.session, 'request', return_value=MagicMock()) as mock_request:
+            self.client.get(self.url, params={'q': 'Manila'})
+        mock_request.assert_called_once_with('GET', self.url, params={'q': 'Manila'}, timeout=DEFAULT_TIMEOUT)
+
+    def test_explicit_timeout_kept(self):
+        """An explicit timeout overrides the default."""
+        with patch.object(self.client.session, 'request', return_value=MagicMock()) as mock_request:
+            self.client.get(self.url, timeout=2)
+        self.assertEqual(mock_request.call_args.kwargs['timeout'], 2)
+
+    def test_concurrency_limit_per_host(self):
+        """A saturated host raises a timeout instead of queueing forever."""
+        limit = self.client._limit_for("api.openweathermap.org")
+        limit.acquire()
+        try:
+            with self.assertRaises(requests.exceptions.ConnectTimeout):
+                self.client.get(self.url, timeout=0.01)
+        finally:
+            limit.release()
+
+    def test_limits_are_per_host(self):
+        """Each upstream host gets its own limiter."""
+        self.assertIsNot(self.client._limit_for("a.example"), self.client._limit_for("b.example"))
+
+if __name__ == '__main__':
+    unittest.main()
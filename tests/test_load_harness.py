@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from streamlit.testing.v1 import AppTest
+from modules import telemetry
+from modules.ops_server import ops_server
+from tests import load_harness
+from tests.load_harness import RewritingAdapter, StandInUpstream, side_services_disabled, summarize
+
+class TestStandInUpstream(unittest.TestCase):
+    """Test cases for routing upstream calls to the stand-in server."""
+
+    def setUp(self):
+        self.upstream = StandInUpstream(latency=0)
+        self.base_url = self.upstream.start()
+
+    def tearDown(self):
+        self.upstream.stop()
+
+    def test_requests_are_rewritten_and_answered_per_host(self):
+        """Path and query are kept and the original host picks the canned payload."""
+        session = requests.Session()
+        session.mount("https://", RewritingAdapter(self.base_url))
+        response = session.get("https://newsapi.org/v2/everything?q=poultry", timeout=5)
+        self.assertEqual(response.json()['status'], 'ok')
+        self.assertEqual(self.upstream.requests, 1)
+
+class TestSessions(unittest.TestCase):
+    """Test cases for driving simulated sessions."""
+
+    def test_rendered_errors_are_counted(self):
+        """Failures main() catches and shows with st.error count as errors."""
+        def script():
+            import streamlit as st
+            st.error("Unable to load page")
+
+        latencies, errors = [], []
+        with patch.object(load_harness.AppTest, 'from_file', return_value=AppTest.from_function(script)):
+            load_harness.run_session(["Weather"], 1, {}, latencies, errors)
+        self.assertEqual(len(latencies), 1)
+        self.assertEqual(errors, ["Weather: Unable to load page"])
+
+    def test_side_services_are_not_started(self):
+        """Workers neither bind the ops port nor start telemetry listeners."""
+        with side_services_disabled():
+            from modules.telemetry import start_listeners
+            self.assertFalse(ops_server.start())
+            start_listeners()
+        self.assertFalse(ops_server.running)
+        self.assertEqual(telemetry._listeners, [])
+
+class TestSummary(unittest.TestCase):
+    """Test cases for the load report."""
+
+    def test_percentiles_and_throughput(self):
+        """Latencies are reported in milliseconds and peak RSS per session and in total."""
+        report = summarize([0.1] * 99 + [1.0], 10.0, [], 42, [100.0, 120.0])
+        self.assertEqual(report['reruns'], 100)
+        self.assertEqual(report['p50_ms'], 100.0)
+        self.assertEqual(report['max_ms'], 1000.0)
+        self.assertEqual(report['throughput_rps'], 10.0)
+        self.assertEqual(report['peak_rss_mb_per_session'], 120.0)
+        self.assertEqual(report['peak_rss_mb_total'], 220.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+import threading
+import urllib.request
+import urllib.error
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.metrics import MetricsRegistry, Histogram
+from modules.ops_server import OpsServer
+from modules.pipeline import Deadline, fetch_concurrently
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for section timing and the Prometheus endpoint."""
+
+    def setUp(self):
+        """Create an empty registry."""
+        self.registry = MetricsRegistry(buckets=(0.1, 1.0))
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Bucket counts include every smaller observation."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative(), [("0.1", 2), ("1.0", 3), ("+Inf", 4)])
+        self.assertAlmostEqual(histogram.sum, 2.65)
+
+    def test_section_counts_calls_made_inside_it(self):
+        """Upstream calls and cache lookups count against every active section."""
+        with self.registry.section("page"):
+            self.registry.record_cache(hit=True)
+            with self.registry.section("card"):
+                self.registry.record_upstream_call("api.example.com")
+                self.registry.record_cache(hit=False)
+        self.registry.record_upstream_call("api.example.com")
+
+        text = self.registry.render()
+        self.assertIn('poultry_section_upstream_calls_total{section="page"} 1', text)
+        self.assertIn('poultry_section_upstream_calls_total{section="card"} 1', text)
+        self.assertIn('poultry_section_cache_hits_total{section="page"} 1', text)
+        self.assertIn('poultry_section_cache_hits_total{section="card"} 0', text)
+        self.assertIn('poultry_section_cache_misses_total{section="card"} 1', text)
+        self.assertIn('poultry_upstream_requests_total{host="api.example.com"} 2', text)
+        self.assertIn('poultry_section_duration_seconds_count{section="page"} 1', text)
+
+    def test_decorator_is_safe_across_threads(self):
+        """A decorated function records one observation per call from any thread."""
+        @self.registry.section("worker")
+        def work():
+            self.registry.record_upstream_call("a")
+
+        threads = [threading.Thread(target=work) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        text = self.registry.render()
+        self.assertIn('poultry_section_duration_seconds_count{section="worker"} 20', text)
+        self.assertIn('poultry_section_upstream_calls_total{section="worker"} 20', text)
+
+    def test_concurrent_fetches_are_attributed_to_the_caller(self):
+        """Tasks of a fetch stage count against the section that started it."""
+        tasks = {name: (lambda: self.registry.record_upstream_call("a")) for name in ("x", "y")}
+        with self.registry.section("forecast"):
+            fetch_concurrently(tasks, Deadline(5))
+        self.assertIn('poultry_section_upstream_calls_total{section="forecast"} 2', self.registry.render())
+
+    def test_metrics_endpoint(self):
+        """The side server serves registered routes and 404s the rest."""
+        server = OpsServer(host="127.0.0.1", port=0)
+        server.route("/metrics", lambda: (200, "text/plain", self.registry.render().encode()))
+        self.assertTrue(server.start())
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                self.assertEqual(response.status, 200)
+                self.assertIn(b"# TYPE poultry_section_duration_seconds histogram", response.read())
+            with self.assertRaises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"http://127.0.0.1:{server.port}/missing", timeout=5)
+            self.assertEqual(error.exception.code, 404)
+        finally:
+            server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import json
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from modules import ops_server
+from modules.http_client import HTTPClient
+
+class TestProbes(unittest.TestCase):
+    """Test cases for the liveness and readiness endpoints."""
+
+    def test_telemetry_push_needs_a_token(self):
+        """Without TELEMETRY_TOKEN the public ops port accepts no pushed telemetry."""
+        if not os.environ.get("TELEMETRY_TOKEN"):
+            self.assertNotIn("/telemetry", ops_server.ops_server.post_routes)
+        with self.assertRaises(ValueError):
+            ops_server.OpsServer().route_post("/telemetry", lambda body: (202, "text/plain", b""), token="")
+
+    def test_taken_port_is_tried_once(self):
+        """A failed bind is logged once and not retried on every rerun."""
+        first = ops_server.OpsServer(host="127.0.0.1", port=0)
+        self.assertTrue(first.start())
+        self.addCleanup(first.stop)
+        second = ops_server.OpsServer(host="127.0.0.1", port=first.port)
+        with self.assertLogs('modules.ops_server', level='WARNING') as logs:
+            self.assertFalse(second.start())
+            self.assertFalse(second.start())
+        self.assertEqual(len(logs.records), 1)
+
+    def test_livez(self):
+        """Liveness only needs the server thread to answer."""
+        self.assertEqual(ops_server.livez_route()[0], 200)
+
+    @patch('modules.ops_server.streamlit_running', return_value=False)
+    def test_not_ready_before_streamlit_serves(self, _):
+        """Readiness fails until the Streamlit runtime is up."""
+        status, content_type, body = ops_server.readyz_route()
+        self.assertEqual(status, 503)
+        self.assertEqual(content_type, "application/json")
+        self.assertEqual(json.loads(body)['status'], 'starting')
+
+    @patch('modules.ops_server.streamlit_running', return_value=True)
+    @patch('modules.ops_server.breaker_states', return_value={'weather': {'state': 'open', 'failures': 3, 'trips': 1}})
+    @patch('modules.ops_server.http_client')
+    def test_open_breaker_degrades_but_stays_ready(self, mock_client, *_):
+        """Upstream trouble is reported without failing readiness."""
+        mock_client.host_status.return_value = {'newsapi.org': {'reachable': False, 'age': 1.0, 'error': 'ConnectTimeout'}}
+        status, _, body = ops_server.readyz_route()
+        report = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual(report['status'], 'degraded')
+        self.assertEqual(report['degraded'], ['breaker:weather', 'host:newsapi.org'])
+        self.assertIn('cache', report)
+        self.assertIn('snapshots', report)
+
+class TestHostStatus(unittest.TestCase):
+    """Test cases for passive upstream reachability."""
+
+    def test_outcomes_are_recorded_per_host(self):
+        """The last request to each host decides whether it is reachable."""
+        client = HTTPClient()
+        client.session = MagicMock()
+        client.get("https://ok.example.com/a")
+        client.session.request.side_effect = requests.exceptions.ConnectionError("refused")
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            client.get("https://down.example.com/b")
+
+        status = client.host_status()
+        self.assertTrue(status['ok.example.com']['reachable'])
+        self.assertFalse(status['down.example.com']['reachable'])
+        self.assertEqual(status['down.example.com']['error'], 'ConnectionError')
+
+if __name__ == '__main__':
+    unittest.main()
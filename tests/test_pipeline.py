@@ -0,0 +1,40 @@
+import unittest
+import sys
+import os
+import time
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.pipeline import Deadline, fetch_concurrently
+
+class TestFetchConcurrently(unittest.TestCase):
+    """Test cases for the concurrent fetch stage."""
+
+    def test_tasks_run_in_parallel(self):
+        """Two slow tasks finish in about one task's time."""
+        start = time.monotonic()
+        results, errors = fetch_concurrently({
+            'current': lambda: time.sleep(0.2) or 'current',
+            'forecast': lambda: time.sleep(0.2) or 'forecast',
+        }, Deadline(2))
+        self.assertLess(time.monotonic() - start, 0.35)
+        self.assertEqual(results, {'current': 'current', 'forecast': 'forecast'})
+        self.assertEqual(errors, {})
+
+    def test_failures_and_deadline(self):
+        """Failed and late tasks are reported as errors."""
+        def fail():
+            raise ValueError("boom")
+
+        results, errors = fetch_concurrently({
+            'ok': lambda: 1,
+            'failed': fail,
+            'late': lambda: time.sleep(0.5),
+        }, Deadline(0.1))
+        self.assertEqual(results, {'ok': 1})
+        self.assertIsInstance(errors['failed'], ValueError)
+        self.assertIsInstance(errors['late'], TimeoutError)
+
+if __name__ == '__main__':
+    unittest.main()
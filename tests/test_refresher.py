@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import threading
+import time
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.refresher import BackgroundRefresher
+
+class TestBackgroundRefresher(unittest.TestCase):
+    """Test cases for the stale-while-revalidate refresher."""
+
+    def setUp(self):
+        """Set up a refresher with one registered source."""
+        self.refresher = BackgroundRefresher()
+        self.loader = MagicMock(return_value={'temp': 25})
+        self.refresher.register('weather', self.loader, soft_ttl=60, hard_ttl=300)
+
+    def test_first_read_loads_synchronously(self):
+        """The first read waits for the loader."""
+        snapshot = self.refresher.get('weather')
+        self.assertEqual(snapshot.value, {'temp': 25})
+        self.assertFalse(snapshot.stale)
+
+    def test_old_snapshot_served_while_refreshing(self):
+        """A snapshot past its soft TTL is returned immediately and refreshed in the background."""
+        self.refresher.get('weather')
+        self.loader.return_value = {'temp': 30}
+        with patch('modules.refresher.time.time', return_value=time.time() + 120):
+            snapshot = self.refresher.get('weather')
+        self.assertEqual(snapshot.value, {'temp': 25})
+        self.refresher._executor.shutdown(wait=True)
+        self.assertEqual(self.refresher.get('weather').value, {'temp': 30})
+
+    def test_failed_refresh_keeps_last_good_snapshot(self):
+        """Error payloads do not replace the last good snapshot, which eventually turns stale."""
+        self.refresher.get('weather')
+        self.loader.return_value = {'error': 'unavailable'}
+        self.assertFalse(self.refresher.refresh('weather'))
+        with patch('modules.refresher.time.time', return_value=time.time() + 600):
+            self.assertTrue(self.refresher._snapshots['weather'].stale)
+        self.assertEqual(self.refresher._snapshots['weather'].value, {'temp': 25})
+
+    def test_loading_while_first_read_runs(self):
+        """Concurrent readers see the source as loading instead of waiting on it too."""
+        seen = []
+        def loader():
+            seen.append((self.refresher.loading('weather'), self.refresher.get('weather')))
+            return {'temp': 25}
+        self.refresher.register('weather', loader, soft_ttl=60, hard_ttl=300)
+
+        self.refresher.get('weather')
+        self.assertEqual(seen, [(True, None)])
+        self.assertFalse(self.refresher.loading('weather'))
+
+    def test_scheduled_load_counts_as_first_read(self):
+        """A first read after a background load started does not start a second one."""
+        started = threading.Event()
+        release = threading.Event()
+        def loader():
+            started.set()
+            release.wait(5)
+            return {'temp': 25}
+        loader_mock = MagicMock(side_effect=loader)
+        self.refresher.register('weather', loader_mock, soft_ttl=60, hard_ttl=300)
+
+        self.refresher.schedule('weather')
+        started.wait(5)
+        self.assertIsNone(self.refresher.get('weather'))
+        self.assertTrue(self.refresher.loading('weather'))
+        release.set()
+        self.refresher._executor.shutdown(wait=True)
+        self.assertEqual(loader_mock.call_count, 1)
+        self.assertEqual(self.refresher.snapshot('weather').value, {'temp': 25})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.singleflight import SingleFlight
+from modules.cache import ResponseCache
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for request coalescing."""
+
+    def run_concurrently(self, target, count=10):
+        """Start count threads running target and wait for them."""
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_identical_calls_share_one_upstream_call(self):
+        """Concurrent misses on the same request hit upstream once."""
+        cache = ResponseCache()
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'articles': []}
+
+        self.run_concurrently(lambda: results.append(
+            cache.get_or_fetch('news', 'https://newsapi.org/v2/everything', {'q': 'poultry'}, fetch)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'articles': []}] * 10)
+
+    def test_errors_are_shared(self):
+        """Waiters receive the leader's exception."""
+        flight = SingleFlight()
+        errors = []
+
+        def fail():
+            time.sleep(0.1)
+            raise ConnectionError("upstream down")
+
+        def call():
+            try:
+                flight.do('news', fail)
+            except ConnectionError as e:
+                errors.append(e)
+
+        self.run_concurrently(call, count=5)
+        self.assertEqual(len(errors), 5)
+        self.assertEqual(flight.shared, 4)
+
+if __name__ == '__main__':
+    unittest.main()
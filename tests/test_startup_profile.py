@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import startup_profile
+from modules.startup_profile import lazy_import, lazy_import_times, format_report
+
+class TestStartupProfile(unittest.TestCase):
+    """Test cases for lazy imports and the import-time report."""
+
+    def test_lazy_import_records_first_import_only(self):
+        """A module is timed when first imported and reused afterwards."""
+        sys.modules.pop("colorsys", None)
+        startup_profile._import_times.pop("colorsys", None)
+
+        module = lazy_import("colorsys")
+        self.assertIn("colorsys", lazy_import_times())
+        self.assertIs(lazy_import("colorsys"), module)
+
+    def test_lazy_import_skips_loaded_modules(self):
+        """Already imported modules are returned without being timed."""
+        startup_profile._import_times.pop("json", None)
+        import json
+        self.assertIs(lazy_import("json"), json)
+        self.assertNotIn("json", lazy_import_times())
+
+    def test_package_loads_feature_modules_on_access(self):
+        """Feature modules are exposed lazily by the modules package."""
+        import modules
+        self.assertIs(modules.news, sys.modules["modules.news"])
+        with self.assertRaises(AttributeError):
+            modules.missing
+
+    def test_format_report(self):
+        """The report lists each module with its share of the total."""
+        report = format_report([("plotly", 0.3), ("pandas", 0.1)])
+        lines = report.splitlines()
+        self.assertIn("plotly", lines[1])
+        self.assertIn("75.0%", lines[1])
+        self.assertTrue(lines[-1].startswith("total"))
+        self.assertIn("400", lines[-1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.store import StatisticsStore
+from data.api_client import DataGovClient
+
+class TestStatisticsStore(unittest.TestCase):
+    """Test cases for the local data.gov.in statistics store."""
+
+    def setUp(self):
+        """Set up a store backed by a temporary database."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = StatisticsStore(Path(self.tmp.name) / "statistics.db")
+        self.frame = pd.DataFrame.from_records([
+            {'date': '2024-01-01', 'region': 'North', 'production_value': '100', 'price': '50'},
+            {'date': '2024-01-02', 'region': 'South', 'production_value': 'bad', 'price': 70},
+            {'date': 'not a date', 'region': 'East', 'production_value': 5},
+        ])
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_append_and_query(self):
+        """Valid rows are stored once and can be filtered by region."""
+        self.assertEqual(self.store.append(self.frame), 2)
+        self.assertEqual(self.store.append(self.frame), 0)
+        self.assertEqual(self.store.watermark(), '2024-01-02')
+        north = self.store.query(region='North')
+        self.assertEqual(north['production_value'].tolist(), [100.0])
+        self.assertTrue(self.store.query(start='2024-01-02')['production_value'].isna().all())
+
+    def test_same_date_and_region_are_distinct_records(self):
+        """Records sharing a date and region are kept; only re-deliveries are ignored."""
+        frame = pd.DataFrame.from_records([
+            {'date': '2024-01-01', 'region': 'North', 'production_value': 100},
+            {'date': '2024-01-01', 'region': 'North', 'production_value': 40},
+        ])
+        self.assertEqual(self.store.append(frame), 2)
+        self.assertEqual(self.store.append(frame), 0)
+        with_ids = pd.DataFrame.from_records([
+            {'id': 1, 'date': '2024-01-03', 'region': 'North', 'production_value': 7},
+            {'id': 2, 'date': '2024-01-03', 'region': 'North', 'production_value': 7},
+        ])
+        self.assertEqual(self.store.append(with_ids), 2)
+        self.assertEqual(self.store.append(with_ids.iloc[:1]), 0)
+
+    def test_sync_uses_recorded_watermark(self):
+        """A sync keeps records from the last synced date onward, including late ones for that date."""
+        client = DataGovClient()
+        client.resource_id = "resource"
+        first = pd.DataFrame.from_records([
+            {'date': '2024-01-01', 'region': 'North', 'price': 1},
+        ])
+        with patch.object(DataGovClient, 'iter_frames', return_value=iter([first])):
+            self.assertEqual(self.store.sync(client), 1)
+        self.assertEqual(self.store.synced_watermark("resource"), '2024-01-01')
+
+        later = pd.DataFrame.from_records([
+            {'date': '2023-12-31', 'region': 'West', 'price': 1},
+            {'date': '2024-01-01', 'region': 'North', 'price': 1},
+            {'date': '2024-01-01', 'region': 'South', 'price': 3},
+            {'date': '2024-02-01', 'region': 'West', 'price': 2},
+        ])
+        with patch.object(DataGovClient, 'iter_frames', return_value=iter([later])):
+            self.assertEqual(self.store.sync(client), 2)
+        self.assertEqual(self.store.synced_watermark("resource"), '2024-02-01')
+        self.assertEqual(self.store.query(region='West')['date'].tolist(), ['2024-02-01'])
+
+    def test_aggregate_in_sql(self):
+        """Daily production, regional prices and metrics come back aggregated."""
+        self.store.append(self.frame)
+        self.store.append(pd.DataFrame.from_records([
+            {'date': '2024-01-01', 'region': 'South', 'production_value': 25, 'price': 90},
+        ]))
+        aggregated = self.store.aggregate()
+        self.assertEqual(aggregated['production'].to_dict('list'),
+                         {'date': ['2024-01-01'], 'value': [125.0]})
+        self.assertEqual(aggregated['prices'].set_index('region')['price'].to_dict(),
+                         {'North': 50.0, 'South': 80.0})
+        self.assertEqual(aggregated['metrics']['total_production'], 125.0)
+        self.assertEqual(aggregated['metrics']['avg_price'], 70.0)
+        self.assertIsNone(self.store.aggregate(region='East'))
+
+    def test_reads_do_not_create_file(self):
+        """Building and reading an empty store leaves the filesystem untouched."""
+        path = Path(self.tmp.name) / "unused" / "statistics.db"
+        store = StatisticsStore(path)
+        self.assertIsNone(store.aggregate())
+        self.assertEqual(store.count(), 0)
+        self.assertTrue(store.query().empty)
+        self.assertFalse(path.exists())
+        self.assertFalse(path.parent.exists())
+
+    def test_process_frame_reads_store(self):
+        """Stored records feed the columnar processing unchanged."""
+        self.store.append(self.frame)
+        processed = DataGovClient().process_frame(self.store.query())
+        self.assertEqual(processed['metrics']['total_production'], 100.0)
+        self.assertEqual(processed['metrics']['avg_price'], 60.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+import re
+import tempfile
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest
+from modules.styles import CSS_DIR, minify_css, build_stylesheet, source_files
+
+class TestStyles(unittest.TestCase):
+    """Test cases for the stylesheet build step and injection."""
+
+    def setUp(self):
+        """Create a source and a dist directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.css_dir = Path(self.tmp.name) / "css"
+        self.dist_dir = Path(self.tmp.name) / "dist"
+        self.css_dir.mkdir()
+        (self.css_dir / "news.css").write_text(".news-card {\n    color: red;\n}\n")
+        (self.css_dir / "app.css").write_text("/* Global */\n.stApp > * {\n    margin: 0 auto;\n}\n")
+
+    def tearDown(self):
+        """Remove the temporary directories."""
+        self.tmp.cleanup()
+
+    def test_minify_css(self):
+        """Comments and whitespace are dropped, selector spacing is kept."""
+        css = "/* note */\n.a :hover ,\n.b > .c {\n  color : #fff ;\n  margin: 0 1px;\n}\n"
+        self.assertEqual(minify_css(css), ".a :hover,.b>.c{color :#fff;margin:0 1px}")
+
+    def test_bundle_is_fingerprinted_with_app_first(self):
+        """The bundle starts with app.css and is named by its content hash."""
+        fingerprint, css = build_stylesheet(self.css_dir, self.dist_dir)
+        self.assertEqual(css, ".stApp>*{margin:0 auto}.news-card{color:red}")
+        self.assertEqual((self.dist_dir / f"app.{fingerprint}.css").read_text(), css)
+        self.assertEqual(build_stylesheet(self.css_dir, self.dist_dir)[0], fingerprint)
+
+    def test_changed_sources_replace_the_bundle(self):
+        """Editing a stylesheet produces a new bundle and removes the old one."""
+        old, _ = build_stylesheet(self.css_dir, self.dist_dir)
+        (self.css_dir / "news.css").write_text(".news-card { color: blue; }")
+        new, _ = build_stylesheet(self.css_dir, self.dist_dir)
+        self.assertNotEqual(old, new)
+        self.assertEqual([path.name for path in self.dist_dir.iterdir()], [f"app.{new}.css"])
+
+    def test_styles_are_injected_once_per_session(self):
+        """Only the first run of a session sends the stylesheet."""
+        def script():
+            from modules.styles import inject_styles
+            inject_styles("abc123", ".a{color:red}")
+
+        at = AppTest.from_function(script)
+        at.run()
+        self.assertEqual(len(at.get("iframe")), 1)
+        at.run()
+        self.assertEqual(len(at.get("iframe")), 0)
+
+    def test_page_stylesheets_scope_streamlit_widgets(self):
+        """Rules in a page's stylesheet that style Streamlit widgets only apply on that page."""
+        for path in source_files(CSS_DIR):
+            if path.stem == "app":
+                continue
+            for selectors in re.findall(r"([^{}]+)\{", minify_css(path.read_text())):
+                for selector in selectors.split(","):
+                    if re.search(r"\.st[A-Z]", selector):
+                        self.assertIn(":has(", selector, f"{path.name}: {selector}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import json
+import socket
+import tempfile
+import time
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import http.client
+import requests
+from modules import health
+from modules.ops_server import MAX_BODY_BYTES, OpsServer
+from modules.telemetry import FileTail, RingBuffer, TelemetryStore, UdpListener, parse_readings
+from modules import telemetry as telemetry_module
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+class TestRingBuffer(unittest.TestCase):
+    """Test cases for the fixed-size reading buffer."""
+
+    def test_wraps_and_keeps_newest(self):
+        """Once full, the oldest readings are overwritten and windows stay in order."""
+        buffer = RingBuffer(capacity=5)
+        for second in range(8):
+            buffer.append(float(second), second * 10.0)
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.latest(), (7.0, 70.0))
+        times, values = buffer.last(5)
+        self.assertEqual(list(times), [3.0, 4.0, 5.0, 6.0, 7.0])
+        self.assertEqual(list(buffer.since(5.5)[1]), [60.0, 70.0])
+
+class TestTelemetryStore(unittest.TestCase):
+    """Test cases for parsing and storing barn readings."""
+
+    def setUp(self):
+        self.store = TelemetryStore(capacity=100)
+
+    def test_parses_both_payload_shapes(self):
+        """Single-sensor and multi-sensor objects are accepted; unknown sensors are skipped."""
+        readings = parse_readings([
+            {'house': 'H1', 'sensor': 'ammonia', 'value': 12, 'ts': 10},
+            {'house': 'H2', 'ts': 11, 'temperature': 26.5, 'humidity': 'n/a', 'co2': 400},
+        ])
+        self.assertEqual(readings, [('H1', 'ammonia', 10.0, 12.0), ('H2', 'temperature', 11.0, 26.5)])
+
+    def test_invalid_timestamps_skip_only_their_item(self):
+        """Null, object, text and non-finite timestamps drop their item and keep the rest."""
+        readings = parse_readings([
+            {'house': 'H1', 'ts': None, 'temperature': 20},
+            {'house': 'H1', 'ts': {}, 'temperature': 21},
+            {'house': 'H1', 'ts': 'soon', 'temperature': 22},
+            {'house': 'H1', 'ts': 'nan', 'temperature': 23},
+            {'house': 'H1', 'ts': 12, 'temperature': 24},
+        ])
+        self.assertEqual(readings, [('H1', 'temperature', 12.0, 24.0)])
+
+    def test_future_readings_are_rejected(self):
+        """Readings stamped past the clock skew, such as milliseconds, do not block a sensor."""
+        now = 1_700_000_000.0
+        self.store.ingest([('H1', 'humidity', now * 1000, 50.0)], now=now)
+        self.assertIsNone(self.store.latest('H1', 'humidity'))
+        self.store.ingest([('H1', 'humidity', now + 1, 60.0), ('H1', 'humidity', now + 2, 61.0)], now=now)
+        self.assertEqual(self.store.latest('H1', 'humidity'), (now + 2, 61.0))
+        self.assertEqual(self.store.rejected, 1)
+
+    def test_malformed_json_lines_are_counted(self):
+        """Bad lines are skipped and counted; the good lines are stored."""
+        lines = "\n".join([
+            json.dumps({'house': 'H1', 'temperature': 20}),
+            "{not json",
+            json.dumps({'house': 'H2', 'temperature': 21}),
+        ])
+        self.assertEqual(self.store.ingest_json(lines), 2)
+        self.assertEqual(self.store.malformed, 1)
+        with self.assertRaises(ValueError):
+            self.store.ingest_json("{not json\nnor this")
+        self.assertEqual(self.store.malformed, 3)
+
+    def test_new_houses_are_capped(self):
+        """Readings for houses past the cap, or outside the allowed list, create no buffers."""
+        store = TelemetryStore(capacity=10, max_houses=2)
+        store.ingest([(f"H{i}", 'temperature', 1.0, 20.0) for i in range(5)])
+        store.ingest([('H0', 'humidity', 1.0, 60.0)])
+        self.assertEqual(store.houses(), ['H0', 'H1'])
+        self.assertEqual(len(store._buffers), 3)
+        self.assertEqual(store.rejected, 3)
+
+        allowed = TelemetryStore(capacity=10, allowed_houses=['H1'])
+        allowed.ingest([('H1', 'ammonia', 1.0, 9.0), ('intruder', 'ammonia', 1.0, 9.0)])
+        self.assertEqual(allowed.houses(), ['H1'])
+        self.assertEqual(allowed.rejected, 1)
+
+    def test_out_of_order_readings_are_dropped(self):
+        """Older readings than the newest stored one keep buffers in time order."""
+        self.store.ingest([('H1', 'temperature', 10.0, 25.0), ('H1', 'temperature', 9.0, 99.0)])
+        self.assertEqual(self.store.latest('H1', 'temperature'), (10.0, 25.0))
+        self.assertEqual(self.store.rejected, 1)
+
+    def test_windows_and_means(self):
+        """Windows cover the last seconds of a house; means cover every house."""
+        self.store.ingest([('H1', 'temperature', float(t), 20.0 + t) for t in range(60)])
+        self.store.ingest([('H2', 'temperature', 59.0, 30.0)])
+        times, values = self.store.window('H1', 'temperature', 10)
+        self.assertEqual(list(times), [float(t) for t in range(49, 60)])
+        self.assertEqual(self.store.latest_mean('temperature'), (79.0 + 30.0) / 2)
+        self.assertEqual(self.store.houses(), ['H1', 'H2'])
+        self.assertIsNone(self.store.latest_mean('feed_weight'))
+
+class TestIngestion(unittest.TestCase):
+    """Test cases for the HTTP, UDP and file-tail ingestion paths."""
+
+    def setUp(self):
+        self.store = TelemetryStore()
+
+    def test_http_post(self):
+        """Readings POSTed to /telemetry land in the process-wide store."""
+        server = OpsServer(host="127.0.0.1", port=0)
+        server.route_post("/telemetry", telemetry_module.telemetry_route, token="secret")
+        server.start()
+        self.addCleanup(server.stop)
+        url = f"http://127.0.0.1:{server.port}/telemetry"
+
+        auth = {'Authorization': "Bearer secret"}
+        reading = json.dumps({'house': 'HTTP-1', 'ts': time.time(), 'humidity': 61.5})
+        self.assertEqual(requests.post(url, data=reading, timeout=5).status_code, 401)
+        self.assertEqual(requests.post(url, data=reading, headers={'Authorization': "Bearer wrong"}, timeout=5).status_code, 401)
+        response = requests.post(url, data=reading, headers=auth, timeout=5)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json(), {'accepted': 1})
+        self.assertEqual(telemetry_module.telemetry.latest('HTTP-1', 'humidity')[1], 61.5)
+        self.assertEqual(requests.post(url, data=b"{not json", headers=auth, timeout=5).status_code, 400)
+
+    def test_post_is_rejected_before_reading_body(self):
+        """Unknown paths, missing tokens, oversized and invalid lengths are answered without waiting for a body."""
+        server = OpsServer(host="127.0.0.1", port=0)
+        server.route_post("/telemetry", telemetry_module.telemetry_route, token="secret")
+        server.start()
+        self.addCleanup(server.stop)
+        cases = [
+            ("/unknown", "10", "Bearer secret", 404),
+            ("/telemetry", "10", "", 401),
+            ("/telemetry", str(MAX_BODY_BYTES + 1), "Bearer secret", 413),
+            ("/telemetry", "-5", "Bearer secret", 400),
+            ("/telemetry", "ten", "Bearer secret", 400),
+        ]
+        for path, length, authorization, status in cases:
+            connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+            connection.putrequest("POST", path)
+            connection.putheader("Content-Length", length)
+            if authorization:
+                connection.putheader("Authorization", authorization)
+            connection.endheaders()
+            self.assertEqual(connection.getresponse().status, status, (path, length))
+            connection.close()
+
+    def test_udp(self):
+        """Each datagram is decoded and stored."""
+        listener = UdpListener(self.store, host="127.0.0.1")
+        port = listener.start()
+        self.addCleanup(listener.stop)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(json.dumps({'house': 'H7', 'sensor': 'water_flow', 'value': 3.5}).encode(), ("127.0.0.1", port))
+        self.assertTrue(wait_for(lambda: self.store.latest('H7', 'water_flow') is not None))
+
+    def test_file_tail(self):
+        """Lines appended to the followed file are stored, including a line written in two parts."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bridge.jsonl"
+            path.write_text(json.dumps({'house': 'old', 'temperature': 1}) + "\n")
+            tail = FileTail(self.store, path, interval=0.02)
+            tail.start()
+            self.addCleanup(tail.stop)
+            time.sleep(0.1)
+            with path.open('a') as f:
+                f.write('{"house": "H3", "feed_weight"')
+                f.flush()
+                time.sleep(0.1)
+                f.write(': 120.5}\n')
+            self.assertTrue(wait_for(lambda: self.store.latest('H3', 'feed_weight') is not None))
+            self.assertEqual(self.store.houses(), ['H3'])
+            tail.stop()
+
+class TestHealthReadings(unittest.TestCase):
+    """Test cases for showing barn readings on the health pages."""
+
+    def test_feed_and_water_sensors_are_displayed(self):
+        """Live feed weight and water flow replace the sample consumption metrics."""
+        store = TelemetryStore()
+        store.ingest(parse_readings({'house': 'H1', 'feed_weight': 120.5, 'water_flow': 3.25}))
+        mock_st = MagicMock()
+        mock_st.columns.side_effect = lambda n: [MagicMock() for _ in range(n)]
+        with patch.object(health, 'telemetry', store), patch.object(health, 'st', mock_st):
+            health.display_health_summary()
+        labels = {call.args[0]: call.args[1] for call in mock_st.metric.call_args_list}
+        self.assertEqual(labels["Feed in Hoppers"], "120.5 kg")
+        self.assertEqual(labels["Water Flow"], "3.2 L/min")
+        self.assertNotIn("Feed Consumption", labels)
+
+if __name__ == '__main__':
+    unittest.main()
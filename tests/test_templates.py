@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest
+from modules.templates import HtmlTemplate, Markup, safe_url
+
+class TestTemplates(unittest.TestCase):
+    """Test cases for the escaping HTML templates."""
+
+    def test_values_are_escaped(self):
+        """Markup in values is rendered as text."""
+        template = HtmlTemplate("<p title='{title}'>{body}</p>")
+        html = template.render(title="x' onmouseover='alert(1)", body="<script>alert(1)</script>")
+        self.assertEqual(html, "<p title='x&#x27; onmouseover=&#x27;alert(1)'>&lt;script&gt;alert(1)&lt;/script&gt;</p>")
+
+    def test_markup_is_trusted(self):
+        """Markup values are inserted as they are."""
+        template = HtmlTemplate("<div>{body}</div>")
+        self.assertEqual(template.render(body=Markup("<b>ok</b>")), "<div><b>ok</b></div>")
+
+    def test_format_specs_and_line_breaks(self):
+        """Format specs apply before escaping and newlines become line breaks."""
+        template = HtmlTemplate("<p>{value:.1f}</p><p>{text}</p>")
+        self.assertEqual(template.render(value=2.345, text="a\n\nb"), "<p>2.3</p><p>a<br><br>b</p>")
+
+    def test_indentation_is_removed(self):
+        """Compiled templates have no indented or blank lines."""
+        template = HtmlTemplate("""
+            <div>
+
+                <p>{text}</p>
+            </div>
+        """)
+        self.assertEqual(template.render(text="hi"), "<div>\n<p>hi</p>\n</div>")
+
+    def test_render_many(self):
+        """Lists render as one joined string."""
+        template = HtmlTemplate("<li>{name}</li>")
+        self.assertEqual(template.render_many([{"name": "a"}, {"name": "b&c"}], ""), "<li>a</li><li>b&amp;c</li>")
+
+    def test_safe_url(self):
+        """Only web and mail links are kept."""
+        self.assertEqual(safe_url("https://example.com/a?b=1"), "https://example.com/a?b=1")
+        self.assertEqual(safe_url("mailto:vet1@email.com"), "mailto:vet1@email.com")
+        self.assertEqual(safe_url("javascript:alert(1)"), "#")
+        self.assertEqual(safe_url(None), "#")
+
+    def test_news_cards_render_as_one_element(self):
+        """A list of news cards is a single escaped markdown element."""
+        def script():
+            from modules.news import display_news_cards
+            display_news_cards([
+                {"title": "<img src=x onerror=alert(1)>", "url": "javascript:alert(1)"},
+                {"title": "Egg prices", "url": "https://example.com", "publishedAt": "2024-03-01T00:00:00Z"},
+            ])
+
+        at = AppTest.from_function(script)
+        at.run()
+        self.assertEqual(len(at.markdown), 1)
+        body = at.markdown[0].value
+        self.assertIn("&lt;img src=x onerror=alert(1)&gt;", body)
+        self.assertNotIn("javascript:", body)
+        self.assertIn("Published: 2024-03-01", body)
+
+if __name__ == '__main__':
+    unittest.main()